@@ -27,9 +27,27 @@ from pyubx2.exceptions import (
     UBXTypeError,
 )
 from pyubx2.socket_wrapper import SocketWrapper
+from pyubx2.ubxarray import extract_columns, group_array, group_arrays
+from pyubx2.ubxasyncreader import AsyncUBXReader
+from pyubx2.ubxconfigdb import UBX_CONFIGDB, ConfigDatabase
+from pyubx2.ubxconfigsync import config_diff, config_get, config_iter, config_sync
 from pyubx2.ubxhelpers import *
+from pyubx2.ubxlazymessage import LazyUBXMessage
+from pyubx2.ubxlog import UBXLog
 from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxparallel import parse_file_parallel
+from pyubx2.ubxpipeline import UBXPipeline
+from pyubx2.ubxparser import UBXParser
+from pyubx2.ubxpredicate import UBXPredicate
 from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxregistry import (
+    UBX_CLASS_KEYS,
+    UBX_INT_MSGIDS,
+    UBX_MSGID_INTS,
+    UBX_MSGID_KEYS,
+    msg_identity,
+)
+from pyubx2.ubxthreadedreader import ThreadedUBXReader
 from pyubx2.ubxtypes_configdb import *
 from pyubx2.ubxtypes_core import *
 from pyubx2.ubxtypes_decodes import *
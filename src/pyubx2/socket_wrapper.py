@@ -34,36 +34,71 @@ class SocketWrapper:
 
         self._socket = sock
         self._bufsize = kwargs.get("bufsize", 4096)
-        self._buffer = bytearray()
+        # preallocated receive buffer; unread data lies between
+        # self._start and self._end, so reads need not shift the buffer
+        self._buffer = bytearray(self._bufsize * 2)
+        self._start = 0
+        self._end = 0
         self._recv()  # populate initial buffer
 
     def _recv(self) -> bool:
         """
-        Read bytes from socket into internal buffer.
+        Read bytes from socket directly into internal buffer.
 
         :return: return code (0 = failure, 1 = success)
         :rtype: bool
         """
 
+        if len(self._buffer) - self._end < self._bufsize:
+            self._compact()
         try:
-            data = self._socket.recv(self._bufsize)
-            if len(data) == 0:
+            num = self._socket.recv_into(
+                memoryview(self._buffer)[self._end :], self._bufsize
+            )
+            if num == 0:
                 return False  # pragma: no cover
-            self._buffer += data
+            self._end += num
         except (OSError, TimeoutError):
             return False
         return True
 
+    def _compact(self):
+        """
+        Move unread data to start of internal buffer, enlarging
+        buffer if there is insufficient room for a further recv.
+        """
+
+        unread = self._end - self._start
+        if unread + self._bufsize > len(self._buffer):
+            buf = bytearray(max(len(self._buffer) * 2, unread + self._bufsize))
+            buf[:unread] = memoryview(self._buffer)[self._start : self._end]
+            self._buffer = buf
+        elif unread:
+            self._buffer[:unread] = self._buffer[self._start : self._end]
+        self._start = 0
+        self._end = unread
+
     @property
     def buffer(self) -> bytearray:
         """
-        Getter for buffer.
+        Getter for copy of unread data in buffer.
 
         :return: buffer
         :rtype: bytearray
         """
 
-        return self._buffer
+        return bytearray(memoryview(self._buffer)[self._start : self._end])
+
+    @property
+    def in_waiting(self) -> int:
+        """
+        Getter for number of bytes waiting in buffer.
+
+        :return: number of bytes in buffer
+        :rtype: int
+        """
+
+        return self._end - self._start
 
     def read(self, num: int) -> bytes:
         """
@@ -76,12 +111,12 @@ class SocketWrapper:
         """
 
         # if at end of internal buffer, top it up from socket
-        while len(self._buffer) < num:
+        while self._end - self._start < num:
             if not self._recv():
                 return b""
-        data = self._buffer[:num]
-        self._buffer = self._buffer[num:]
-        return bytes(data)
+        start = self._start
+        self._start += num
+        return bytes(memoryview(self._buffer)[start : self._start])
 
     def readline(self) -> bytes:
         """
@@ -92,17 +127,18 @@ class SocketWrapper:
         :rtype: bytes
         """
 
-        line = b""
+        scanned = 0  # bytes already searched for LF
         while True:
-            data = self.read(1)
-            if len(data) == 1:
-                line += data
-                if line[-1:] == b"\n":  # LF
-                    break
-            else:
+            end = self._buffer.find(b"\n", self._start + scanned, self._end) + 1
+            if end:
+                break
+            scanned = self._end - self._start
+            if not self._recv():
+                end = self._end  # pragma: no cover
                 break  # pragma: no cover
-
-        return line
+        start = self._start
+        self._start = end
+        return bytes(memoryview(self._buffer)[start:end])
 
     def write(self, data: bytes, **kwargs):
         """
@@ -0,0 +1,523 @@
+"""
+ubxarray.py
+
+Repeating groups of UBX payload attributes as numpy structured arrays.
+
+Each repeating group in a payload definition (e.g. the measurements in
+an RXM-RAWX message or the satellites in a NAV-SAT message) is compiled,
+on first use, into a numpy dtype describing the layout of a single
+group item in the payload. The whole group is then read with a single
+np.frombuffer() over the group bytes, and scaled attributes and bitfield
+flags are calculated a column at a time rather than an attribute at a
+time. Each column is named after the group attribute (e.g. 'prMes'
+rather than 'prMes_01', 'prMes_02' etc.).
+
+Fixed layout message types (e.g. NAV-PVT, NAV-HPPOSLLH) are compiled in
+the same way, and every occurrence of the message type in a stream, log
+or buffer can be extracted into per-attribute arrays with a single
+np.frombuffer() over the concatenated messages, without parsing them
+individually.
+
+numpy is an optional dependency, which is imported on first use.
+
+Usage::
+
+    msg = UBXReader.parse(raw, lazy=True)
+    meas = group_array(msg)
+    print(meas["prMes"], meas["cno"])
+
+    with open("trajectory.ubx", "rb") as stream:
+        cols = extract_columns(stream, "NAV-PVT", fields=["iTOW", "lat", "lon"])
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from pyubx2.exceptions import UBXMessageError
+from pyubx2.ubxhelpers import (
+    _numpy,
+    attsiz,
+    isvalid_checksums,
+    split_frames,
+)
+from pyubx2.ubxlog import UBXLog
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxregistry import UBX_MSGID_KEYS
+from pyubx2.ubxtypes_core import (
+    CH,
+    GET,
+    SCALROUND,
+    SET,
+    UBX_PROTOCOL,
+    VALCKSUM,
+    VALNONE,
+    X1,
+    X2,
+    X4,
+    X6,
+    X8,
+    X24,
+)
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+from pyubx2.ubxvariants import VARIANTS
+
+BITFIELDS = (X1, X2, X4, X6, X8, X24)
+"""Bitfield attribute types"""
+INTSIZES = (1, 2, 4, 8)
+"""Sizes in bytes of integers which have an equivalent numpy dtype"""
+
+_layouts = {}  # cache of compiled group layouts
+_frames = {}  # cache of compiled fixed message layouts
+
+
+def group_arrays(msg: object) -> dict:
+    """
+    Get each repeating group in a UBX message payload as a numpy
+    structured array, with one element per group item.
+
+    Columns have the same names, types and (scaled) values as the
+    corresponding message attributes, with the following exceptions:
+    integer attributes have the equivalent numpy integer type (or int64
+    or uint64 for 3 or 6 byte integers), 'A' (array) attributes are
+    subarrays of uint8, 'C' (character) attributes are fixed length
+    bytes (without trailing nulls), and bitfields which are not parsed (parsebitfield=False) are
+    unsigned integers. Attributes in a nested repeating group are
+    subarrays with one element per nested group item.
+
+    :param UBXMessage msg: parsed UBX message (UBXMessage or LazyUBXMessage)
+    :return: dict of group name in payload definition (e.g. 'group') and
+        structured array
+    :rtype: dict
+    :raises: ImportError (if numpy is not installed)
+    :raises: UBXMessageError (if a group cannot be represented as an array)
+    """
+    # pylint: disable=protected-access, too-many-locals, too-many-branches
+
+    np = _numpy()
+    if np is None:
+        raise ImportError("numpy must be installed to use repeating group arrays")
+    payload = msg.payload or b""
+    if (msg.msg_cls + msg.msg_id, msg.msgmode) in (
+        (b"\x06\x8b", GET),
+        (b"\x06\x8a", SET),
+    ):
+        raise UBXMessageError(
+            f"{msg.identity} configuration data cannot be represented as arrays"
+        )
+    pdict = msg._get_dict(payload=payload)
+    if not pdict:  # e.g. unrecognised message, nothing to compile or cache
+        return {}
+    key = (id(pdict), msg._parsebf)
+    entry = _layouts.get(key)
+    if entry is None or entry[0] is not pdict:
+        try:
+            entry = _layouts[key] = (pdict, _compile(np, pdict, msg._parsebf))
+        except ValueError as err:
+            raise UBXMessageError(
+                f"{msg.identity} repeating groups cannot be represented as arrays - {err}"
+            ) from err
+
+    arrays = {}
+    offset = 0
+    for skip, name, numr, rawdt, outdt, cols in entry[1]:
+        offset += skip
+        if numr == "None":  # number of repeats 'variable by size'
+            numr = max(len(payload) - offset, 0) // rawdt.itemsize
+        elif not isinstance(numr, int):  # number of repeats in named attribute
+            numr = getattr(msg, numr)
+        try:
+            raw = (
+                np.frombuffer(payload, dtype=rawdt, count=numr, offset=offset)
+                if numr
+                else np.zeros(0, dtype=rawdt)
+            )
+        except ValueError as err:
+            raise UBXMessageError(
+                f"{msg.identity} payload too short for {numr} repeats of {name}"
+            ) from err
+        arrays[name] = out = np.empty(numr, dtype=outdt)
+        _apply(np, raw, out, cols)
+        offset += numr * rawdt.itemsize
+    return arrays
+
+
+def group_array(msg: object, group: str = None) -> object:
+    """
+    Get a repeating group in a UBX message payload as a numpy
+    structured array (see group_arrays()).
+
+    :param UBXMessage msg: parsed UBX message (UBXMessage or LazyUBXMessage)
+    :param str group: name of group in payload definition, or None for
+        first group (None)
+    :return: structured array
+    :rtype: numpy.ndarray
+    :raises: ImportError (if numpy is not installed)
+    :raises: UBXMessageError (if message has no such group or group
+        cannot be represented as an array)
+    """
+
+    arrays = group_arrays(msg)
+    if group is None:
+        if not arrays:
+            raise UBXMessageError(f"{msg.identity} has no repeating groups")
+        return next(iter(arrays.values()))
+    if group not in arrays:
+        raise UBXMessageError(f"{msg.identity} has no repeating group {group}")
+    return arrays[group]
+
+
+def extract_columns(
+    source: object,
+    identity: str,
+    fields: list = None,
+    validate: int = VALCKSUM,
+    parsebitfield: bool = True,
+) -> dict:
+    """
+    Extract every occurrence of a fixed layout UBX message type (e.g.
+    NAV-PVT, NAV-HPPOSLLH, ESF-INS) in a data stream, indexed log or
+    in-memory buffer into numpy arrays, one per message attribute,
+    without parsing the messages individually.
+
+    The matching messages are concatenated and read with a single
+    np.frombuffer(), and scaling, bitfield flags and high precision
+    ('_HP') components are applied an attribute at a time. Values have
+    the same names and (scaled) values as the corresponding message
+    attributes (see group_arrays() for types). Messages whose length
+    does not match the payload definition (e.g. another message version)
+    are skipped, as are messages with invalid checksums if 'validate'
+    is VALCKSUM.
+
+    :param object source: data stream, UBXLog, or bytes, bytearray or
+        memoryview buffer
+    :param str identity: UBX message identity e.g. "NAV-PVT"
+    :param list fields: names of attributes to extract, or None for all (None)
+    :param int validate: VALCKSUM (1) = skip messages with invalid checksum,
+        VALNONE (0) = ignore invalid checksum (1)
+    :param bool parsebitfield: 1 = extract bitfield flags, 0 = extract
+        bitfields as unsigned integers (1)
+    :return: dict of attribute name and array, in order of 'fields'
+    :rtype: dict
+    :raises: ImportError (if numpy is not installed)
+    :raises: UBXMessageError (if message type or field is unknown, or
+        message type does not have a fixed layout)
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+
+    np = _numpy()
+    if np is None:
+        raise ImportError("numpy must be installed to extract columns")
+    try:
+        msgkey = UBX_MSGID_KEYS[identity]
+        pdict = UBX_PAYLOADS_GET[identity]
+    except KeyError as err:
+        raise UBXMessageError(f"Unknown message type {identity}") from err
+    if len(msgkey) != 2 or msgkey[0] == 0x13:  # MGA
+        raise UBXMessageError(f"{identity} does not have a fixed layout")
+
+    frames = list(_read_frames(source, identity, msgkey))
+    variant = VARIANTS[GET].get(msgkey, False)
+    if variant and frames:  # definition depends on payload e.g. version
+        pdict = variant(payload=bytes(frames[0][6:-2]))
+    key = (id(pdict), parsebitfield)
+    entry = _frames.get(key)
+    if entry is None or entry[0] is not pdict:
+        try:
+            entry = _frames[key] = (pdict, _compile_frame(np, pdict, parsebitfield))
+        except ValueError as err:
+            raise UBXMessageError(
+                f"{identity} does not have a fixed layout - {err}"
+            ) from err
+    (framedt, outdt, cols) = entry[1]
+    if fields is None:
+        fields = list(outdt.names)
+    for name in fields:
+        if name not in outdt.names:
+            raise UBXMessageError(f"{identity} has no attribute {name}")
+
+    frames = [frm for frm in frames if len(frm) == framedt.itemsize]
+    buf = b"".join(frames)
+    if validate & VALCKSUM and frames:
+        valid = isvalid_checksums(buf, range(0, len(buf), framedt.itemsize))
+        if not all(valid):
+            buf = b"".join(frm for frm, val in zip(frames, valid) if val)
+    raw = np.frombuffer(buf, dtype=framedt)
+    columns = {
+        name: np.empty((len(raw),) + outdt[name].shape, dtype=outdt[name].base)
+        for name in fields
+    }
+    _apply(np, raw, columns, [col for col in cols if col[0] in columns])
+    return columns
+
+
+def _read_frames(source: object, identity: str, msgkey: bytes) -> object:
+    """
+    Read raw UBX messages of given type from source, without validating
+    their checksums.
+
+    :param object source: data stream, UBXLog, or bytes, bytearray or
+        memoryview buffer
+    :param str identity: UBX message identity e.g. "NAV-PVT"
+    :param bytes msgkey: UBX message class and id e.g. b"\\x01\\x07"
+    :return: generator of raw messages (bytes or memoryview)
+    :rtype: generator
+    """
+
+    if isinstance(source, UBXLog):
+        for idx in source.indices(identity):
+            yield source.raw(idx)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        mvw = memoryview(source).cast("B")
+        for prot, offset, length, _ in split_frames(mvw, validate=VALNONE):
+            if prot == UBX_PROTOCOL and mvw[offset + 2 : offset + 4] == msgkey:
+                yield mvw[offset : offset + length]
+    else:
+        for raw, _ in UBXReader(
+            source,
+            protfilter=UBX_PROTOCOL,
+            validate=VALNONE,
+            parsing=False,
+            msgfilter=(msgkey,),
+        ):
+            yield raw
+
+
+def _apply(np: object, raw: object, out: object, cols: list):
+    """
+    Calculate output columns from raw structured array.
+
+    :param object np: numpy module
+    :param numpy.ndarray raw: raw structured array
+    :param object out: output structured array, or dict of output arrays
+    :param list cols: columns (see _compile_group())
+    """
+
+    for col, path, combine, signed, scale, bits, hpr in cols:
+        val = raw
+        for field in path:
+            val = val[field]
+        if combine:  # integer with no equivalent numpy dtype
+            val = _combine(np, val, signed)
+        if bits is not None:
+            (shift, mask) = bits
+            val = (val >> shift) & mask
+        if scale != 1:
+            val = np.round(val * scale, SCALROUND)
+        if hpr:  # high precision component of earlier attribute
+            val = np.round(out[col] + val, SCALROUND)
+        out[col][...] = val
+
+
+def _combine(np: object, val: object, signed: bool) -> object:
+    """
+    Combine little-endian bytes (last axis) to 64-bit integers.
+
+    :param object np: numpy module
+    :param numpy.ndarray val: array of uint8
+    :param bool signed: integers are signed (two's complement)
+    :return: array of int64 or uint64
+    :rtype: numpy.ndarray
+    """
+
+    size = val.shape[-1]
+    res = np.zeros(val.shape[:-1], dtype=np.uint64)
+    for i in range(size):
+        res |= val[..., i].astype(np.uint64) << np.uint64(8 * i)
+    if signed:
+        res = res.astype(np.int64)
+        res[res >= 1 << (8 * size - 1)] -= 1 << (8 * size)
+    return res
+
+
+def _compile(np: object, pdict: dict, parsebitfield: bool) -> list:
+    """
+    Compile layout of repeating groups in payload definition.
+
+    :param object np: numpy module
+    :param dict pdict: payload definition
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :return: list of (number of fixed bytes preceding group, group name,
+        number of repeats, raw dtype, output dtype, columns) for each group
+    :rtype: list
+    :raises: ValueError (if group cannot be represented as an array)
+    """
+
+    layout = []
+    skip = 0  # fixed bytes since previous group
+    for anam, adef in pdict.items():
+        if isinstance(adef, tuple) and adef[0] not in BITFIELDS:
+            if skip is None:
+                raise ValueError(f"{anam} follows variable length attribute")
+            (numr, gdict) = adef
+            (rawdt, outfields, cols) = _compile_group(np, gdict, parsebitfield)
+            layout.append((skip, anam, numr, rawdt, np.dtype(outfields), cols))
+            skip = 0
+        elif skip is not None:
+            atyp = adef[0] if isinstance(adef, (tuple, list)) else adef
+            skip = None if atyp == CH else skip + attsiz(atyp)
+    return layout
+
+
+def _compile_frame(np: object, pdict: dict, parsebitfield: bool) -> tuple:
+    """
+    Compile layout of complete UBX message with fixed layout payload.
+
+    :param object np: numpy module
+    :param dict pdict: payload definition
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :return: tuple of (raw dtype of message including header and checksum,
+        output dtype, list of columns)
+    :rtype: tuple
+    :raises: ValueError (if payload definition does not have a fixed layout)
+    """
+
+    (rawdt, outfields, cols) = _compile_group(np, pdict, parsebitfield)
+    names = list(rawdt.names)
+    framedt = np.dtype(
+        {
+            "names": names,
+            "formats": [rawdt.fields[name][0] for name in names],
+            "offsets": [rawdt.fields[name][1] + 6 for name in names],
+            "itemsize": rawdt.itemsize + 8,
+        }
+    )
+    return (framedt, np.dtype(outfields), cols)
+
+
+def _compile_group(np: object, gdict: dict, parsebitfield: bool) -> tuple:
+    """
+    Compile layout of (nested) repeating group.
+
+    Each column is defined by a tuple of (column name, path of field names
+    in raw array, combine bytes to integer Y/N, signed Y/N, scaling factor,
+    (shift, mask) of bitfield flag or None, add to earlier column Y/N).
+    High precision ('_HP') attributes are added to the earlier attribute
+    of the same name, which becomes floating point.
+
+    :param object np: numpy module
+    :param dict gdict: group definition
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :return: tuple of (raw dtype of group item, list of output fields,
+        list of columns)
+    :rtype: tuple
+    :raises: ValueError (if group cannot be represented as an array)
+    """
+    # pylint: disable=too-many-locals, too-many-branches, too-many-statements, too-many-nested-blocks
+
+    rawfields = {"names": [], "formats": [], "offsets": []}
+    outfields = []
+    cols = []
+    offset = 0
+
+    def rawfield(name: str, fmt: object, size: int):
+        rawfields["names"].append(name)
+        rawfields["formats"].append(fmt)
+        rawfields["offsets"].append(offset)
+        return offset + size
+
+    for anam, adef in gdict.items():
+        scale = 1
+        if isinstance(adef, tuple):
+            (numr, sub) = adef
+            if numr in BITFIELDS:
+                size = attsiz(numr)
+                combine = size not in INTSIZES
+                if parsebitfield and size <= 8:
+                    flagoff = 0
+                    for key, keyt in sub.items():
+                        bits = attsiz(keyt)
+                        if key[0:8] != "reserved":  # reserved bits aren't set
+                            outfields.append((key, _uint(np, bits)))
+                            cols.append(
+                                (
+                                    key,
+                                    (anam,),
+                                    combine,
+                                    False,
+                                    1,
+                                    (flagoff, (1 << bits) - 1),
+                                    False,
+                                )
+                            )
+                        flagoff += bits
+                elif parsebitfield:
+                    raise ValueError(f"{anam} bitfield is too large")
+                elif size <= 8:
+                    outfields.append((anam, np.uint64 if combine else f"<u{size}"))
+                    cols.append((anam, (anam,), combine, False, 1, None, False))
+                else:
+                    outfields.append((anam, np.uint8, (size,)))
+                    cols.append((anam, (anam,), False, False, 1, None, False))
+                offset = rawfield(
+                    anam, ("u1", (size,)) if combine else f"<u{size}", size
+                )
+                continue
+            if not isinstance(numr, int):
+                raise ValueError(f"group {anam} has variable number of repeats")
+            (subdt, subfields, subcols) = _compile_group(np, sub, parsebitfield)
+            for name, *fmt in subfields:
+                shape = (numr,) + (fmt[1] if len(fmt) > 1 else ())
+                outfields.append((name, fmt[0], shape))
+            for col in subcols:
+                cols.append((col[0], (anam,) + col[1]) + col[2:])
+            offset = rawfield(anam, (subdt, (numr,)), numr * subdt.itemsize)
+            continue
+        if isinstance(adef, list):
+            (adef, scale) = adef
+        if adef == CH:
+            raise ValueError(f"{anam} attribute type is not supported")
+        atyp = adef[0]
+        size = attsiz(adef)
+        combine = False
+        if atyp in ("E", "I", "L", "U", "X"):  # integer
+            if size > 8:
+                raise ValueError(f"{anam} integer is too large")
+            signed = atyp == "I"
+            combine = size not in INTSIZES
+            if combine:
+                rawfmt = ("u1", (size,))
+                outfmt = np.int64 if signed else np.uint64
+            else:
+                rawfmt = outfmt = f"<{'i' if signed else 'u'}{size}"
+        elif atyp == "R":  # floating point
+            signed = True
+            rawfmt = outfmt = f"<f{size}"
+        elif atyp == "C":
+            signed = False
+            rawfmt = outfmt = f"S{size}"
+        else:  # array of unsigned integers
+            signed = False
+            rawfmt = ("u1", (size,))
+            outfmt = rawfmt
+        if scale != 1:
+            outfmt = np.float64
+        if anam[0:3] == "_HP":  # high precision component of earlier attribute
+            outfields = [
+                (anam[3:], np.float64) if fld[0] == anam[3:] else fld
+                for fld in outfields
+            ]
+            cols.append((anam[3:], (anam,), combine, signed, scale, None, True))
+        else:
+            if isinstance(outfmt, tuple):
+                outfields.append((anam,) + outfmt)
+            else:
+                outfields.append((anam, outfmt))
+            cols.append((anam, (anam,), combine, signed, scale, None, False))
+        offset = rawfield(anam, rawfmt, size)
+    rawdt = np.dtype(dict(rawfields, itemsize=offset))
+    return (rawdt, outfields, cols)
+
+
+def _uint(np: object, bits: int) -> object:
+    """
+    Get smallest unsigned integer dtype for bitfield flag.
+
+    :param object np: numpy module
+    :param int bits: size of flag in bits
+    :return: numpy dtype
+    :rtype: object
+    """
+
+    return np.dtype(f"<u{min(size for size in INTSIZES if bits <= size * 8)}")
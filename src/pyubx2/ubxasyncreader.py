@@ -0,0 +1,176 @@
+"""
+AsyncUBXReader class.
+
+Reads and parses individual UBX, NMEA or RTCM3 messages from an asyncio
+StreamReader (e.g. as returned by asyncio.open_connection() or
+serial_asyncio.open_serial_connection()), allowing many receiver streams
+to be serviced by a single event loop rather than a thread per stream.
+
+Framing and parsing are delegated to the sans-IO UBXParser class, so
+'protfilter', 'quitonerror', 'msgmode' etc. behave as for UBXReader.
+
+Usage::
+
+    reader, writer = await asyncio.open_connection("localhost", 50007)
+    aubr = AsyncUBXReader(reader, writer)
+    await aubr.write(UBXMessage("NAV", "NAV-PVT", POLL).serialize())
+    async for raw_data, parsed_data in aubr:
+        print(parsed_data)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxparser import UBXParser
+from pyubx2.ubxreader import PARSE_ERRORS
+from pyubx2.ubxtypes_core import (
+    ERR_LOG,
+    GET,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UBX_PROTOCOL,
+    VALCKSUM,
+)
+
+
+class AsyncUBXReader:
+    """
+    AsyncUBXReader class.
+    """
+
+    def __init__(
+        self,
+        datastream,
+        writer=None,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | UBX_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        labelmsm: int = 1,
+        bufsize: int = 4096,
+        parsing: bool = True,
+        errorhandler: object = None,
+    ):
+        """Constructor.
+
+        :param asyncio.StreamReader datastream: input data stream
+        :param asyncio.StreamWriter writer: output data stream (None)
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), UBX_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int labelmsm: RTCM3 MSM label type 1 = RINEX, 2 = BAND (1)
+        :param int bufsize: maximum size of each read from stream (4096)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :raises: UBXStreamError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        self._stream = datastream
+        self._writer = writer
+        self._bufsize = bufsize
+        self._parser = UBXParser(
+            msgmode=msgmode,
+            validate=validate,
+            protfilter=protfilter,
+            quitonerror=quitonerror,
+            parsebitfield=parsebitfield,
+            labelmsm=labelmsm,
+            parsing=parsing,
+            errorhandler=errorhandler,
+        )
+        self._frames = iter(())  # messages parsed from last chunk read
+
+    def __aiter__(self):
+        """Asynchronous iterator."""
+
+        return self
+
+    async def __anext__(self) -> tuple:
+        """
+        Return next item in asynchronous iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage)
+        :rtype: tuple
+        :raises: StopAsyncIteration
+
+        """
+
+        (raw_data, parsed_data) = await self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopAsyncIteration
+        return (raw_data, parsed_data)
+
+    async def read(self) -> tuple:
+        """
+        Read a single NMEA, UBX or RTCM3 message from the stream
+        and return both raw and parsed data.
+
+        Awaits further data from the stream only when no complete
+        message remains in the parser's buffer.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage, NMEAMessage
+            or RTCMMessage), or (None, None) at end of stream
+        :rtype: tuple
+        :raises: Exception (if invalid or unrecognised protocol in data)
+        """
+
+        while True:
+            try:
+                return next(self._frames)
+            except StopIteration:
+                pass
+            except PARSE_ERRORS:
+                # resume with remaining buffered data on next read
+                self._frames = self._parser.feed(b"")
+                raise
+            data = await self._stream.read(self._bufsize)
+            if not data:  # EOF
+                self._parser.close()
+                return (None, None)
+            self._frames = self._parser.feed(data)
+
+    async def write(self, data: bytes):
+        """
+        Write binary data (e.g. a serialized UBXMessage) to the output
+        stream, waiting until it is appropriate to resume writing.
+
+        :param bytes data: data to write
+        :raises: UBXStreamError (if no output stream was provided)
+        """
+
+        if self._writer is None:
+            raise UBXStreamError("No output stream (writer) provided")
+        self._writer.write(data)
+        await self._writer.drain()
+
+    @property
+    def datastream(self) -> object:
+        """
+        Getter for stream.
+
+        :return: data stream
+        :rtype: object
+        """
+
+        return self._stream
+
+    @property
+    def writer(self) -> object:
+        """
+        Getter for output stream.
+
+        :return: output stream
+        :rtype: object
+        """
+
+        return self._writer
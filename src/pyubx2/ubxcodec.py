@@ -0,0 +1,1084 @@
+"""
+ubxcodec.py
+
+Compiled UBX payload decoders and encoders.
+
+Each payload definition in ubxtypes_get, ubxtypes_set or ubxtypes_poll
+is compiled, on first use, into dedicated Python functions which
+unpack (decode) or pack (encode) fixed sections of the payload with
+precomputed struct.Struct formats and offsets, loop over repeating
+groups using the relevant count attribute, and extract or combine
+bitfield flags with precomputed shifts and masks. The compiled
+functions are cached and reused for every subsequent message with
+the same definition.
+
+A compiled decoder returns a dict of attribute names and values, and a
+compiled encoder returns the payload and a dict of attribute names and
+values, in exactly the order and form produced by UBXMessage's own
+(recursive) attribute routines. A compiled accessor decodes a single
+named attribute directly from its offset in the payload. If the payload or keyword values do
+not match the definition (e.g. a truncated payload or a value of the
+wrong type), the compiled function raises an exception and UBXMessage
+reverts to its recursive attribute routines, which handle such cases.
+
+The caches are safe to use from multiple threads; each definition is
+compiled once, under a lock, and compiled functions hold no state
+between calls.
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-lines
+
+import struct
+import threading
+from abc import ABC, abstractmethod
+from functools import partial
+
+from pyubx2.exceptions import UBXMessageError, UBXTypeError
+from pyubx2.ubxconfigdb import UBX_CONFIGDB
+from pyubx2.ubxhelpers import attsiz, nomval
+from pyubx2.ubxtypes_core import (
+    ATTTYPE,
+    CH,
+    GET,
+    SCALROUND,
+    SET,
+    X1,
+    X2,
+    X4,
+    X6,
+    X8,
+    X24,
+)
+
+BITFIELDS = (X1, X2, X4, X6, X8, X24)
+"""Bitfield attribute types"""
+INTFORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+"""struct formats for unsigned integers of given size in bytes"""
+FLOATFORMATS = {4: "f", 8: "d"}
+"""struct formats for floating point numbers of given size in bytes"""
+CODEC_ERRORS = (
+    AttributeError,
+    IndexError,
+    KeyError,
+    OverflowError,
+    struct.error,
+    TypeError,
+    UBXMessageError,
+    UBXTypeError,
+    ValueError,
+)
+"""Errors raised by compiled functions if payload or keywords do not match definition"""
+
+_decoders = {}  # cache of compiled decoders
+_encoders = {}  # cache of compiled encoders
+_accessors = {}  # cache of compiled accessors
+_compile_lock = threading.Lock()  # serialises compilation of cached functions
+
+
+def decode_cfgval(payload: bytes, offset: int, vals: dict):
+    """
+    Decode CFG-VALGET / CFG-VALSET payload to set of configuration
+    key value pairs.
+
+    :param bytes payload: raw payload
+    :param int offset: offset of first key in payload
+    :param dict vals: dict to which key value pairs are added
+    """
+
+    UBX_CONFIGDB.decode(payload, offset, vals)
+
+
+def _get_compiled(
+    cache: dict,
+    compiler: type,
+    pdict: dict,
+    msg: bytes,
+    msgmode: int,
+    parsebitfield: bool,
+    cls: type,
+) -> object:
+    """
+    Get compiled function for payload definition from cache, compiling
+    it if this is the first time the definition has been used.
+
+    :param dict cache: cache of compiled functions
+    :param type compiler: compiler class
+    :param dict pdict: payload definition
+    :param bytes msg: message class and id e.g. b"\\x01\\x07"
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param type cls: message class whose instances are populated
+    :return: compiled function, or None if definition cannot be compiled
+    :rtype: function
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    key = (id(pdict), msg, msgmode, parsebitfield, cls)
+    entry = cache.get(key)
+    if entry is not None and entry[0] is pdict:
+        return entry[1]
+    with _compile_lock:
+        entry = cache.get(key)  # may have been compiled by another thread
+        if entry is None or entry[0] is not pdict:
+            comp = compiler(pdict, msg, msgmode, parsebitfield)
+            try:
+                func = comp.compile()
+            except (KeyError, TypeError, ValueError, ZeroDivisionError):
+                func = None  # not compilable, use UBXMessage attribute routines
+            # attributes which clash with read-only properties cannot be set
+            for name in comp.names:
+                if isinstance(getattr(cls, name, None), property):
+                    func = None
+            entry = cache[key] = (pdict, func)
+    return entry[1]
+
+
+def get_decoder(
+    pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool, cls: type
+) -> object:
+    """
+    Get compiled decoder for payload definition, compiling it if
+    this is the first time the definition has been used.
+
+    The decoder takes the payload as bytes and returns a dict
+    of attribute names and values.
+
+    :param dict pdict: payload definition
+    :param bytes msg: message class and id e.g. b"\\x01\\x07"
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param type cls: message class whose instances are populated by decoder
+    :return: decoder function, or None if definition cannot be compiled
+    :rtype: function
+    """
+
+    return _get_compiled(
+        _decoders, _DecoderCompiler, pdict, msg, msgmode, parsebitfield, cls
+    )
+
+
+def get_encoder(
+    pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool, cls: type
+) -> object:
+    """
+    Get compiled encoder for payload definition, compiling it if
+    this is the first time the definition has been used.
+
+    The encoder takes a dict of keyword values and returns a tuple
+    of (payload as bytes, dict of attribute names and values). Any
+    attribute not in the keyword values is assigned a nominal value.
+
+    :param dict pdict: payload definition
+    :param bytes msg: message class and id e.g. b"\\x06\\x01"
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param type cls: message class whose instances are populated by encoder
+    :return: encoder function, or None if definition cannot be compiled
+    :rtype: function
+    """
+
+    return _get_compiled(
+        _encoders, _EncoderCompiler, pdict, msg, msgmode, parsebitfield, cls
+    )
+
+
+def get_accessor(
+    pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool, cls: type
+) -> object:
+    """
+    Get compiled accessor for payload definition, compiling it if
+    this is the first time the definition has been used.
+
+    The accessor takes the payload as bytes and an attribute name
+    (e.g. 'svId_05') and returns the value of that attribute alone,
+    raising KeyError if the attribute cannot be decoded individually
+    or AttributeError if the payload has no such attribute.
+
+    :param dict pdict: payload definition
+    :param bytes msg: message class and id e.g. b"\\x01\\x35"
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param type cls: message class whose attributes are decoded
+    :return: accessor function, or None if definition cannot be compiled
+    :rtype: function
+    """
+
+    return _get_compiled(
+        _accessors, _AccessorCompiler, pdict, msg, msgmode, parsebitfield, cls
+    )
+
+
+class _Compiler(ABC):
+    """
+    Walks a payload definition, mirroring UBXMessage's recursive
+    attribute routines, to build a compiled function for it.
+
+    Subclasses implement the handling of individual attributes,
+    bitfields and repeating groups.
+    """
+
+    def __init__(self, pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool):
+        """
+        Constructor.
+
+        :param dict pdict: payload definition
+        :param bytes msg: message class and id
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        """
+
+        self._pdict = pdict
+        self._parsebf = parsebitfield
+        # CFG-VALGET and CFG-VALSET groups are configuration key value pairs
+        self._cfgval = (msg == b"\x06\x8b" and msgmode == GET) or (
+            msg == b"\x06\x8a" and msgmode == SET
+        )
+        # ESF-MEAS SET has an extra group item if calibTtagValid is set
+        self._esfmeas = msg == b"\x10\x02" and msgmode == SET
+        self.names = set()  # names of attributes outside repeating groups
+
+    def _attribute(self, anam: str, adef: object):
+        """
+        Compile individual or grouped payload attribute.
+
+        :param str anam: attribute name
+        :param object adef: attribute definition
+        """
+
+        if isinstance(adef, tuple):  # repeating group or subdefined bitfield
+            (numr, gdict) = adef
+            if numr in BITFIELDS:
+                if self._parsebf:
+                    self._bitfield(numr, gdict)
+                else:  # treat bitfield as a single byte array
+                    self._single(anam, numr)
+            else:
+                self._group(numr, gdict)
+        else:
+            self._single(anam, adef)
+
+    @abstractmethod
+    def _group(self, anam: object, gdict: dict):
+        """
+        Compile (nested) repeating group of attributes.
+
+        :param object anam: number of repeats as int, 'None' if
+            variable by size, or name of attribute containing number
+            of repeats
+        :param dict gdict: group definition
+        """
+
+    @abstractmethod
+    def _single(self, anam: str, adef: object):
+        """
+        Compile single attribute.
+
+        :param str anam: attribute name
+        :param object adef: attribute type e.g. 'U002', or list of
+            [attribute type, scaling factor]
+        """
+
+    @abstractmethod
+    def _bitfield(self, btyp: str, bdict: dict):
+        """
+        Compile bitfield attribute (type 'X') as individual bit flags.
+
+        :param str btyp: bitfield type e.g. 'X002'
+        :param dict bdict: bitfield definition of flag names and types
+        """
+
+
+class _SourceCompiler(_Compiler):  # pylint: disable=too-many-instance-attributes
+    """
+    Generates source code for the compiled function of a payload
+    definition, which is executed to create the function.
+
+    Subclasses implement the handling of individual attributes,
+    bitfields and fixed sections of the payload.
+    """
+
+    PROLOGUE = []
+    """Opening lines of compiled function"""
+    EPILOGUE = []
+    """Closing lines of compiled function"""
+
+    def __init__(self, pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool):
+        """
+        Constructor.
+
+        :param dict pdict: payload definition
+        :param bytes msg: message class and id
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        """
+
+        super().__init__(pdict, msg, msgmode, parsebitfield)
+        self._namespace = {
+            "round": round,
+            "SCALROUND": SCALROUND,
+            "decode_cfgval": decode_cfgval,
+        }
+        self._lines = []
+        self._indent = 1
+        self._depth = 0  # nesting level of repeating groups
+        self._run = []  # pending fixed section of payload
+
+    def compile(self) -> object:
+        """
+        Compile payload definition to function.
+
+        :return: compiled function
+        :rtype: function
+        """
+
+        for anam, adef in self._pdict.items():
+            self._attribute(anam, adef)
+        self._flush()
+        src = "\n".join(self.PROLOGUE + self._lines + self.EPILOGUE)
+        code = compile(src, "<ubxcodec>", "exec")
+        # source is generated from the payload definition alone - attribute
+        # names are quoted with repr() and constants are passed in the
+        # namespace, so no message data or keyword values are executed
+        exec(code, self._namespace)  # nosec B102 # pylint: disable=exec-used
+        return self._namespace["func"]
+
+    def _emit(self, line: str):
+        """
+        Add line of source code at current indentation.
+
+        :param str line: source code
+        """
+
+        self._lines.append("    " * self._indent + line)
+
+    def _const_name(self, val: object) -> str:
+        """
+        Add constant to function namespace.
+
+        :param object val: constant value
+        :return: name of constant
+        :rtype: str
+        """
+
+        name = f"c{len(self._namespace)}"
+        self._namespace[name] = val
+        return name
+
+    def _key(self, name: str) -> str:
+        """
+        Source expression for attribute name, suffixed with
+        group indices if within a (nested) repeating group.
+
+        :param str name: attribute name
+        :return: key expression
+        :rtype: str
+        """
+
+        if self._depth:
+            return f"{name!r} + s{self._depth}"
+        self.names.add(name)
+        return repr(name)
+
+    def _store(self, name: str, val: str) -> str:
+        """
+        Source code to store attribute value.
+
+        :param str name: attribute name
+        :param str val: value expression
+        :return: source code
+        :rtype: str
+        """
+
+        if name[0:3] == "_HP":  # high precision component of earlier attribute
+            key = self._key(name[3:])
+            return f"d[{key}] = round(d[{key}] + {val}, SCALROUND)"
+        return f"d[{self._key(name)}] = {val}"
+
+    def _group(self, anam: object, gdict: dict):
+        """
+        Compile (nested) repeating group of attributes.
+
+        :param object anam: number of repeats as int, 'None' if
+            variable by size, or name of attribute containing number
+            of repeats
+        :param dict gdict: group definition
+        """
+
+        if self._cfgval:
+            self._cfgval_group()
+            return
+
+        if anam == "None":  # number of repeats 'variable by size'
+            lengroup = 0
+            for val in gdict.values():
+                if isinstance(val, tuple):
+                    (val, _) = val
+                lengroup += attsiz(val)
+            numr = self._size_repeats(lengroup)
+            if numr is None:  # no repeats
+                return
+        self._group_start()
+        self._depth += 1
+        dep = self._depth
+        if isinstance(anam, int):  # fixed number of repeats
+            self._emit(f"n{dep} = {anam}")
+        elif anam == "None":
+            self._emit(f"n{dep} = {numr}")
+        else:  # number of repeats is defined in named attribute
+            self._emit(f"n{dep} = d[{anam!r}]")
+            if self._esfmeas:
+                self._emit('if d.get("calibTtagValid", 0):')
+                self._emit(f"    n{dep} += 1")
+        self._emit(f"for i{dep} in range(1, n{dep} + 1):")
+        self._indent += 1
+        if dep == 1:
+            self._emit('s1 = f"_{i1:02d}"')
+        else:
+            self._emit(f's{dep} = f"{{s{dep - 1}}}_{{i{dep}:02d}}"')
+        for key, adef in gdict.items():
+            self._attribute(key, adef)
+        self._group_end()
+        self._indent -= 1
+        self._depth -= 1
+
+    @abstractmethod
+    def _flush(self):
+        """
+        Emit source code for pending fixed section of payload.
+        """
+
+    @abstractmethod
+    def _cfgval_group(self):
+        """
+        Compile CFG-VALGET / CFG-VALSET configuration key value pairs.
+        """
+
+    @abstractmethod
+    def _size_repeats(self, lengroup: int) -> str:
+        """
+        Source expression for number of repeats of 'variable by size'
+        repeating group.
+
+        :param int lengroup: length of group in bytes
+        :return: number of repeats expression, or None if no repeats
+        :rtype: str
+        """
+
+    @abstractmethod
+    def _group_start(self):
+        """
+        Emit source code preceding repeating group.
+        """
+
+    @abstractmethod
+    def _group_end(self):
+        """
+        Emit source code at end of each repeating group item.
+        """
+
+
+class _DecoderCompiler(_SourceCompiler):
+    """
+    Generates source code for the decoder function of a payload
+    definition, mirroring UBXMessage's attribute parsing routines.
+    """
+
+    PROLOGUE = ["def func(payload):", "    d = {}"]
+    EPILOGUE = ["    return d"]
+
+    def __init__(self, pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool):
+        """
+        Constructor.
+
+        :param dict pdict: payload definition
+        :param bytes msg: message class and id
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        """
+
+        super().__init__(pdict, msg, msgmode, parsebitfield)
+        self._varoff = False  # offset is relative to runtime 'off' variable
+        self._const = 0  # offset relative to 'off' or start of payload
+        self._runoff = ""  # offset of pending fixed section
+
+    def _offset(self) -> str:
+        """
+        Source expression for current payload offset.
+
+        :return: offset expression
+        :rtype: str
+        """
+
+        if self._varoff:
+            return f"off + {self._const}" if self._const else "off"
+        return str(self._const)
+
+    def _flush(self):
+        """
+        Emit source code to unpack pending fixed section of payload.
+        """
+
+        if not self._run:
+            return
+        fmt = "<" + "".join(fmt for fmt, _ in self._run)
+        sname = self._const_name(struct.Struct(fmt))
+        temps = ", ".join(f"v{i}" for i in range(len(self._run)))
+        self._emit(f"({temps},) = {sname}.unpack_from(payload, {self._runoff})")
+        for i, (_, lines) in enumerate(self._run):
+            for line in lines:
+                self._emit(line.replace("{v}", f"v{i}"))
+        self._run = []
+
+    def _field(self, fmt: str, size: int, lines: list):
+        """
+        Add field to pending fixed section of payload.
+
+        :param str fmt: struct format of field
+        :param int size: size of field in bytes
+        :param list lines: source lines to process field value '{v}'
+        """
+
+        if not self._run:
+            self._runoff = self._offset()
+        self._run.append((fmt, lines))
+        self._const += size
+
+    def _sync(self):
+        """
+        Emit source code to set runtime 'off' variable to current offset.
+        """
+
+        self._flush()
+        if not (self._varoff and self._const == 0):
+            self._emit(f"off = {self._offset()}")
+        self._varoff = True
+        self._const = 0
+
+    def _cfgval_group(self):
+        """
+        Emit source code to decode configuration key value pairs.
+        """
+
+        self._flush()
+        self._emit(f"decode_cfgval(payload, {self._offset()}, d)")
+
+    def _size_repeats(self, lengroup: int) -> str:
+        """
+        Source expression for number of repeats of 'variable by size'
+        repeating group.
+
+        :param int lengroup: length of group in bytes
+        :return: number of repeats expression
+        :rtype: str
+        """
+
+        self._sync()
+        return f"int((len(payload) - off) / {lengroup})"
+
+    def _group_start(self):
+        """
+        Emit source code preceding repeating group.
+        """
+
+        self._sync()
+
+    def _group_end(self):
+        """
+        Emit source code at end of each repeating group item.
+        """
+
+        self._flush()
+        if self._const:
+            self._emit(f"off += {self._const}")
+        self._varoff = True
+        self._const = 0
+
+    def _single(self, anam: str, adef: object):
+        """
+        Compile single attribute, applying scaling where appropriate.
+
+        :param str anam: attribute name
+        :param object adef: attribute type e.g. 'U002', or list of
+            [attribute type, scaling factor]
+        """
+
+        ares = 1
+        if isinstance(adef, list):
+            ares = adef[1]  # attribute resolution (i.e. scaling factor)
+            adef = adef[0]  # attribute definition
+        val = "{v}"
+        if ares != 1:
+            val = f"round({{v}} * {self._const_name(ares)}, SCALROUND)"
+
+        if adef == CH:  # variable length string, takes whole payload length
+            self._flush()
+            offset = self._offset()
+            self._emit(
+                "v = payload["
+                f"{offset} : {offset} + len(payload)"
+                '].decode("utf-8", "backslashreplace")'
+            )
+            self._emit(self._store(anam, val.replace("{v}", "v")))
+            self._emit(f"off = {offset} + len(payload)")
+            self._varoff = True
+            self._const = 0
+            return
+
+        atyp = adef[0]
+        asiz = attsiz(adef)
+        lines = []
+        if atyp in ("E", "I", "L", "U"):  # integer
+            fmt = INTFORMATS.get(asiz)
+            if fmt is None:
+                fmt = f"{asiz}s"
+                lines.append(
+                    f'{{v}} = int.from_bytes({{v}}, "little", signed={atyp == "I"})'
+                )
+            elif atyp == "I":
+                fmt = fmt.lower()
+        elif atyp == "R":  # floating point
+            fmt = FLOATFORMATS[asiz]
+        elif atyp in ("X", "C"):
+            fmt = f"{asiz}s"
+        elif atyp == "A":  # array of unsigned integers
+            fmt = f"{asiz}s"
+            lines.append("{v} = list({v})")
+        else:
+            raise ValueError(f"Unknown attribute type {adef}")
+        lines.append(self._store(anam, val))
+        self._field(fmt, asiz, lines)
+
+    def _bitfield(self, btyp: str, bdict: dict):
+        """
+        Compile bitfield attribute (type 'X') to individual bit flags.
+
+        :param str btyp: bitfield type e.g. 'X002'
+        :param dict bdict: bitfield definition of flag names and types
+        """
+
+        bsiz = attsiz(btyp)
+        fmt = INTFORMATS.get(bsiz)
+        lines = []
+        if fmt is None:
+            fmt = f"{bsiz}s"
+            lines.append('{v} = int.from_bytes({v}, "little")')
+        bfoffset = 0
+        for key, keyt in bdict.items():
+            atts = attsiz(keyt)  # flag size in bits
+            if key[0:8] != "reserved":  # don't bother to set reserved bits
+                val = f"({{v}} >> {bfoffset})" if bfoffset else "{v}"
+                lines.append(f"d[{self._key(key)}] = {val} & {(1 << atts) - 1}")
+            bfoffset += atts
+        self._field(fmt, bsiz, lines)
+
+
+class _EncoderCompiler(_SourceCompiler):
+    """
+    Generates source code for the encoder function of a payload
+    definition, mirroring UBXMessage's attribute setting routines.
+
+    Each fixed section of the payload is packed with a single
+    precomputed struct.Struct and the packed sections are joined
+    once at the end, rather than the payload being extended one
+    attribute at a time.
+    """
+
+    PROLOGUE = ["def func(kw):", "    d = {}", "    p = []"]
+    EPILOGUE = ['    return (b"".join(p), d)']
+
+    def _flush(self):
+        """
+        Emit source code to pack pending fixed section of payload.
+        """
+
+        if not self._run:
+            return
+        fmt = "<" + "".join(fmt for fmt, _ in self._run)
+        sname = self._const_name(struct.Struct(fmt))
+        vals = ", ".join(val for _, val in self._run)
+        self._emit(f"p.append({sname}.pack({vals}))")
+        self._run = []
+
+    def _field(self, fmt: str, val: str):
+        """
+        Add field to pending fixed section of payload.
+
+        :param str fmt: struct format of field
+        :param str val: source expression for packed field value
+        """
+
+        self._run.append((fmt, val))
+
+    def _temp(self) -> str:
+        """
+        Name of temporary variable for next field in fixed section.
+
+        :return: variable name
+        :rtype: str
+        """
+
+        return f"v{len(self._run)}"
+
+    def _cfgval_group(self):
+        """
+        Configuration key value pairs cannot be set from keywords.
+
+        :raises: ValueError
+        """
+
+        raise ValueError("Configuration key value pairs require payload")
+
+    def _size_repeats(self, lengroup: int) -> str:
+        """
+        'Variable by size' repeating groups have no repeats when
+        the payload is constructed from keywords.
+
+        :param int lengroup: length of group in bytes
+        :return: None (no repeats)
+        :rtype: str
+        """
+
+        return None
+
+    def _group_start(self):
+        """
+        Emit source code preceding repeating group.
+        """
+
+        self._flush()
+
+    def _group_end(self):
+        """
+        Emit source code at end of each repeating group item.
+        """
+
+        self._flush()
+
+    def _single(self, anam: str, adef: object):
+        """
+        Compile single attribute, applying scaling where appropriate.
+
+        Values of the wrong type or size raise an exception, so that
+        UBXMessage reverts to its own attribute routines.
+
+        :param str anam: attribute name
+        :param object adef: attribute type e.g. 'U002', or list of
+            [attribute type, scaling factor]
+        :raises: ValueError (if attribute type cannot be compiled)
+        """
+        # pylint: disable=too-many-branches
+
+        ares = 1
+        if isinstance(adef, list):
+            ares = adef[1]  # attribute resolution (i.e. scaling factor)
+            adef = adef[0]  # attribute definition
+        if adef == CH:  # variable length string, depends on payload length
+            raise ValueError(f"Cannot compile attribute type {adef}")
+
+        atyp = adef[0]
+        asiz = attsiz(adef)
+        if atyp not in ATTTYPE:
+            raise ValueError(f"Unknown attribute type {adef}")
+        var = self._temp()
+        nom = f"[0] * {asiz}" if atyp == "A" else repr(nomval(adef))
+        self._emit(f"{var} = kw.get({self._key(anam)}, {nom})")
+        self._emit(self._store(anam, var))
+        val = var
+        if ares != 1:
+            val = f"int({var} / {self._const_name(ares)})"
+        else:
+            check = f"isinstance({var}, {self._const_name(ATTTYPE[atyp])})"
+            if atyp == "C":  # str or bytes
+                val = f"{var}b"
+                self._emit(
+                    f"{val} = {var}.encode('utf-8', 'backslashreplace') "
+                    f"if isinstance({var}, str) else {var}"
+                )
+                check = f"isinstance({val}, bytes) and len({val}) == {asiz}"
+            elif atyp == "X":
+                check += f" and len({var}) == {asiz}"
+            elif atyp == "A":  # array of unsigned integers
+                check += f" and len({var}) >= {asiz}"
+                val = f"bytes({var}[:{asiz}])"
+            self._emit(f"if not ({check}):")
+            self._emit("    raise TypeError")
+
+        if atyp in ("E", "I", "L", "U"):  # integer
+            fmt = INTFORMATS.get(asiz)
+            if fmt is None:
+                fmt = f"{asiz}s"
+                val = f'{val}.to_bytes({asiz}, "little", signed={atyp == "I"})'
+            elif atyp == "I":
+                fmt = fmt.lower()
+        elif atyp == "R":  # floating point
+            fmt = FLOATFORMATS[asiz]
+        else:  # bytes
+            fmt = f"{asiz}s"
+        self._field(fmt, val)
+
+    def _bitfield(self, btyp: str, bdict: dict):
+        """
+        Compile bitfield attribute (type 'X') from individual bit flags.
+
+        :param str btyp: bitfield type e.g. 'X002'
+        :param dict bdict: bitfield definition of flag names and types
+        """
+
+        bsiz = attsiz(btyp)
+        var = self._temp()
+        flags = ["0"]
+        bfoffset = 0
+        for i, (key, keyt) in enumerate(bdict.items()):
+            flag = f"{var}_{i}"
+            self._emit(f"{flag} = kw.get({self._key(key)}, 0)")
+            if key[0:8] != "reserved":  # don't bother to set reserved bits
+                self._emit(f"d[{self._key(key)}] = {flag}")
+            flags.append(f"({flag} << {bfoffset})")
+            bfoffset += attsiz(keyt)  # flag size in bits
+        self._emit(f"{var} = {' | '.join(flags)}")
+        fmt = INTFORMATS.get(bsiz)
+        val = var
+        if fmt is None:
+            fmt = f"{bsiz}s"
+            val = f'{var}.to_bytes({bsiz}, "little")'
+        self._field(fmt, val)
+
+
+def _getvalue(payload: bytes, offset: int, entry: tuple) -> object:
+    """
+    Decode individual attribute value from payload.
+
+    :param bytes payload: raw payload
+    :param int offset: offset of section containing attribute
+    :param tuple entry: tuple of (offset within section, struct.Struct,
+        conversion function or None)
+    :return: attribute value
+    :rtype: object
+    """
+
+    (off, fmt, conv) = entry
+    val = fmt.unpack_from(payload, offset + off)[0]
+    return val if conv is None else conv(val)
+
+
+def _scaled(conv: object, ares: float) -> object:
+    """
+    Conversion function applying scaling factor.
+
+    :param object conv: underlying conversion function or None
+    :param float ares: attribute resolution (i.e. scaling factor)
+    :return: conversion function
+    :rtype: function
+    """
+
+    if conv is None:
+        return lambda val: round(val * ares, SCALROUND)
+    return lambda val: round(conv(val) * ares, SCALROUND)
+
+
+def _flag(conv: object, shift: int, mask: int) -> object:
+    """
+    Conversion function extracting bit flag from bitfield.
+
+    :param object conv: underlying conversion function or None
+    :param int shift: flag offset in bits
+    :param int mask: flag mask
+    :return: conversion function
+    :rtype: function
+    """
+
+    if conv is None:
+        return lambda val: (val >> shift) & mask
+    return lambda val: (conv(val) >> shift) & mask
+
+
+class _AccessorCompiler(_Compiler):
+    """
+    Builds the accessor function of a payload definition, which
+    decodes individual attributes directly from their offsets in the
+    payload rather than decoding the whole payload.
+
+    Only definitions comprising fixed size attributes and at most one
+    (non-nested) repeating group can be compiled. The accessor only
+    decodes attributes from payloads whose length exactly matches the
+    definition, so its values always agree with the decoder's.
+    """
+
+    def __init__(self, pdict: dict, msg: bytes, msgmode: int, parsebitfield: bool):
+        """
+        Constructor.
+
+        :param dict pdict: payload definition
+        :param bytes msg: message class and id
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        """
+
+        super().__init__(pdict, msg, msgmode, parsebitfield)
+        # attributes before, within and after repeating group
+        self._sections = ({}, {}, {})
+        self._sizes = [0, 0, 0]
+        self._section = 0
+        self._count = None  # number of repeats of repeating group
+        self._hp = set()  # attributes with high precision component
+
+    def compile(self) -> object:
+        """
+        Compile payload definition to accessor function.
+
+        :return: accessor function
+        :rtype: function
+        :raises: ValueError (if definition cannot be compiled)
+        """
+
+        for anam, adef in self._pdict.items():
+            self._attribute(anam, adef)
+        for name in self._hp:  # combined value must be decoded in full
+            for section in self._sections:
+                section.pop(name, None)
+        (before, within, after) = self._sections
+        (lenbefore, lengroup, lenafter) = self._sizes
+        count = self._count
+        hpnames = frozenset(self._hp)
+        if count == "None" and (after or not lengroup):
+            raise ValueError("Cannot compile variable size group")
+
+        def access(payload: bytes, name: str) -> object:
+            if count is None:
+                numr = 0
+            elif count == "None":
+                numr = int((len(payload) - lenbefore) / lengroup)
+            elif isinstance(count, int):
+                numr = count
+            else:
+                numr = _getvalue(payload, 0, before[count])
+            if len(payload) != lenbefore + numr * lengroup + lenafter:
+                raise KeyError(name)
+            if name in hpnames:
+                raise KeyError(name)
+            entry = before.get(name)
+            if entry is not None:
+                return _getvalue(payload, 0, entry)
+            entry = after.get(name)
+            if entry is not None:
+                return _getvalue(payload, lenbefore + numr * lengroup, entry)
+            (base, _, idx) = name.rpartition("_")
+            entry = within.get(base)
+            if entry is None or not idx.isdigit():
+                raise AttributeError(name)
+            i = int(idx)
+            if not 0 < i <= numr or idx != f"{i:02d}":
+                raise AttributeError(name)
+            return _getvalue(payload, lenbefore + (i - 1) * lengroup, entry)
+
+        return access
+
+    def _add(self, anam: str, fmt: str, conv: object):
+        """
+        Add attribute to current section.
+
+        :param str anam: attribute name
+        :param str fmt: struct format of attribute
+        :param object conv: conversion function or None
+        """
+
+        section = self._section
+        if section != 1:
+            self.names.add(anam)
+        self._sections[section][anam] = (
+            self._sizes[section],
+            struct.Struct("<" + fmt),
+            conv,
+        )
+
+    def _group(self, anam: object, gdict: dict):
+        """
+        Compile repeating group of attributes.
+
+        :param object anam: number of repeats as int, 'None' if
+            variable by size, or name of attribute containing number
+            of repeats
+        :param dict gdict: group definition
+        :raises: ValueError (if group cannot be compiled)
+        """
+
+        if self._cfgval or self._esfmeas or self._section:
+            raise ValueError("Cannot compile repeating group")
+        if not (isinstance(anam, int) or anam == "None" or anam in self._sections[0]):
+            raise ValueError(f"Cannot compile repeating group {anam}")
+        self._count = anam
+        self._section = 1
+        for key, adef in gdict.items():
+            self._attribute(key, adef)
+        self._section = 2
+
+    def _single(self, anam: str, adef: object):
+        """
+        Compile single attribute, applying scaling where appropriate.
+
+        :param str anam: attribute name
+        :param object adef: attribute type e.g. 'U002', or list of
+            [attribute type, scaling factor]
+        :raises: ValueError (if attribute type cannot be compiled)
+        """
+
+        ares = 1
+        if isinstance(adef, list):
+            ares = adef[1]  # attribute resolution (i.e. scaling factor)
+            adef = adef[0]  # attribute definition
+        if adef == CH:  # variable length string, takes whole payload length
+            raise ValueError(f"Cannot compile attribute type {adef}")
+
+        atyp = adef[0]
+        asiz = attsiz(adef)
+        conv = None
+        if atyp in ("E", "I", "L", "U"):  # integer
+            fmt = INTFORMATS.get(asiz)
+            if fmt is None:
+                fmt = f"{asiz}s"
+                conv = partial(int.from_bytes, byteorder="little", signed=atyp == "I")
+            elif atyp == "I":
+                fmt = fmt.lower()
+        elif atyp == "R":  # floating point
+            fmt = FLOATFORMATS[asiz]
+        elif atyp in ("X", "C"):
+            fmt = f"{asiz}s"
+        elif atyp == "A":  # array of unsigned integers
+            fmt = f"{asiz}s"
+            conv = list
+        else:
+            raise ValueError(f"Unknown attribute type {adef}")
+        if ares != 1:
+            conv = _scaled(conv, ares)
+        if anam[0:3] == "_HP":  # high precision component of earlier attribute
+            self._hp.add(anam[3:])
+        else:
+            self._add(anam, fmt, conv)
+        self._sizes[self._section] += asiz
+
+    def _bitfield(self, btyp: str, bdict: dict):
+        """
+        Compile bitfield attribute (type 'X') to individual bit flags.
+
+        :param str btyp: bitfield type e.g. 'X002'
+        :param dict bdict: bitfield definition of flag names and types
+        """
+
+        bsiz = attsiz(btyp)
+        fmt = INTFORMATS.get(bsiz)
+        conv = None
+        if fmt is None:
+            fmt = f"{bsiz}s"
+            conv = partial(int.from_bytes, byteorder="little")
+        bfoffset = 0
+        for key, keyt in bdict.items():
+            atts = attsiz(keyt)  # flag size in bits
+            if key[0:8] != "reserved":  # reserved bits are not set
+                self._add(key, fmt, _flag(conv, bfoffset, (1 << atts) - 1))
+            bfoffset += atts
+        self._sizes[self._section] += bsiz
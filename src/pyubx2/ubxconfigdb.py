@@ -0,0 +1,465 @@
+"""
+ubxconfigdb.py
+
+Indexed configuration database.
+
+Forward (keyname to keyID) and reverse (keyID to keyname) indexes of
+the configuration database definitions in ubxtypes_configdb are built
+once on import, together with a precompiled struct for each key's value
+type, so that the configuration key value pairs in CFG-VALGET,
+CFG-VALSET and CFG-VALDEL messages are encoded and decoded with a
+single dictionary lookup per key rather than a scan of the definitions.
+Keyname patterns with a trailing wildcard (e.g. 'CFG_MSGOUT_UBX_NAV_*')
+are resolved via a prefix trie of keyname components.
+
+Configuration keyIDs are decomposed as follows:
+
+- bits 28..30: storage size of value (see UBX_CONFIG_STORSIZE)
+- bits 16..23: group ID e.g. 0x91 = CFG_MSGOUT
+- bits 0..11: item ID within group
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import struct
+
+from pyubx2.exceptions import UBXMessageError
+from pyubx2.ubxtypes_configdb import UBX_CONFIG_DATABASE, UBX_CONFIG_STORSIZE
+from pyubx2.ubxtypes_core import ATTTYPE
+
+KEYID = struct.Struct("<I")
+"""struct of configuration keyID"""
+VALFORMATS = {
+    "E001": "B",
+    "E002": "H",
+    "I001": "b",
+    "I002": "h",
+    "I004": "i",
+    "I008": "q",
+    "L001": "B",
+    "R004": "f",
+    "R008": "d",
+    "U001": "B",
+    "U002": "H",
+    "U004": "I",
+    "U008": "Q",
+}
+"""struct formats of configuration value types ('X' types are bytes)"""
+
+
+def _compile(att: str) -> struct.Struct:
+    """
+    Compile struct for configuration value type.
+
+    :param str att: value type e.g. 'U004'
+    :return: struct of value
+    :rtype: struct.Struct
+    """
+
+    return struct.Struct("<" + VALFORMATS.get(att, f"{int(att[1:])}s"))
+
+
+class ConfigDatabase:
+    """
+    Indexed configuration database.
+    """
+
+    def __init__(self, database: dict = None):
+        """
+        Constructor.
+
+        Indexes are rebuilt automatically if keys are subsequently
+        added to the database dictionary.
+
+        :param dict database: configuration database of keyname and
+            (keyID, type) e.g. UBX_CONFIG_DATABASE (None)
+        """
+
+        self._database = UBX_CONFIG_DATABASE if database is None else database
+        self._index()
+
+    def _index(self):
+        """
+        Build keyname, keyID and group indexes, and keyname trie.
+        """
+
+        structs = {}
+        keys = {}
+        trie = {}
+        names = {}
+        groups = {}
+        members = {}
+        for i, (name, (keyid, att)) in enumerate(self._database.items()):
+            if att not in structs:
+                structs[att] = _compile(att)
+            keys[name] = (keyid, att)
+            # where keyIDs are not unique, the first keyname is used
+            if keyid not in names:
+                names[keyid] = (name, att, structs[att])
+                members.setdefault(self.keygroup(keyid), []).append(keyid)
+            groups.setdefault(name.split("_")[1], self.keygroup(keyid))
+            node = trie
+            for token in name.split("_"):
+                node = node.setdefault(token, {})
+            node[None] = (i, name)  # keyname ends at this node
+        self._size = len(self._database)
+        self._structs = structs
+        self._undocumented = {}
+        self._keys = keys
+        self._names = names
+        self._groups = groups
+        self._members = {grp: sorted(keyids) for grp, keyids in members.items()}
+        self._trie = trie
+
+    def _refresh(self) -> bool:
+        """
+        Rebuild indexes if keys have been added to or removed from
+        the database dictionary.
+
+        :return: True if indexes were rebuilt
+        :rtype: bool
+        """
+
+        if len(self._database) == self._size:
+            return False
+        self._index()
+        return True
+
+    def __len__(self) -> int:
+        """
+        Number of configuration keys.
+
+        :return: number of keys
+        :rtype: int
+        """
+
+        return len(self._keys)
+
+    def __iter__(self) -> object:
+        """
+        Iterate over configuration keynames.
+
+        :return: iterator of keynames
+        :rtype: iterator
+        """
+
+        return iter(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check if configuration key is defined.
+
+        :param object key: keyname as str or keyID as int
+        :return: True if defined
+        :rtype: bool
+        """
+
+        if isinstance(key, str):
+            return key in self._keys or (self._refresh() and key in self._keys)
+        return key in self._names or (self._refresh() and key in self._names)
+
+    @property
+    def groups(self) -> dict:
+        """
+        Getter for configuration groups.
+
+        :return: dict of group name and group ID e.g. {'MSGOUT': 0x91, ...}
+        :rtype: dict
+        """
+
+        self._refresh()
+        return dict(self._groups)
+
+    def name2key(self, name: str) -> tuple:
+        """
+        Return keyID and type for given configuration keyname.
+
+        :param str name: keyname e.g. "CFG_NMEA_PROTVER"
+        :return: tuple of (keyID, type)
+        :rtype: tuple: (int, str)
+        :raises: UBXMessageError
+        """
+
+        val = self._keys.get(name)
+        if val is None:
+            if not self._refresh() or name not in self._keys:
+                raise UBXMessageError(f"Undefined configuration database key {name}")
+            val = self._keys[name]
+        return val
+
+    def key2name(self, keyid: int) -> tuple:
+        """
+        Return keyname and type for given configuration keyID.
+
+        Undocumented keys are named 'CFG_{hex keyID}' and their type is
+        derived from the storage size in the keyID.
+
+        :param int keyid: keyID e.g. 0x20930001
+        :return: tuple of (keyname, type)
+        :rtype: tuple: (str, str)
+        :raises: UBXMessageError
+        """
+
+        (name, att, _) = self._entry(keyid)
+        return (name, att)
+
+    def _entry(self, keyid: int) -> tuple:
+        """
+        Return index entry for given configuration keyID.
+
+        :param int keyid: keyID
+        :return: tuple of (keyname, type, struct of value)
+        :rtype: tuple
+        :raises: UBXMessageError
+        """
+
+        entry = self._names.get(keyid)
+        if entry is None:
+            entry = self._undocumented.get(keyid)
+            if entry is None:
+                if self._refresh() and keyid in self._names:
+                    return self._names[keyid]
+                try:
+                    att = f"X{UBX_CONFIG_STORSIZE[keyid >> 28]:03d}"
+                except KeyError as err:
+                    raise UBXMessageError(
+                        f"Invalid configuration database key {hex(keyid)}"
+                    ) from err
+                entry = self._undocumented[keyid] = (
+                    f"CFG_{hex(keyid)}",
+                    att,
+                    _compile(att),
+                )
+        return entry
+
+    def keyid(self, key: object) -> int:
+        """
+        Return keyID for given configuration key.
+
+        :param object key: keyname as str or keyID as int
+        :return: keyID
+        :rtype: int
+        :raises: UBXMessageError
+        """
+
+        if isinstance(key, str):
+            return self.name2key(key)[0]
+        return key
+
+    def group(self, group: object) -> list:
+        """
+        Return keynames in given configuration group, in keyID order.
+        Where keyIDs are not unique, only the first keyname is returned.
+
+        :param object group: group name as str e.g. "MSGOUT" or
+            "CFG_MSGOUT", or group ID as int e.g. 0x91
+        :return: list of keynames
+        :rtype: list
+        :raises: UBXMessageError
+        """
+
+        self._refresh()
+        if isinstance(group, str):
+            grp = self._groups.get(group[4:] if group[0:4] == "CFG_" else group)
+            if grp is None:
+                raise UBXMessageError(f"Undefined configuration group {group}")
+            group = grp
+        return [self._names[keyid][0] for keyid in self._members.get(group, [])]
+
+    def expand(self, pattern: str) -> list:
+        """
+        Return keynames matching keyname pattern, which may end with
+        a '*' wildcard e.g. "CFG_MSGOUT_UBX_NAV_*", "CFG_UART1*" or "*",
+        in database order.
+
+        :param str pattern: keyname or keyname pattern
+        :return: list of keynames
+        :rtype: list
+        :raises: UBXMessageError
+        """
+
+        self._refresh()
+        if pattern[-1:] != "*":
+            return [pattern] if pattern in self._keys else []
+        if "*" in pattern[:-1]:
+            raise UBXMessageError(f"Invalid configuration key pattern {pattern}")
+        tokens = pattern[:-1].split("_")
+        partial = tokens.pop()  # last, possibly incomplete, component
+        node = self._trie
+        for token in tokens:
+            node = node.get(token)
+            if node is None:
+                return []
+        names = []
+        stack = [
+            child
+            for token, child in reversed(node.items())
+            if token is not None and token.startswith(partial)
+        ]
+        while stack:
+            node = stack.pop()
+            if None in node:
+                names.append(node[None])
+            stack += [
+                child for token, child in reversed(node.items()) if token is not None
+            ]
+        return [name for (_, name) in sorted(names)]
+
+    def wildcard(self, group: object) -> int:
+        """
+        Return wildcard keyID for all keys in given configuration group
+        i.e. keyID of first key in group with bits 0..15 set to 0xffff.
+
+        :param object group: group name as str e.g. "MSGOUT" or
+            "CFG_MSGOUT", or group ID as int e.g. 0x91
+        :return: wildcard keyID e.g. 0x2091ffff
+        :rtype: int
+        :raises: UBXMessageError
+        """
+
+        names = self.group(group)
+        if not names:
+            raise UBXMessageError(f"Undefined configuration group {group}")
+        return self._keys[names[0]][0] | 0xFFFF
+
+    def encode_key(self, key: object) -> bytes:
+        """
+        Encode configuration key.
+
+        :param object key: keyname as str or keyID as int
+        :return: keyID as bytes
+        :rtype: bytes
+        :raises: UBXMessageError
+        """
+
+        try:
+            return KEYID.pack(self.keyid(key))
+        except struct.error as err:
+            raise UBXMessageError(f"Invalid configuration database key {key}") from err
+
+    def encode(self, key: object, val: object) -> bytes:
+        """
+        Encode configuration key value pair.
+
+        :param object key: keyname as str or keyID as int
+        :param object val: value e.g. 9600
+        :return: keyID and value as bytes
+        :rtype: bytes
+        :raises: UBXMessageError, TypeError, OverflowError
+        """
+
+        if isinstance(key, str):
+            (keyid, att) = self.name2key(key)
+            valst = self._structs[att]
+        else:
+            keyid = key
+            (_, att, valst) = self._entry(key)
+        if not isinstance(val, ATTTYPE[att[0]]):
+            raise TypeError(
+                f"Attribute type {att} value {val} must be {ATTTYPE[att[0]]}, not {type(val)}"
+            )
+        if att[0] == "X":  # bytes are encoded as is
+            return KEYID.pack(keyid) + val
+        try:
+            return KEYID.pack(keyid) + valst.pack(val)
+        except struct.error as err:
+            raise OverflowError(
+                f"Attribute type {att} value {val} out of range"
+            ) from err
+
+    def decode(self, payload: bytes, offset: int = 0, vals: dict = None) -> dict:
+        """
+        Decode configuration key value pairs.
+
+        :param bytes payload: payload
+        :param int offset: offset of first key in payload (0)
+        :param dict vals: dict to which key value pairs are added (None)
+        :return: dict of keyname and value
+        :rtype: dict
+        :raises: UBXMessageError
+        """
+
+        vals = {} if vals is None else vals
+        names = self._names
+        end = len(payload) - 4
+        while offset < end:
+            keyid = KEYID.unpack_from(payload, offset)[0]
+            entry = names.get(keyid)
+            if entry is None:
+                entry = self._entry(keyid)
+            (name, att, valst) = entry
+            offset += 4
+            if offset + valst.size <= len(payload):
+                vals[name] = valst.unpack_from(payload, offset)[0]
+            else:  # truncated value
+                vals[name] = self._truncated(payload[offset:], att, valst)
+            offset += valst.size
+        return vals
+
+    @staticmethod
+    def _truncated(valb: bytes, att: str, valst: struct.Struct) -> object:
+        """
+        Decode truncated configuration value, as per bytes2val().
+
+        :param bytes valb: truncated value
+        :param str att: value type
+        :param struct.Struct valst: struct of value
+        :return: value
+        :rtype: object
+        :raises: struct.error
+        """
+
+        if att[0] == "X":
+            return valb
+        if att[0] == "R":
+            return valst.unpack(valb)[0]
+        return int.from_bytes(valb, "little", signed=att[0] == "I")
+
+    @staticmethod
+    def keygroup(keyid: int) -> int:
+        """
+        Return group ID of configuration keyID.
+
+        :param int keyid: keyID e.g. 0x20910007
+        :return: group ID e.g. 0x91
+        :rtype: int
+        """
+
+        return (keyid >> 16) & 0xFF
+
+    @staticmethod
+    def keyitem(keyid: int) -> int:
+        """
+        Return item ID of configuration keyID within its group.
+
+        :param int keyid: keyID e.g. 0x20910007
+        :return: item ID e.g. 0x007
+        :rtype: int
+        """
+
+        return keyid & 0xFFF
+
+    @staticmethod
+    def keysize(keyid: int) -> int:
+        """
+        Return storage size of configuration value in bytes.
+
+        :param int keyid: keyID e.g. 0x20910007
+        :return: size in bytes e.g. 1
+        :rtype: int
+        :raises: UBXMessageError
+        """
+
+        try:
+            return UBX_CONFIG_STORSIZE[keyid >> 28]
+        except KeyError as err:
+            raise UBXMessageError(
+                f"Invalid configuration database key {hex(keyid)}"
+            ) from err
+
+
+UBX_CONFIGDB = ConfigDatabase()
+"""Indexed configuration database"""
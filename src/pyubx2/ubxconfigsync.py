@@ -0,0 +1,403 @@
+"""
+ubxconfigsync.py
+
+Configuration polling, comparison and synchronisation.
+
+Polls a receiver's configuration with CFG-VALGET, expanding keyname
+patterns (e.g. 'CFG_MSGOUT_UBX_NAV_*') and paging through wildcard
+queries with the 'position' parameter, compares it with a
+desired configuration profile and constructs the minimum sequence of
+CFG-VALSET and CFG-VALDEL messages needed to apply the profile, so
+that only keys whose values differ are sent to the receiver.
+
+Usage::
+
+    with Serial(port, 38400, timeout=0.1) as stream:
+        ubr = UBXReader(stream, protfilter=UBX_PROTOCOL)
+        profile = {"CFG_UART1_BAUDRATE": 115200, "CFG_RATE_MEAS": 100}
+        sent = config_sync(ubr, profile, SET_LAYER_RAM | SET_LAYER_FLASH)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from time import monotonic
+
+from pyubx2.exceptions import UBXMessageError, UBXStreamError
+from pyubx2.ubxconfigdb import UBX_CONFIGDB
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxtypes_configdb import (
+    POLL_LAYER_BBR,
+    POLL_LAYER_DEFAULT,
+    POLL_LAYER_FLASH,
+    POLL_LAYER_RAM,
+    SET_LAYER_BBR,
+    SET_LAYER_FLASH,
+    SET_LAYER_RAM,
+    TXN_COMMIT,
+    TXN_NONE,
+    TXN_ONGOING,
+    TXN_START,
+)
+from pyubx2.ubxtypes_core import GET
+
+TIMEOUT = 3
+"""default time in seconds to wait for each receiver response"""
+MAXKEYS = 64
+"""maximum number of keys in CFG-VALGET, CFG-VALSET or CFG-VALDEL message"""
+WILDCARD = 0xFFFF
+"""bits 0..15 of keyID denoting all items in group"""
+POLL_LAYERS = {
+    SET_LAYER_RAM: POLL_LAYER_RAM,
+    SET_LAYER_BBR: POLL_LAYER_BBR,
+    SET_LAYER_FLASH: POLL_LAYER_FLASH,
+}
+"""CFG-VALGET memory layer for each CFG-VALSET memory layer"""
+VALGET = b"\x06\x8b"
+"""CFG-VALGET message class and id"""
+
+
+def config_iter(
+    ubr: object, keys: list, layer: int = POLL_LAYER_RAM, timeout: float = TIMEOUT
+) -> object:
+    """
+    Poll configuration values from receiver, yielding the values in
+    each CFG-VALGET response as it is received.
+
+    Keys can be keyIDs, keynames or keyname patterns ending with a '*'
+    wildcard (e.g. "CFG_MSGOUT_UBX_NAV_*"). Patterns covering a whole
+    configuration group (e.g. "CFG_MSGOUT_*") are polled as keyID
+    wildcards (bits 0..15 of keyID = 0xffff e.g. 0x2091ffff), as are
+    "*" and "CFG_*" (the whole configuration database). Other patterns
+    are expanded to the matching keynames.
+
+    Keys are polled up to 64 at a time. Where keys include keyID
+    wildcards, further pages of results are polled using the 'position'
+    parameter until the receiver returns fewer than 64 values. Any
+    other messages received in the meantime are discarded. Keys which
+    are not stored in the polled layer are absent from the results.
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param list keys: keys as int (keyID) or str (keyname or keyname pattern)
+    :param int layer: memory layer POLL_LAYER_RAM (0) = RAM,
+        POLL_LAYER_BBR (1) = Battery-backed RAM, POLL_LAYER_FLASH (2) = Flash,
+        POLL_LAYER_DEFAULT (7) = Default
+    :param float timeout: time in seconds to wait for each response (3)
+    :return: iterator of dicts of keyname and value
+    :rtype: iterator
+    :raises: UBXMessageError, UBXStreamError
+    """
+
+    keyids = _keyids(keys)
+    for i in range(0, len(keyids), MAXKEYS):
+        chunk = keyids[i : i + MAXKEYS]
+        paged = any(keyid & WILDCARD == WILDCARD for keyid in chunk)
+        position = 0
+        while True:
+            page = _poll(ubr, layer, position, chunk, timeout)
+            if page is None:  # nothing (more) found
+                break
+            yield page
+            if not paged or len(page) < MAXKEYS:
+                break
+            position += MAXKEYS
+
+
+def config_get(
+    ubr: object, keys: list, layer: int = POLL_LAYER_RAM, timeout: float = TIMEOUT
+) -> dict:
+    """
+    Poll configuration values from receiver (see config_iter()).
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param list keys: keys as int (keyID) or str (keyname or keyname pattern)
+    :param int layer: memory layer POLL_LAYER_RAM (0) = RAM,
+        POLL_LAYER_BBR (1) = Battery-backed RAM, POLL_LAYER_FLASH (2) = Flash,
+        POLL_LAYER_DEFAULT (7) = Default
+    :param float timeout: time in seconds to wait for each response (3)
+    :return: dict of keyname and value
+    :rtype: dict
+    :raises: UBXMessageError, UBXStreamError
+    """
+
+    vals = {}
+    for page in config_iter(ubr, keys, layer, timeout):
+        vals.update(page)
+    return vals
+
+
+def config_diff(desired: dict, current: dict, layers: int = SET_LAYER_RAM) -> list:
+    """
+    Construct the minimum sequence of CFG-VALSET and CFG-VALDEL
+    messages needed to apply desired configuration to memory layer(s).
+
+    Values are compared in encoded form. A key is set in the RAM layer
+    if its current value differs. A key is set in the BBR or Flash
+    layer if its effective value in that layer (i.e. its stored value
+    or, if not stored, the value it reverts to - the Flash value for
+    BBR, the default value for Flash) differs, unless the value it
+    reverts to matches, in which case the stored value is deleted
+    instead. Keys which require the same memory layers are combined
+    into the same messages.
+
+    :param dict desired: desired configuration as dict of keyname and value
+    :param dict current: current configuration as dict of CFG-VALGET
+        memory layer and dict of keyname and value e.g.
+        {POLL_LAYER_RAM: {...}, POLL_LAYER_FLASH: {...}, POLL_LAYER_DEFAULT: {...}},
+        as returned by config_get(); missing layers are treated as empty
+    :param int layers: memory layer(s) SET_LAYER_RAM (1) = RAM,
+        SET_LAYER_BBR (2) = Battery Backed RAM, SETLAYER_FLASH (4) = Flash
+    :return: list of UBXMessage CFG-VALSET and CFG-VALDEL
+    :rtype: list
+    :raises: UBXMessageError, TypeError, OverflowError
+    """
+
+    stored = tuple(
+        _encoded(current.get(layer, {}), desired)
+        for layer in (
+            POLL_LAYER_RAM,
+            POLL_LAYER_BBR,
+            POLL_LAYER_FLASH,
+            POLL_LAYER_DEFAULT,
+        )
+    )
+    sets = {}
+    dels = {}
+    for name, val in desired.items():
+        (setmask, delmask) = _masks(
+            name, UBX_CONFIGDB.encode(name, val), layers, stored
+        )
+        if setmask:
+            sets.setdefault(setmask, []).append((name, val))
+        if delmask:
+            dels.setdefault(delmask, []).append(name)
+
+    msgs = []
+    for mask, cfgdata in sets.items():
+        msgs += UBXMessage.config_set_batch(mask, cfgdata)
+    for mask, keys in dels.items():
+        msgs += _deletes(mask, keys)
+    return msgs
+
+
+def config_sync(
+    ubr: object, desired: dict, layers: int = SET_LAYER_RAM, timeout: float = TIMEOUT
+) -> list:
+    """
+    Poll receiver's current configuration of the keys in the desired
+    configuration, and send only those CFG-VALSET and CFG-VALDEL
+    messages needed to apply the desired configuration to memory layer(s)
+    (see config_diff()). Each message is acknowledged by the receiver
+    before the next is sent.
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param dict desired: desired configuration as dict of keyname and value
+    :param int layers: memory layer(s) SET_LAYER_RAM (1) = RAM,
+        SET_LAYER_BBR (2) = Battery Backed RAM, SETLAYER_FLASH (4) = Flash
+    :param float timeout: time in seconds to wait for each response (3)
+    :return: list of UBXMessage CFG-VALSET and CFG-VALDEL sent
+    :rtype: list
+    :raises: UBXMessageError, UBXStreamError
+    """
+
+    polls = [poll for layer, poll in POLL_LAYERS.items() if layers & layer]
+    if layers & (SET_LAYER_BBR | SET_LAYER_FLASH):
+        polls += [POLL_LAYER_FLASH, POLL_LAYER_DEFAULT]
+    keys = list(desired)
+    current = {
+        layer: config_get(ubr, keys, layer, timeout) for layer in dict.fromkeys(polls)
+    }
+    msgs = config_diff(desired, current, layers)
+    for msg in msgs:
+        _send(ubr, msg, timeout)
+    return msgs
+
+
+def _keyids(keys: list) -> list:
+    """
+    Resolve keys and keyname patterns to keyIDs.
+
+    :param list keys: keys as int (keyID) or str (keyname or keyname pattern)
+    :return: list of unique keyIDs
+    :rtype: list
+    :raises: UBXMessageError
+    """
+
+    groups = UBX_CONFIGDB.groups
+    keyids = {}
+    for key in keys:
+        if isinstance(key, str) and key[-1:] == "*":
+            if key in ("*", "CFG_*"):
+                grps = list(groups.values())
+            elif key[0:4] == "CFG_" and key[-2:] == "_*" and key[4:-2] in groups:
+                grps = [groups[key[4:-2]]]
+            else:
+                grps = []
+                names = UBX_CONFIGDB.expand(key)
+                if not names:
+                    raise UBXMessageError(f"No configuration keys match {key}")
+                keyids.update(dict.fromkeys(UBX_CONFIGDB.keyid(name) for name in names))
+            keyids.update(dict.fromkeys(UBX_CONFIGDB.wildcard(grp) for grp in grps))
+        else:
+            keyids[UBX_CONFIGDB.keyid(key)] = None
+    return list(keyids)
+
+
+def _encoded(vals: dict, names: dict) -> dict:
+    """
+    Encode configuration values for comparison.
+
+    :param dict vals: dict of keyname and value
+    :param dict names: keynames to be encoded
+    :return: dict of keyname and encoded key value pair
+    :rtype: dict
+    """
+
+    return {
+        name: UBX_CONFIGDB.encode(name, val)
+        for name, val in vals.items()
+        if name in names
+    }
+
+
+def _masks(name: str, valb: bytes, layers: int, stored: tuple) -> tuple:
+    """
+    Memory layers in which key must be set or deleted (see config_diff()).
+
+    :param str name: keyname
+    :param bytes valb: desired encoded key value pair
+    :param int layers: memory layer(s) to be configured
+    :param tuple stored: dicts of keyname and encoded key value pair stored
+        in RAM, BBR, Flash and Default layers
+    :return: tuple of (set layers, delete layers)
+    :rtype: tuple
+    """
+
+    (ram, bbr, flash, dflt) = stored
+    setmask = delmask = 0
+    if layers & SET_LAYER_RAM and ram.get(name) != valb:
+        setmask |= SET_LAYER_RAM
+    # value restored from Flash or Default layer if not stored in Flash
+    if layers & SET_LAYER_FLASH:
+        revert = dflt.get(name)
+        if flash.get(name, revert) != valb:
+            if name in flash and revert == valb:
+                delmask |= SET_LAYER_FLASH
+            else:
+                setmask |= SET_LAYER_FLASH
+        revert = valb
+    else:
+        revert = flash.get(name, dflt.get(name))
+    if layers & SET_LAYER_BBR and bbr.get(name, revert) != valb:
+        if name in bbr and revert == valb:
+            delmask |= SET_LAYER_BBR
+        else:
+            setmask |= SET_LAYER_BBR
+    return (setmask, delmask)
+
+
+def _deletes(layers: int, keys: list) -> list:
+    """
+    Construct CFG-VALDEL messages deleting keys from memory layer(s),
+    up to 64 keys per message, as a single transaction if more than one
+    message is needed.
+
+    :param int layers: memory layer(s)
+    :param list keys: keynames
+    :return: list of UBXMessage CFG-VALDEL
+    :rtype: list
+    """
+
+    txns = _transactions((len(keys) + MAXKEYS - 1) // MAXKEYS)
+    return [
+        UBXMessage.config_del(layers, txn, keys[i * MAXKEYS : (i + 1) * MAXKEYS])
+        for i, txn in enumerate(txns)
+    ]
+
+
+def _transactions(num: int) -> list:
+    """
+    Transaction of each message in a sequence of messages.
+
+    :param int num: number of messages
+    :return: list of transactions
+    :rtype: list
+    """
+
+    if num <= 1:
+        return [TXN_NONE] * num
+    return [TXN_START] + [TXN_ONGOING] * (num - 2) + [TXN_COMMIT]
+
+
+def _poll(ubr: object, layer: int, position: int, keyids: list, timeout: float):
+    """
+    Poll page of configuration values and wait for response.
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param int layer: memory layer
+    :param int position: number of values to skip
+    :param list keyids: keyIDs
+    :param float timeout: time in seconds to wait for response
+    :return: dict of keyname and value, or None if receiver has no values
+    :rtype: dict
+    :raises: UBXStreamError
+    """
+
+    def response(parsed: object) -> object:
+        if parsed.identity == "CFG-VALGET" and parsed.msgmode == GET:
+            if (parsed.layer, parsed.position) == (layer, position):
+                return UBX_CONFIGDB.decode(parsed.payload, 4)
+        elif parsed.identity == "ACK-NAK" and parsed.payload == VALGET:
+            return False
+        return None
+
+    ubr.datastream.write(UBXMessage.config_poll(layer, position, keyids).serialize())
+    return _await(ubr, response, timeout, "CFG-VALGET") or None
+
+
+def _send(ubr: object, msg: object, timeout: float):
+    """
+    Send CFG-VALSET or CFG-VALDEL message and wait for acknowledgement.
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param UBXMessage msg: message
+    :param float timeout: time in seconds to wait for acknowledgement
+    :raises: UBXStreamError if message is rejected or not acknowledged
+    """
+
+    msgid = msg.msg_cls + msg.msg_id
+
+    def response(parsed: object) -> object:
+        if parsed.identity in ("ACK-ACK", "ACK-NAK") and parsed.payload == msgid:
+            return parsed.identity
+        return None
+
+    ubr.datastream.write(msg.serialize())
+    if _await(ubr, response, timeout, msg.identity) == "ACK-NAK":
+        raise UBXStreamError(f"{msg.identity} rejected by receiver {msg}")
+
+
+def _await(ubr: object, response: object, timeout: float, identity: str) -> object:
+    """
+    Read messages until a response is received.
+
+    :param UBXReader ubr: UBXReader on receiver stream
+    :param function response: function returning response from parsed
+        message, or None if message is not the response
+    :param float timeout: time in seconds to wait for response
+    :param str identity: identity of message awaiting response
+    :return: response
+    :rtype: object
+    :raises: UBXStreamError if no response within timeout
+    """
+
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        (_, parsed) = ubr.read()
+        if getattr(parsed, "identity", None) is not None:
+            res = response(parsed)
+            if res is not None:
+                return res
+    raise UBXStreamError(f"Timed out waiting for {identity} response")
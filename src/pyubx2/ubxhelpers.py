@@ -9,14 +9,16 @@ Created on 15 Dec 2020
 :license: BSD 3-Clause
 """
 
+import re
 import struct
 from datetime import datetime, timedelta
+from itertools import accumulate, islice
 from math import cos, pi, sin, trunc
 
 from pynmeagps.nmeatypes_core import NMEA_HDR
+from pyrtcm.rtcmhelpers import calc_crc24q
 
 import pyubx2.exceptions as ube
-import pyubx2.ubxtypes_configdb as ubcdb
 import pyubx2.ubxtypes_core as ubt
 from pyubx2.ubxtypes_core import (
     ATTTYPE,
@@ -27,11 +29,40 @@ from pyubx2.ubxtypes_core import (
     UBX_HDR,
     UBX_PROTOCOL,
 )
+from pyubx2.ubxconfigdb import UBX_CONFIGDB
+from pyubx2.ubxregistry import UBX_CLASS_KEYS, UBX_MSGID_KEYS
 from pyubx2.ubxtypes_decodes import FIXTYPE, GNSSLIST
 
 EPOCH0 = datetime(1980, 1, 6)  # EPOCH start date
 LEAPOFFSET = 18  # leap year offset in seconds, valid as from 1/1/2017
 SIW = 604800  # seconds in week = 3600*24*7
+SYNCBYTES = re.compile(b"[\xb5\x24\xd3]")  # first byte of UBX, NMEA or RTCM3 header
+LINEEND = re.compile(b"\x0a")  # NMEA line terminator
+CKSUM_NUMPY = 256  # minimum content length for which numpy checksum is used
+CKSUM_SPAN = 1 << 20  # maximum span of buffer summed in one numpy batch
+SPLIT_BATCH = 1024  # number of frames validated in one split_frames() batch
+POLL_KEYS = frozenset(
+    (b"\x06\x01", b"\x06\x02", b"\x06\x03", b"\x06\x31")
+)  # input messages which are polls if payload is no more than 2 bytes
+
+_NUMPY = []  # numpy module, or None if not installed (imported on first use)
+
+
+def _numpy() -> object:
+    """
+    Get optional numpy module, importing it on first use.
+
+    :return: numpy module, or None if numpy is not installed
+    :rtype: object
+    """
+
+    if not _NUMPY:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            numpy = None
+        _NUMPY.append(numpy)
+    return _NUMPY[0]
 
 
 def att2idx(att: str) -> object:
@@ -75,22 +106,24 @@ def calc_checksum(content: bytes) -> bytes:
     """
     Calculate checksum using 8-bit Fletcher's algorithm.
 
+    check_a is the sum of the content bytes and check_b the sum of the
+    running values of check_a, both modulo 256. The running sums are
+    calculated using numpy if installed and the content is large,
+    otherwise using itertools.accumulate.
+
     :param bytes content: message content, excluding header and checksum bytes
+        (bytes, bytearray or memoryview)
     :return: checksum
     :rtype: bytes
 
     """
 
-    check_a = 0
-    check_b = 0
-
-    for char in content:
-        check_a += char
-        check_a &= 0xFF
-        check_b += check_a
-        check_b &= 0xFF
-
-    return bytes((check_a, check_b))
+    if len(content) >= CKSUM_NUMPY:
+        np = _numpy()
+        if np is not None:
+            sums = np.cumsum(np.frombuffer(content, np.uint8), dtype=np.uint16)
+            return bytes((int(sums[-1]) & 0xFF, int(sums.sum()) & 0xFF))
+    return bytes((sum(content) & 0xFF, sum(accumulate(content)) & 0xFF))
 
 
 def isvalid_checksum(message: bytes) -> bool:
@@ -108,6 +141,88 @@ def isvalid_checksum(message: bytes) -> bool:
     return ckm == calc_checksum(message[2 : lenm - 2])
 
 
+def isvalid_checksums(buf: object, offsets: object) -> list:
+    """
+    Validate checksums of a batch of UBX messages in a buffer.
+
+    The length of each message is taken from its header. If numpy is
+    installed, the checksums of all the messages are calculated together
+    from cumulative sums over the buffer; otherwise each checksum is
+    calculated from a memoryview of the message, without copying it.
+
+    :param object buf: buffer as bytes, bytearray, memoryview or mmap
+    :param object offsets: offset of each message in buffer
+    :return: list of checksum valid flags (False if message extends
+        beyond end of buffer)
+    :rtype: list
+    """
+
+    np = _numpy()
+    if np is not None:
+        return _isvalid_checksums_numpy(np, buf, offsets)
+    valid = []
+    with memoryview(buf) as mvw:
+        lenb = len(mvw)
+        for start in offsets:
+            end = start + 8
+            if 0 <= start and end - 2 <= lenb:
+                end += mvw[start + 4] | (mvw[start + 5] << 8)
+            valid.append(
+                end <= lenb
+                and calc_checksum(mvw[start + 2 : end - 2]) == mvw[end - 2 : end]
+            )
+    return valid
+
+
+def _isvalid_checksums_numpy(np: object, buf: object, offsets: object) -> list:
+    """
+    Validate checksums of a batch of UBX messages in a buffer using numpy.
+
+    For content bytes c[s:e], check_a = S[e] - S[s] and
+    check_b = T[e + 1] - T[s + 1] - (e - s) * S[s], where S and T are the
+    cumulative sums of c and S. Sums are unsigned 16-bit integers, whose
+    wraparound does not affect the result modulo 256.
+
+    :param object np: numpy module
+    :param object buf: buffer as bytes, bytearray, memoryview or mmap
+    :param object offsets: offset of each message in buffer
+    :return: list of checksum valid flags
+    :rtype: list
+    """
+    # pylint: disable=too-many-locals
+
+    arr = np.frombuffer(buf, np.uint8)
+    lenb = len(arr)
+    starts = np.asarray(offsets, dtype=np.int64).reshape(-1)
+    valid = np.zeros(len(starts), dtype=bool)
+    ends = starts + 8
+    hdr = (starts >= 0) & (ends - 2 <= lenb)
+    idx = starts[hdr]
+    ends[hdr] += arr[idx + 4].astype(np.int64) | (arr[idx + 5].astype(np.int64) << 8)
+    order = np.flatnonzero(hdr & (ends <= lenb))
+    order = order[np.argsort(starts[order], kind="stable")]
+    starts = starts[order]
+    ends = ends[order]
+    i = 0
+    while i < len(order):  # sum spans of at most CKSUM_SPAN bytes at a time
+        lo = starts[i]
+        j = max(int(np.searchsorted(starts, lo + CKSUM_SPAN)), i + 1)
+        seg = arr[lo : ends[i:j].max()]
+        sums = np.zeros(len(seg) + 1, dtype=np.uint16)
+        np.cumsum(seg, dtype=np.uint16, out=sums[1:])
+        sums2 = np.zeros(len(seg) + 2, dtype=np.uint16)
+        np.cumsum(sums, out=sums2[1:])
+        cst = starts[i:j] - lo + 2  # start and end of checksummed content
+        cen = ends[i:j] - lo - 2
+        check_a = (sums[cen] - sums[cst]) & 0xFF
+        check_b = (
+            sums2[cen + 1] - sums2[cst + 1] - (cen - cst).astype(np.uint16) * sums[cst]
+        ) & 0xFF
+        valid[order[i:j]] = (check_a == seg[cen]) & (check_b == seg[cen + 1])
+        i = j
+    return valid.tolist()
+
+
 def atttyp(att: str) -> str:
     """
     Helper function to return attribute type as string.
@@ -382,10 +497,7 @@ def msgstr2bytes(msgclass: str, msgid: str) -> bytes:
     """
 
     try:
-        return (
-            key_from_val(ubt.UBX_CLASSES, msgclass),
-            key_from_val(ubt.UBX_MSGIDS, msgid)[1:2],
-        )
+        return (UBX_CLASS_KEYS[msgclass], UBX_MSGID_KEYS[msgid][1:2])
     except KeyError as err:
         raise ube.UBXMessageError(
             f"Undefined message, class {msgclass}, id {msgid}"
@@ -403,12 +515,7 @@ def cfgname2key(name: str) -> tuple:
     :raises: UBXMessageError
 
     """
-    try:
-        return ubcdb.UBX_CONFIG_DATABASE[name]
-    except KeyError as err:
-        raise ube.UBXMessageError(
-            f"Undefined configuration database key {name}"
-        ) from err
+    return UBX_CONFIGDB.name2key(name)
 
 
 def cfgkey2name(keyid: int) -> tuple:
@@ -423,35 +530,19 @@ def cfgkey2name(keyid: int) -> tuple:
 
     """
 
-    try:
-        val = None
-        for key, val in ubcdb.UBX_CONFIG_DATABASE.items():
-            (kid, typ) = val
-            if keyid == kid:
-                return (key, typ)
-
-        # undocumented configuration database key
-        # type is derived from keyID
-        key = f"CFG_{hex(keyid)}"
-        typ = f"X{ubcdb.UBX_CONFIG_STORSIZE[int(hex(keyid)[2:3])]:03d}"
-        return (key, typ)
-
-    except KeyError as err:
-        raise ube.UBXMessageError(
-            f"Invalid configuration database key {hex(keyid)}"
-        ) from err
+    return UBX_CONFIGDB.key2name(keyid)
 
 
 def protocol(raw: bytes) -> int:
     """
     Gets protocol of raw message.
 
-    :param bytes raw: raw (binary) message
+    :param bytes raw: raw (binary) message (bytes, bytearray, memoryview or mmap)
     :return: protocol type (1 = NMEA, 2 = UBX, 4 = RTCM3, 0 = unknown)
     :rtype: int
     """
 
-    p = raw[0:2]
+    p = bytes(raw[0:2])
     if p == UBX_HDR:
         return UBX_PROTOCOL
     if p in NMEA_HDR:
@@ -461,6 +552,148 @@ def protocol(raw: bytes) -> int:
     return 0
 
 
+def locate_frame(buf: object, start: int) -> tuple:
+    """
+    Locate end of UBX, NMEA or RTCM3 frame whose header starts at given
+    offset in buffer, without validating its checksum.
+
+    An NMEA header which is not followed by an LF terminator within
+    NMEA_MAXLEN bytes is not treated as a recognised header.
+
+    :param object buf: buffer (bytes, bytearray, memoryview or mmap)
+    :param int start: offset of first byte of frame header
+    :return: tuple of (protocol, end offset), where protocol is
+        1 = NMEA, 2 = UBX, 4 = RTCM3 or 0 = header not recognised (in
+        which case end offset is that of the 2-byte header), or None if
+        buffer holds incomplete frame
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-return-statements
+
+    lenb = len(buf)
+    if lenb - start < 2:
+        return None
+    prot = protocol(buf[start : start + 2])
+    if prot == UBX_PROTOCOL:
+        if lenb - start < 6:
+            return None
+        end = start + 8 + (buf[start + 4] | (buf[start + 5] << 8))
+    elif prot == RTCM3_PROTOCOL:
+        if lenb - start < 3:
+            return None
+        end = start + 6 + (buf[start + 2] | (buf[start + 1] << 8))
+    elif prot == NMEA_PROTOCOL:
+        term = LINEEND.search(buf, start + 2, start + ubt.NMEA_MAXLEN)
+        if term is None:
+            return None if lenb - start < ubt.NMEA_MAXLEN else (0, start + 2)
+        end = term.end()
+    else:
+        return (0, start + 2)
+    if end > lenb:
+        return None
+    return (prot, end)
+
+
+def isvalid_frame(buf: object, start: int, end: int, prot: int) -> bool:
+    """
+    Validate checksum of UBX or NMEA frame, or CRC of RTCM3 frame, in buffer.
+
+    NMEA checksums are compared case-insensitively.
+
+    :param object buf: buffer (bytes, bytearray, memoryview or mmap)
+    :param int start: offset of frame in buffer
+    :param int end: offset of end of frame in buffer
+    :param int prot: protocol of frame (1 = NMEA, 2 = UBX, 4 = RTCM3)
+    :return: True if checksum is valid, False if not
+    :rtype: bool
+    """
+
+    if prot == UBX_PROTOCOL:
+        return isvalid_checksum(buf[start:end])
+    if prot == RTCM3_PROTOCOL:
+        return calc_crc24q(bytes(buf[start:end])) == 0
+    line = bytes(buf[start:end])
+    star = line.rfind(b"*")
+    if star == -1:
+        return False
+    cksum = 0
+    for char in line[1:star]:
+        cksum ^= char
+    return line[star + 1 : star + 3].upper() == f"{cksum:02X}".encode()
+
+
+def split_frames(buf: object, validate: int = ubt.VALCKSUM) -> object:
+    """
+    Locate each UBX, NMEA and RTCM3 frame in a buffer, and validate
+    its checksum, without parsing it.
+
+    Bytes which are not part of a recognised frame are skipped (see
+    locate_frame()). Any incomplete frame at the end of the buffer is
+    not returned; it starts at the end of the last frame returned (or
+    at 0 if none).
+
+    Frames are located in batches, and the UBX checksums in each batch
+    validated together (see isvalid_checksums()). The buffer must not
+    be resized while the iterator is in use.
+
+    :param object buf: buffer as bytes, bytearray or memoryview
+    :param int validate: VALCKSUM (1) = validate checksums,
+        VALNONE (0) = don't validate checksums (1)
+    :return: iterator of (protocol, offset, length, valid) tuples, where
+        protocol is 1 = NMEA, 2 = UBX, 4 = RTCM3 and valid is True if the
+        frame's checksum (or CRC) is valid, False if not, or None if
+        checksums are not validated
+    :rtype: iterator
+    """
+
+    validate = validate & ubt.VALCKSUM
+    with memoryview(buf) as mvw:
+        frames = _locate_frames(mvw, validate)
+        while True:
+            batch = list(islice(frames, SPLIT_BATCH))
+            if not batch:
+                return
+            if validate:
+                ubx = [i for i, frame in enumerate(batch) if frame[0] == UBX_PROTOCOL]
+                valid = isvalid_checksums(mvw, [batch[i][1] for i in ubx])
+                for i, ok in zip(ubx, valid):
+                    batch[i] = batch[i][0:3] + (ok,)
+            yield from batch
+
+
+def _locate_frames(mvw: memoryview, validate: int) -> object:
+    """
+    Locate each UBX, NMEA and RTCM3 frame in a buffer (see split_frames()),
+    validating NMEA checksums and RTCM3 CRCs but not UBX checksums.
+
+    :param memoryview mvw: buffer
+    :param int validate: VALCKSUM (1) = validate checksums,
+        VALNONE (0) = don't validate checksums
+    :return: iterator of (protocol, offset, length, valid) tuples, where
+        valid is None for UBX frames
+    :rtype: iterator
+    """
+
+    pos = 0
+    while True:
+        sync = SYNCBYTES.search(mvw, pos)
+        if sync is None:
+            return
+        start = sync.start()
+        frame = locate_frame(mvw, start)
+        if frame is None:
+            return
+        (prot, end) = frame
+        if not prot:  # not a recognised header
+            pos = start + 1
+            continue
+        valid = None
+        if validate and prot != UBX_PROTOCOL:
+            valid = isvalid_frame(mvw, start, end, prot)
+        yield (prot, start, end - start, valid)
+        pos = end
+
+
 def hextable(raw: bytes, cols: int = 8) -> str:
     """
     Formats raw (binary) message in tabular hexadecimal format e.g.
@@ -547,17 +780,8 @@ def getinputmode(data: bytes) -> int:
 
     if (
         len(data) == 8
-        or data[2:4] == b"\x06\x8b"  # CFG-VALGET
-        or (
-            data[2:4]
-            in (
-                b"\x06\x01",
-                b"\x06\x02",
-                b"\x06\x03",
-                b"\x06\x31",
-            )  # CFG-INF, CFG-MSG, CFG-PRT, CFG-TP5
-            and len(data) <= 10
-        )
+        or data[2:4] == UBX_MSGID_KEYS["CFG-VALGET"]
+        or (data[2:4] in POLL_KEYS and len(data) <= 10)
     ):
         return POLL
     return SET
@@ -0,0 +1,204 @@
+"""
+ubxlazymessage.py
+
+LazyUBXMessage class.
+
+A UBXMessage whose payload attributes are decoded on demand rather
+than on instantiation. The message retains its raw payload and
+decodes an individual attribute (e.g. 'svId_05') directly from its
+offset in the payload on first access, so the cost of parsing
+scales with the attributes actually used rather than with the
+size of the payload.
+
+The complete payload is decoded when the message's attributes are
+used collectively (e.g. via str() or __dict__), or when an attribute
+cannot be decoded individually, after which the message behaves as
+an ordinary UBXMessage. Any error in the payload is therefore raised
+on first access rather than on instantiation.
+
+Alternatively, the message can be projected onto a subset of its
+attributes, after which it is an ordinary UBXMessage containing
+only those attributes.
+
+Because the message changes its own state on first access, a lazily
+decoded message should not be accessed concurrently from multiple
+threads until it has been fully decoded. Ordinary UBXMessage objects
+are immutable once instantiated and may be shared freely.
+
+Usage::
+
+    msg = UBXReader.parse(raw, lazy=True)
+    print(msg.numSvs, msg.svId_05)
+
+    msg = UBXReader.parse(raw, fields=["iTOW", "lat", "lon"])
+    print(msg)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from pyubx2.ubxcodec import CODEC_ERRORS, get_accessor
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxregistry import msg_identity
+
+
+class LazyUBXMessage(UBXMessage):
+    """
+    Lazily decoded UBX Message Class.
+    """
+
+    def __init__(
+        self,
+        ubxClass: bytes,
+        ubxID: bytes,
+        msgmode: int,
+        payload: bytes,
+        parsebitfield: bool = True,
+        checksum: bytes = None,
+    ):
+        """Constructor.
+
+        :param bytes ubxClass: message class as bytes
+        :param bytes ubxID: message ID as bytes
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bytes payload: raw payload
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :param bytes checksum: checksum if already calculated (None)
+        :raises: UBXMessageError
+        """
+        # pylint: disable=super-init-not-called, too-many-arguments, too-many-positional-arguments
+
+        object.__setattr__(self, "_immutable", False)
+        self._mode = msgmode
+        self._payload = payload
+        self._length = b""
+        self._checksum = b""
+        self._parsebf = parsebitfield
+        self._ubxClass = ubxClass
+        self._ubxID = ubxID
+        self._identity = msg_identity(ubxClass, ubxID, payload)
+        self._pdict = self._get_dict(payload=payload)
+        if checksum is None:
+            self._do_len_checksum()
+        else:
+            self._length = len(payload).to_bytes(2, "little")
+            self._checksum = checksum
+        self._immutable = True
+
+    def __getattribute__(self, name: str) -> object:
+        """
+        Decode complete payload before instance attributes are
+        used collectively via __dict__.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        """
+
+        if name == "__dict__":
+            LazyUBXMessage._decode(self)
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Decode individual payload attribute on first access.
+
+        Invoked only if the attribute has not already been set.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError (if attribute is not in payload)
+        """
+
+        if name[0] == "_":  # private or special attribute
+            raise AttributeError(name)
+        accessor = get_accessor(
+            self._pdict,
+            self._ubxClass + self._ubxID,
+            self._mode,
+            self._parsebf,
+            UBXMessage,
+        )
+        try:
+            if accessor is None:
+                raise KeyError(name)
+            val = accessor(self._payload, name)
+        except CODEC_ERRORS as err:
+            if isinstance(err, AttributeError):  # attribute not in payload
+                raise
+            # attribute cannot be decoded individually
+            LazyUBXMessage._decode(self)
+            return getattr(self, name)
+        object.__getattribute__(self, "__dict__")[name] = val
+        return val
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle support - message is reconstructed from its payload.
+
+        :return: tuple of (class, constructor arguments)
+        :rtype: tuple
+        """
+
+        return (
+            LazyUBXMessage,
+            (self._ubxClass, self._ubxID, self._mode, self._payload, self._parsebf),
+        )
+
+    def project(self, fields: object) -> UBXMessage:
+        """
+        Decode only the named payload attributes and discard all others,
+        after which the message is an ordinary UBXMessage containing only
+        those attributes (in the order given). Names which are not in the
+        payload (e.g. group items beyond the number of repeats) are ignored.
+
+        :param object fields: collection of attribute names
+        :return: this message
+        :rtype: UBXMessage
+        :raises: UBXTypeError, UBXMessageError (if payload is invalid)
+        """
+
+        vals = {}
+        for name in fields:
+            if name[0] == "_" or hasattr(UBXMessage, name):
+                continue  # not a payload attribute
+            val = getattr(self, name, self)  # may decode complete payload
+            if val is not self:
+                vals[name] = val
+        atts = object.__getattribute__(self, "__dict__")
+        for name in list(atts):
+            if name[0] != "_" or name == "_pdict":
+                del atts[name]
+        atts.update(vals)
+        object.__setattr__(self, "__class__", UBXMessage)
+        return self
+
+    def _decode(self):
+        """
+        Decode complete payload, after which the message is an
+        ordinary UBXMessage.
+
+        :raises: UBXTypeError, UBXMessageError (if payload is invalid)
+        """
+
+        atts = object.__getattribute__(self, "__dict__")
+        saved = dict(atts)
+        # discard individually decoded attributes so that all attributes
+        # are set in payload order
+        for name in saved:
+            if name[0] != "_":
+                del atts[name]
+        del atts["_pdict"]
+        atts["_immutable"] = False
+        object.__setattr__(self, "__class__", UBXMessage)
+        try:
+            self._do_attributes(payload=self._payload)
+        except Exception:
+            object.__setattr__(self, "__class__", LazyUBXMessage)
+            atts.clear()
+            atts.update(saved)
+            raise
+        self._immutable = True
@@ -0,0 +1,606 @@
+"""
+ubxlog.py
+
+UBXLog class.
+
+Random access to the UBX, NMEA and RTCM3 messages in a binary log
+file (e.g. a .ubx capture) via an index of the protocol, message
+type, byte offset, length and (where present) UBX iTOW of every
+message in the file.
+
+The file is scanned once and the index persisted to a compact sidecar
+file (by default the log file name plus '.idx'), which is reused by
+subsequent instances for as long as the log file's size and
+modification time are unchanged. Each chunk of the file is scanned
+with split_frames() and, if checksums are validated, any UBX message
+with an invalid checksum is excluded from the index. Individual messages are then read
+and parsed on demand, without rescanning the file.
+
+Messages of given types are selected via lists of message indices by
+type, and messages in an iTOW range by bisecting a list of message
+indices sorted by iTOW, both of which are built from the index on
+first use.
+
+Usage::
+
+    with UBXLog("capture.ubx") as log:
+        print(len(log))
+        (raw, parsed) = log[-1]
+        for raw, parsed in log.select("NAV-PVT", itow=(start, end)):
+            print(parsed.lat, parsed.lon)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from logging import getLogger
+
+from pynmeagps import NMEAReader
+from pyrtcm import RTCMReader
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxhelpers import attsiz, split_frames
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxregistry import UBX_MSGID_INTS
+from pyubx2.ubxtypes_core import (
+    CH,
+    GET,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UBX_MSGIDS,
+    UBX_PROTOCOL,
+    VALCKSUM,
+)
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+from pyubx2.ubxvariants import VARIANTS
+
+INDEX_HEADER = struct.Struct("<6sBBQQQ")
+"""Sidecar index header - magic, version, checksum validation flag,
+message count, log file size and mtime"""
+INDEX_MAGIC = b"UBXIDX"
+"""Sidecar index file signature"""
+INDEX_VERSION = 1
+"""Sidecar index file format version"""
+NO_ITOW = 0xFFFFFFFF
+"""Index value for messages with no iTOW"""
+SCAN_CHUNK = 1 << 20
+"""Size of chunks read from log file when scanning"""
+FRAME_MAXLEN = 8 + 0xFFFF
+"""Maximum length of UBX, NMEA or RTCM3 message"""
+
+
+def itow_offset(pdict: dict) -> int:
+    """
+    Get offset of iTOW attribute in UBX payload definition.
+
+    :param dict pdict: payload definition
+    :return: payload offset of iTOW, or None if definition has no
+        iTOW at a fixed offset
+    :rtype: int
+    """
+
+    offset = 0
+    for anam, adef in pdict.items():
+        if anam == "iTOW":
+            return offset
+        if isinstance(adef, tuple):  # bitfield or repeating group
+            adef = adef[0]
+            if not isinstance(adef, str) or adef[0] != "X":
+                return None
+        elif isinstance(adef, list):  # scaled attribute
+            adef = adef[0]
+        if adef == CH:
+            return None
+        offset += attsiz(adef)
+    return None
+
+
+class UBXLog:
+    """
+    UBXLog class.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        indexfile: str = None,
+        rebuild: bool = False,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        parsebitfield: bool = True,
+        labelmsm: int = 1,
+    ):
+        """Constructor.
+
+        :param str filename: log file name
+        :param str indexfile: sidecar index file name, or None for
+            log file name plus '.idx' (None)
+        :param bool rebuild: rebuild index even if sidecar index is current (False)
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum and exclude UBX
+            messages with invalid checksums from index,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int labelmsm: RTCM3 MSM label type 1 = RINEX, 2 = BAND (1)
+        :raises: OSError (if log file cannot be read)
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        self._filename = filename
+        self._indexfile = filename + ".idx" if indexfile is None else indexfile
+        self._msgmode = msgmode
+        self._validate = validate
+        self._parsebf = parsebitfield
+        self._labelmsm = labelmsm
+        self._logger = getLogger(__name__)
+        self._itowoffsets = {}  # cache of iTOW offsets by class/id
+        # index columns
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._itows = array("I")
+        self._keys = array("I")  # UBX class/id/first payload byte or RTCM type
+        self._prots = array("B")
+        self._itowidx = None  # indices of messages with iTOW, sorted by iTOW
+        self._itowvals = None  # iTOWs of messages with iTOW, sorted
+        self._typeidx = None  # indices of messages by (protocol, key)
+        self._clsididx = None  # indices of UBX messages by class/id
+        self._stream = open(filename, "rb")  # pylint: disable=consider-using-with
+        stat = os.fstat(self._stream.fileno())
+        self._stat = (stat.st_size, stat.st_mtime_ns)
+        if rebuild or not self._load_index():
+            self._scan()
+            self._save_index()
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Number of messages in log.
+
+        :return: number of messages
+        :rtype: int
+        """
+
+        return len(self._offsets)
+
+    def __getitem__(self, idx: int) -> tuple:
+        """
+        Read and parse message by index.
+
+        :param int idx: message index (negative indices count from end of log)
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage)
+        :rtype: tuple
+        :raises: IndexError (if index is out of range), or parsing
+            error if message is invalid
+        """
+
+        raw_data = self.raw(idx)
+        return (raw_data, self._parse(raw_data, self._prots[idx]))
+
+    def __iter__(self):
+        """
+        Iterate over all messages in log.
+
+        :return: generator of (raw_data, parsed_data) tuples
+        :rtype: generator
+        """
+
+        for i in range(len(self)):
+            yield self[i]
+
+    def raw(self, idx: int) -> bytes:
+        """
+        Read raw message by index, without parsing.
+
+        :param int idx: message index (negative indices count from end of log)
+        :return: raw message
+        :rtype: bytes
+        :raises: IndexError (if index is out of range)
+        """
+
+        self._stream.seek(self._offsets[idx])
+        return self._stream.read(self._lengths[idx])
+
+    def info(self, idx: int) -> tuple:
+        """
+        Get index entry of message.
+
+        :param int idx: message index (negative indices count from end of log)
+        :return: tuple of (protocol, byte offset, length, iTOW or None)
+        :rtype: tuple
+        :raises: IndexError (if index is out of range)
+        """
+
+        itow = self._itows[idx]
+        return (
+            self._prots[idx],
+            self._offsets[idx],
+            self._lengths[idx],
+            None if itow == NO_ITOW else itow,
+        )
+
+    def indices(self, *msgs, itow: tuple = None) -> list:
+        """
+        Get indices of messages of given type(s) and/or iTOW range.
+
+        :param msgs: UBX message identities e.g. "NAV-PVT", UBX class/id bytes
+            e.g. b"\\x01\\x07", or RTCM3 message types e.g. "1005"; if none are
+            given, messages of any type are selected
+        :param tuple itow: (start, end) iTOW range in milliseconds, inclusive,
+            or None for any iTOW (None)
+        :return: list of message indices
+        :rtype: list
+        :raises: UBXStreamError (if message type is unknown)
+        """
+
+        keys = {self._msg_key(msg) for msg in msgs}
+        if itow is None:
+            return self._type_indices(keys) if keys else list(range(len(self)))
+        (itowidx, itowvals) = self._itow_index()
+        res = itowidx[bisect_left(itowvals, itow[0]) : bisect_right(itowvals, itow[1])]
+        if keys:
+            typed = self._type_indices(keys)
+            if len(typed) < len(res):  # filter whichever selection is smaller
+                return [
+                    i
+                    for i in typed
+                    if self._itows[i] != NO_ITOW
+                    and itow[0] <= self._itows[i] <= itow[1]
+                ]
+            res = [i for i in res if self._is_type(i, keys)]
+        return sorted(res)
+
+    def select(self, *msgs, itow: tuple = None):
+        """
+        Read and parse messages of given type(s) and/or iTOW range.
+
+        :param msgs: message types (see indices())
+        :param tuple itow: (start, end) iTOW range in milliseconds, inclusive,
+            or None for any iTOW (None)
+        :return: generator of (raw_data, parsed_data) tuples
+        :rtype: generator
+        :raises: UBXStreamError (if message type is unknown)
+        """
+
+        for i in self.indices(*msgs, itow=itow):
+            yield self[i]
+
+    def seek_itow(self, itow: int) -> int:
+        """
+        Get index of first message whose iTOW is at or after given iTOW.
+
+        Assumes iTOW does not decrease through the log (i.e. the log
+        does not span the end of a GPS week).
+
+        :param int itow: iTOW in milliseconds
+        :return: message index, or len(log) if there is no such message
+        :rtype: int
+        """
+
+        (itowidx, itowvals) = self._itow_index()
+        pos = bisect_left(itowvals, itow)
+        if pos == len(itowidx):
+            return len(self)
+        return itowidx[pos]
+
+    def close(self):
+        """
+        Close log file.
+        """
+
+        self._stream.close()
+
+    def _itow_index(self) -> tuple:
+        """
+        Get indices and iTOWs of messages with iTOW, sorted by iTOW
+        (in log order for messages with the same iTOW).
+
+        :return: tuple of (message indices, iTOWs)
+        :rtype: tuple
+        """
+
+        if self._itowidx is None:
+            itows = self._itows
+            idx = sorted(
+                (i for i, itw in enumerate(itows) if itw != NO_ITOW),
+                key=itows.__getitem__,
+            )
+            self._itowidx = array("Q", idx)
+            self._itowvals = array("I", (itows[i] for i in idx))
+        return (self._itowidx, self._itowvals)
+
+    def _type_indices(self, keys: set) -> list:
+        """
+        Get indices of messages of given type(s).
+
+        :param set keys: set of (protocol, key) (see _msg_key())
+        :return: list of message indices
+        :rtype: list
+        """
+
+        if self._typeidx is None:
+            typeidx = {}
+            clsididx = {}
+            for i, (prot, key) in enumerate(zip(self._prots, self._keys)):
+                typeidx.setdefault((prot, key), []).append(i)
+                if prot == UBX_PROTOCOL:
+                    clsididx.setdefault(key >> 8, []).append(i)
+            (self._typeidx, self._clsididx) = (typeidx, clsididx)
+        found = []
+        for prot, key in keys:
+            found.append(self._typeidx.get((prot, key), []))
+            if prot == UBX_PROTOCOL:
+                found.append(self._clsididx.get(key, []))
+        found = [idx for idx in found if idx]
+        if len(found) == 1:
+            return list(found[0])
+        return sorted(set().union(*found))
+
+    def _is_type(self, idx: int, keys: set) -> bool:
+        """
+        Check if message is of given type(s).
+
+        :param int idx: message index
+        :param set keys: set of (protocol, key) (see _msg_key())
+        :return: True if message is of given type(s)
+        :rtype: bool
+        """
+
+        prot = self._prots[idx]
+        key = self._keys[idx]
+        return (prot, key) in keys or (
+            prot == UBX_PROTOCOL and (prot, key >> 8) in keys
+        )
+
+    def _msg_key(self, msg: object) -> tuple:
+        """
+        Convert message type to (protocol, key) as stored in index.
+
+        :param object msg: message type
+        :return: tuple of (protocol, key)
+        :rtype: tuple
+        :raises: UBXStreamError (if message type is unknown)
+        """
+
+        if isinstance(msg, str) and msg.isdigit():  # RTCM3 message type
+            return (RTCM3_PROTOCOL, int(msg))
+        if isinstance(msg, str):
+            try:
+                return (UBX_PROTOCOL, UBX_MSGID_INTS[msg])
+            except KeyError as err:
+                raise UBXStreamError(f"Unknown message identity {msg}") from err
+        if not isinstance(msg, bytes) or len(msg) not in (2, 3):
+            raise UBXStreamError(f"Invalid message type {msg}")
+        return (UBX_PROTOCOL, int.from_bytes(msg, "big"))
+
+    def _parse(self, raw_data: bytes, prot: int) -> object:
+        """
+        Parse message using the appropriate protocol parser.
+
+        :param bytes raw_data: raw message
+        :param int prot: protocol of raw message
+        :return: UBXMessage, NMEAMessage or RTCMMessage
+        :rtype: object
+        """
+
+        if prot == UBX_PROTOCOL:
+            return UBXReader.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+                parsebitfield=self._parsebf,
+            )
+        if prot == NMEA_PROTOCOL:
+            return NMEAReader.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+            )
+        return RTCMReader.parse(
+            raw_data,
+            validate=self._validate,
+            labelmsm=self._labelmsm,
+        )
+
+    def _scan(self):
+        """
+        Scan log file for messages (see split_frames()) and add each to index.
+        """
+
+        buf = b""
+        base = 0  # file offset of buffer
+        invalid = 0
+        self._stream.seek(0)
+        while True:
+            chunk = self._stream.read(SCAN_CHUNK)
+            if not chunk:  # any incomplete message at end of file is ignored
+                break
+            buf += chunk
+            # any incomplete message at end of buffer starts after the
+            # last complete message and within FRAME_MAXLEN bytes of the end
+            pos = max(len(buf) - FRAME_MAXLEN, 0)
+            for prot, start, length, valid in split_frames(buf, self._validate):
+                pos = start + length
+                if prot == UBX_PROTOCOL and valid is False:
+                    invalid += 1
+                    continue
+                self._add(buf, base, start, pos, prot)
+            buf = buf[pos:]
+            base += pos
+        if invalid:
+            self._logger.warning(
+                "%d UBX messages with invalid checksums excluded from index", invalid
+            )
+
+    def _add(self, buf: bytes, base: int, start: int, end: int, prot: int):
+        """
+        Add message to index.
+
+        :param bytes buf: buffer
+        :param int base: file offset of buffer
+        :param int start: offset of message in buffer
+        :param int end: offset of end of message in buffer
+        :param int prot: protocol of message
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        key = 0
+        itow = NO_ITOW
+        if prot == UBX_PROTOCOL:
+            msg = buf[start + 2 : start + 4]
+            # MGA message types are identified by first byte of payload
+            key = int.from_bytes(msg, "big") << 8
+            if end - start > 8:
+                key |= buf[start + 6]
+                offset = self._itow_offset(msg, buf[start + 6 : end - 2])
+                if offset is not None and start + offset + 10 <= end - 2:
+                    offset += start + 6
+                    itow = int.from_bytes(buf[offset : offset + 4], "little")
+        elif prot == RTCM3_PROTOCOL and end - start > 7:
+            key = (buf[start + 3] << 4) | (buf[start + 4] >> 4)
+        self._offsets.append(base + start)
+        self._lengths.append(end - start)
+        self._itows.append(itow)
+        self._keys.append(key)
+        self._prots.append(prot)
+
+    def _itow_offset(self, msg: bytes, payload: bytes) -> int:
+        """
+        Get payload offset of iTOW in UBX output (GET) message.
+
+        :param bytes msg: message class/id
+        :param bytes payload: payload
+        :return: offset, or None if message has no iTOW
+        :rtype: int
+        """
+
+        offset = self._itowoffsets.get(msg, self)
+        if offset is not self:
+            return offset
+        variant = VARIANTS[GET].get(msg)
+        if variant is not None:  # definition depends on payload
+            try:
+                if msg[0] == 0x13:  # MGA
+                    pdict = variant(msg, GET, payload=payload)
+                else:
+                    pdict = variant(payload=payload)
+            except (IndexError, KeyError):  # unknown variant
+                return None
+            return itow_offset(pdict)
+        pdict = UBX_PAYLOADS_GET.get(UBX_MSGIDS.get(msg))
+        offset = None if pdict is None else itow_offset(pdict)
+        self._itowoffsets[msg] = offset
+        return offset
+
+    def _columns(self) -> tuple:
+        """
+        Get index columns.
+
+        :return: tuple of index column arrays
+        :rtype: tuple
+        """
+
+        return (self._offsets, self._lengths, self._itows, self._keys, self._prots)
+
+    def _load_index(self) -> bool:
+        """
+        Load index from sidecar index file, if it is current.
+
+        :return: True if index was loaded, False if index must be rebuilt
+        :rtype: bool
+        """
+
+        try:
+            with open(self._indexfile, "rb") as idx:
+                (magic, version, validated, count, size, mtime) = INDEX_HEADER.unpack(
+                    idx.read(INDEX_HEADER.size)
+                )
+                if (magic, version, validated, (size, mtime)) != (
+                    INDEX_MAGIC,
+                    INDEX_VERSION,
+                    self._validate & VALCKSUM,
+                    self._stat,
+                ):
+                    return False
+                for col in self._columns():
+                    col.fromfile(idx, count)
+                if idx.read(1):
+                    raise ValueError("Unexpected data at end of index")
+        except (OSError, EOFError, ValueError, struct.error):
+            for col in self._columns():
+                del col[:]
+            return False
+        if sys.byteorder == "big":
+            for col in self._columns():
+                col.byteswap()
+        return True
+
+    def _save_index(self):
+        """
+        Save index to sidecar index file. If the file cannot be written
+        (e.g. the directory is read only), the index is retained in
+        memory only.
+        """
+
+        tmpfile = self._indexfile + ".tmp"
+        try:
+            with open(tmpfile, "wb") as idx:
+                idx.write(
+                    INDEX_HEADER.pack(
+                        INDEX_MAGIC,
+                        INDEX_VERSION,
+                        self._validate & VALCKSUM,
+                        len(self),
+                        *self._stat,
+                    )
+                )
+                for col in self._columns():
+                    if sys.byteorder == "big":
+                        col = array(col.typecode, col)
+                        col.byteswap()
+                    col.tofile(idx)
+            os.replace(tmpfile, self._indexfile)
+        except OSError as err:
+            self._logger.warning("Unable to save index %s - %s", self._indexfile, err)
+
+    @property
+    def filename(self) -> str:
+        """
+        Getter for log file name.
+
+        :return: log file name
+        :rtype: str
+        """
+
+        return self._filename
+
+    @property
+    def indexfile(self) -> str:
+        """
+        Getter for sidecar index file name.
+
+        :return: index file name
+        :rtype: str
+        """
+
+        return self._indexfile
@@ -15,12 +15,12 @@ Created on 26 Sep 2020
 import struct
 
 from pyubx2.exceptions import UBXMessageError, UBXTypeError
+from pyubx2.ubxcodec import CODEC_ERRORS, decode_cfgval, get_decoder, get_encoder
+from pyubx2.ubxconfigdb import UBX_CONFIGDB
 from pyubx2.ubxhelpers import (
     attsiz,
     bytes2val,
     calc_checksum,
-    cfgkey2name,
-    cfgname2key,
     escapeall,
     gnss2str,
     itow2utc,
@@ -29,6 +29,8 @@ from pyubx2.ubxhelpers import (
     nomval,
     val2bytes,
 )
+from pyubx2.ubxregistry import msg_identity
+from pyubx2.ubxtypes_configdb import TXN_COMMIT, TXN_NONE, TXN_ONGOING, TXN_START
 from pyubx2.ubxtypes_core import (
     CH,
     GET,
@@ -37,7 +39,6 @@ from pyubx2.ubxtypes_core import (
     SET,
     U1,
     U2,
-    U4,
     UBX_CLASSES,
     UBX_HDR,
     UBX_MSGIDS,
@@ -53,6 +54,8 @@ from pyubx2.ubxtypes_poll import UBX_PAYLOADS_POLL
 from pyubx2.ubxtypes_set import UBX_PAYLOADS_SET
 from pyubx2.ubxvariants import VARIANTS
 
+_NOMINAL = {}  # shared definition of unrecognised messages, compiled once
+
 
 class UBXMessage:
     """UBX Message Class."""
@@ -104,8 +107,10 @@ class UBXMessage:
         else:  # bytes e.g. b'\x06', b'\x01'
             self._ubxClass = ubxClass
             self._ubxID = ubxID
+        self._identity = None  # resolved once payload is complete
 
         self._do_attributes(**kwargs)
+        self._identity = msg_identity(self._ubxClass, self._ubxID, self._payload)
 
         self._immutable = True  # once initialised, object is immutable
 
@@ -128,10 +133,17 @@ class UBXMessage:
             else:
                 self._payload = kwargs.get("payload", b"")
                 pdict = self._get_dict(**kwargs)  # get appropriate payload dict
-                for anam in pdict:  # process each attribute in dict
-                    (offset, index) = self._set_attribute(
-                        anam, pdict, offset, index, **kwargs
-                    )
+                # use compiled decoder or encoder where possible,
+                # otherwise process each attribute in dict
+                if "payload" in kwargs:
+                    compiled = self._decode_payload(pdict)
+                else:
+                    compiled = self._encode_payload(pdict, kwargs)
+                if not compiled:
+                    for anam in pdict:
+                        (offset, index) = self._set_attribute(
+                            anam, pdict, offset, index, **kwargs
+                        )
             self._do_len_checksum()
 
         except (
@@ -156,6 +168,69 @@ class UBXMessage:
                 )
             ) from err
 
+    def _decode_payload(self, pdict: dict) -> bool:
+        """
+        Populate UBXMessage from payload using the compiled decoder
+        for this payload definition.
+
+        If the payload does not match the definition (e.g. it is
+        truncated), nothing is populated and the attributes must be
+        parsed individually instead.
+
+        :param dict pdict: dict representing payload definition
+        :return: True if payload decoded, False otherwise
+        :rtype: bool
+
+        """
+
+        decoder = get_decoder(
+            pdict,
+            self._ubxClass + self._ubxID,
+            self._mode,
+            self._parsebf,
+            type(self),
+        )
+        if decoder is None or not isinstance(self._payload, bytes):
+            return False
+        try:
+            vals = decoder(self._payload)
+        except CODEC_ERRORS:
+            return False
+        self.__dict__.update(vals)
+        return True
+
+    def _encode_payload(self, pdict: dict, kwargs: dict) -> bool:
+        """
+        Populate UBXMessage and construct payload from named attribute
+        keywords using the compiled encoder for this payload definition.
+
+        If any keyword value does not match the definition (e.g. it is
+        of the wrong type), nothing is populated and the attributes must
+        be set individually instead.
+
+        :param dict pdict: dict representing payload definition
+        :param dict kwargs: payload key/value pairs
+        :return: True if payload encoded, False otherwise
+        :rtype: bool
+
+        """
+
+        encoder = get_encoder(
+            pdict,
+            self._ubxClass + self._ubxID,
+            self._mode,
+            self._parsebf,
+            type(self),
+        )
+        if encoder is None:
+            return False
+        try:
+            (self._payload, vals) = encoder(kwargs)
+        except CODEC_ERRORS:
+            return False
+        self.__dict__.update(vals)
+        return True
+
     def _set_attribute(
         self, anam: str, pdict: dict, offset: int, index: list, **kwargs
     ) -> tuple:
@@ -405,31 +480,16 @@ class UBXMessage:
 
         """
 
-        KEYLEN = 4
         if "payload" in kwargs:
             self._payload = kwargs["payload"]
         else:
             raise UBXMessageError(
                 "CFG-VALGET message definitions must include payload keyword"
             )
-        cfglen = len(self._payload[offset:])
-
-        i = 0
-        while offset < cfglen:
-            if i == KEYLEN:
-                key = int.from_bytes(
-                    self._payload[offset : offset + KEYLEN], "little", signed=False
-                )
-                (keyname, att) = cfgkey2name(key)
-                atts = attsiz(att)
-                valb = self._payload[offset + KEYLEN : offset + KEYLEN + atts]
-                val = bytes2val(valb, att)
-                setattr(self, keyname, val)
-                i = 0
-                offset += KEYLEN + atts
-
-            else:
-                i += 1
+        vals = {}
+        decode_cfgval(self._payload, offset, vals)
+        for keyname, val in vals.items():
+            setattr(self, keyname, val)
 
     def _do_len_checksum(self):
         """
@@ -467,7 +527,7 @@ class UBXMessage:
             else:
                 # Unknown GET message, parsed to nominal definition
                 if self.identity[-7:] == "NOMINAL":
-                    pdict = {}
+                    pdict = _NOMINAL
                 else:
                     pdict = UBX_PAYLOADS_GET[self.identity]
             return pdict
@@ -478,6 +538,73 @@ class UBXMessage:
                 "Check 'msgmode' setting is appropriate for data stream"
             ) from err
 
+    @classmethod
+    def _batch_decoder(cls, msg: bytes, msgmode: int, parsebitfield: bool) -> object:
+        """
+        Get compiled decoder for message type whose payload definition
+        does not depend on the payload content (see UBXReader.parse()).
+
+        :param bytes msg: message class and id e.g. b"\\x01\\x07"
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :return: decoder function, or None if the message type is unknown,
+            has payload variants or cannot be compiled
+        :rtype: function
+        """
+
+        if msg[0] == 0x13 or VARIANTS[msgmode].get(msg, False):  # MGA or variant
+            return None
+        pdict = (UBX_PAYLOADS_GET, UBX_PAYLOADS_SET, UBX_PAYLOADS_POLL)[msgmode].get(
+            UBX_MSGIDS.get(msg)
+        )
+        if pdict is None:
+            return None
+        return get_decoder(pdict, msg, msgmode, parsebitfield, cls)
+
+    @classmethod
+    def _from_decoded(
+        cls,
+        ubxClass: bytes,
+        ubxID: bytes,
+        msgmode: int,
+        payload: bytes,
+        parsebitfield: bool,
+        checksum: bytes,
+        vals: dict,
+    ) -> object:
+        """
+        Create message from payload already decoded by compiled decoder
+        (see UBXReader.parse()), bypassing the constructor and reusing the
+        checksum already calculated.
+
+        :param bytes ubxClass: message class as bytes
+        :param bytes ubxID: message ID as bytes
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bytes payload: raw payload
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :param bytes checksum: calculated checksum
+        :param dict vals: decoded attribute names and values
+        :return: message
+        :rtype: UBXMessage
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        msg = object.__new__(cls)
+        atts = msg.__dict__
+        # same attribute order as constructor
+        atts["_immutable"] = False
+        atts["_mode"] = msgmode
+        atts["_payload"] = payload
+        atts["_length"] = len(payload).to_bytes(2, "little")
+        atts["_checksum"] = checksum
+        atts["_parsebf"] = parsebitfield
+        atts["_ubxClass"] = ubxClass
+        atts["_ubxID"] = ubxID
+        atts["_identity"] = msg_identity(ubxClass, ubxID, payload)
+        atts.update(vals)
+        atts["_immutable"] = True
+        return msg
+
     def _calc_num_repeats(
         self, attd: dict, payload: bytes, offset: int, offsetend: int = 0
     ) -> int:
@@ -615,31 +742,17 @@ class UBXMessage:
         to a nominal payload definition UBX-NOMINAL and
         the term 'NOMINAL' is appended to the identity.
 
+        The identity is resolved once, on construction (MGA identities
+        depend on the payload, which is incomplete until then).
+
         :return: message identity e.g. 'CFG-MSG'
         :rtype: str
 
         """
 
-        try:
-            # all MGA messages except MGA-DBD need to be identified by the
-            # 'type' attribute - the first byte of the payload
-            if self._ubxClass == b"\x13" and self._ubxID != b"\x80":
-                umsg_name = UBX_MSGIDS[
-                    self._ubxClass + self._ubxID + self._payload[0:1]
-                ]
-            else:
-                umsg_name = UBX_MSGIDS[self._ubxClass + self._ubxID]
-        except KeyError:
-            # unrecognised u-blox message, parsed to UBX-NOMINAL definition
-            if self._ubxClass in UBX_CLASSES:  # known class
-                cls = UBX_CLASSES[self._ubxClass]
-            else:  # unknown class
-                cls = "UNKNOWN"
-            umsg_name = (
-                f"{cls}-{int.from_bytes(self._ubxClass, 'little'):02x}"
-                + f"{int.from_bytes(self._ubxID, 'little'):02x}-NOMINAL"
-            )
-        return umsg_name
+        if self._immutable:
+            return self._identity
+        return msg_identity(self._ubxClass, self._ubxID, self._payload)
 
     @property
     def msg_cls(self) -> bytes:
@@ -724,23 +837,74 @@ class UBXMessage:
                 f"Number of configuration tuples {num} exceeds maximum of 64"
             )
 
+        lis = b"".join(UBX_CONFIGDB.encode(key, val) for (key, val) in cfgData)
+
+        return UBXMessage._config_set(layers, transaction, lis)
+
+    @staticmethod
+    def config_set_batch(layers: int, cfgData: object, maxkeys: int = 64) -> list:
+        """
+        Construct sequence of CFG-VALSET messages from any number of
+        configuration database (key, value) tuples. Keys can be in
+        int (keyID) or str (keyname) format.
+
+        Each message contains up to maxkeys tuples. If more than one
+        message is required, the messages form a transaction
+        (TXN_START, TXN_ONGOING..., TXN_COMMIT) and the values are only
+        applied by the receiver if every message in the sequence is
+        accepted.
+
+        :param int layers: memory layer(s) SET_LAYER_RAM (1) = RAM,
+            SET_LAYER_BBR (2) = Battery Backed RAM, SETLAYER_FLASH (4) = Flash
+        :param object cfgData: list of tuples (key, value) or dict of
+            key: value
+        :param int maxkeys: maximum number of tuples per message, 1-64 (64)
+        :return: list of UBXMessage CFG-VALSET
+        :rtype: list
+        :raises: UBXMessageError
+
+        """
+
+        if not 0 < maxkeys <= 64:
+            raise UBXMessageError(
+                f"Number of configuration tuples per message {maxkeys} must be between 1 and 64"
+            )
+        if isinstance(cfgData, dict):
+            cfgData = cfgData.items()
+
+        # encode all tuples before constructing any message
+        lis = [UBX_CONFIGDB.encode(key, val) for (key, val) in cfgData]
+        num = (len(lis) + maxkeys - 1) // maxkeys
+        if num <= 1:
+            txns = [TXN_NONE] * num
+        else:
+            txns = [TXN_START] + [TXN_ONGOING] * (num - 2) + [TXN_COMMIT]
+
+        return [
+            UBXMessage._config_set(
+                layers, txn, b"".join(lis[i * maxkeys : (i + 1) * maxkeys])
+            )
+            for i, txn in enumerate(txns)
+        ]
+
+    @staticmethod
+    def _config_set(layers: int, transaction: int, lis: bytes) -> object:
+        """
+        Construct CFG-VALSET message from encoded configuration
+        key value pairs.
+
+        :param int layers: memory layer(s)
+        :param int transaction: transaction
+        :param bytes lis: encoded key value pairs
+        :return: UBXMessage CFG-VALSET
+        :rtype: UBXMessage
+
+        """
+
         version = val2bytes(0 if transaction == 0 else 1, U1)
         layers = val2bytes(layers, U1)
         transaction = val2bytes(transaction, U1)
         payload = version + layers + transaction + b"\x00"
-        lis = b""
-
-        for cfgItem in cfgData:
-            att = ""
-            (key, val) = cfgItem
-            if isinstance(key, str):  # if key is a string (keyname)
-                (kid, att) = cfgname2key(key)  # lookup keyID & attribute type
-            else:
-                kid = key
-                (key, att) = cfgkey2name(key)  # lookup attribute type
-            keyb = val2bytes(kid, U4)
-            valb = val2bytes(val, att)
-            lis = lis + keyb + valb
 
         return UBXMessage("CFG", "CFG-VALSET", SET, payload=payload + lis)
 
@@ -772,13 +936,7 @@ class UBXMessage:
         layers = val2bytes(layers, U1)
         transaction = val2bytes(transaction, U1)
         payload = version + layers + transaction + b"\x00"
-        lis = b""
-
-        for key in keys:
-            if isinstance(key, str):  # if keyname as a string
-                (key, _) = cfgname2key(key)  # lookup keyID
-            keyb = val2bytes(key, U4)
-            lis = lis + keyb
+        lis = b"".join(UBX_CONFIGDB.encode_key(key) for key in keys)
 
         return UBXMessage("CFG", "CFG-VALDEL", SET, payload=payload + lis)
 
@@ -810,12 +968,6 @@ class UBXMessage:
         layer = val2bytes(layer, U1)
         position = val2bytes(position, U2)
         payload = version + layer + position
-        lis = b""
-
-        for key in keys:
-            if isinstance(key, str):  # if keyname as a string
-                (key, _) = cfgname2key(key)  # lookup keyID
-            keyb = val2bytes(key, U4)
-            lis = lis + keyb
+        lis = b"".join(UBX_CONFIGDB.encode_key(key) for key in keys)
 
         return UBXMessage("CFG", "CFG-VALGET", POLL, payload=payload + lis)
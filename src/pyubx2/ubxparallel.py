@@ -0,0 +1,191 @@
+"""
+ubxparallel.py
+
+Multi-process parsing of large binary log files.
+
+The file is split into byte ranges of approximately 'chunksize' bytes.
+The start of each range (other than the first) is moved forward to the
+next verified UBX, NMEA or RTCM3 message boundary, i.e. a message
+header followed by a complete message with a valid checksum, so that
+spurious header bytes within message payloads are not mistaken for
+the start of a message. Each range is then read and parsed by
+UBXReader in a separate worker process, and the results returned in
+their original order.
+
+Usage::
+
+    for raw, parsed in parse_file_parallel("capture.ubx", workers=8):
+        print(parsed)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from pyubx2.ubxhelpers import SYNCBYTES, isvalid_frame, locate_frame
+from pyubx2.ubxreader import UBXReader
+
+CHUNKSIZE = 1 << 23
+"""Default size of byte range parsed by each worker (8 MB)"""
+SYNC_WINDOW = 1 << 16
+"""Size of data read when searching for message boundary"""
+
+
+def parse_file_parallel(
+    filename: str,
+    workers: int = None,
+    chunksize: int = CHUNKSIZE,
+    func: object = None,
+    **kwargs,
+):
+    """
+    Parse binary log file using multiple worker processes.
+
+    Returns a generator of (raw_data, parsed_data) tuples in file order,
+    or of the results of 'func' if specified. Ranges are parsed ahead of
+    the consumer by up to twice the number of workers.
+
+    Any keyword arguments (e.g. 'protfilter', 'msgmode', 'quitonerror') are
+    passed to UBXReader, and must be picklable. Errors are handled by each
+    worker according to 'quitonerror', with ERR_RAISE raising the error
+    in the calling process.
+
+    :param str filename: log file name
+    :param int workers: number of worker processes, or None for number
+        of processors (None)
+    :param int chunksize: approximate size of byte range parsed by each
+        worker (8388608)
+    :param object func: optional picklable function which is called by
+        the worker with each (raw_data, parsed_data) tuple and whose
+        results, other than None, are returned instead (None)
+    :param kwargs: optional UBXReader keyword arguments
+    :return: generator of (raw_data, parsed_data) tuples or func results
+    :rtype: generator
+    :raises: Exception (if invalid data and quitonerror = ERR_RAISE)
+    """
+
+    with open(filename, "rb") as stream:
+        bounds = file_boundaries(stream, chunksize)
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for start, end in zip(bounds, bounds[1:]):
+            pending.append(
+                pool.submit(_parse_range, filename, start, end, func, kwargs)
+            )
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _parse_range(
+    filename: str, start: int, end: int, func: object, kwargs: dict
+) -> list:
+    """
+    Parse byte range of log file (invoked in worker process).
+
+    :param str filename: log file name
+    :param int start: offset of start of range
+    :param int end: offset of end of range
+    :param object func: function applied to each message, or None
+    :param dict kwargs: UBXReader keyword arguments
+    :return: list of (raw_data, parsed_data) tuples or func results
+    :rtype: list
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    with open(filename, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+    ubr = UBXReader(BytesIO(data), **kwargs)
+    if func is None:
+        return list(ubr)
+    return [res for res in (func(*msg) for msg in ubr) if res is not None]
+
+
+def file_boundaries(stream: object, chunksize: int) -> list:
+    """
+    Split seekable binary stream into byte ranges of approximately
+    'chunksize' bytes, each starting at a verified message boundary.
+
+    :param object stream: seekable binary stream
+    :param int chunksize: approximate size of each range
+    :return: list of range boundaries, from 0 to end of stream
+    :rtype: list
+    """
+
+    size = stream.seek(0, 2)
+    bounds = [0]
+    pos = chunksize
+    while pos < size:
+        pos = find_boundary(stream, pos)
+        if pos >= size:
+            break
+        bounds.append(pos)
+        pos += chunksize
+    bounds.append(size)
+    return bounds
+
+
+def find_boundary(stream: object, pos: int) -> int:
+    """
+    Find first verified message boundary at or after given offset in
+    seekable binary stream, i.e. the offset of the first message header
+    which is followed by a complete message with a valid checksum.
+
+    :param object stream: seekable binary stream
+    :param int pos: offset at which to start search
+    :return: offset of message boundary, or of end of stream if none is found
+    :rtype: int
+    """
+
+    stream.seek(pos)
+    buf = stream.read(SYNC_WINDOW)
+    start = 0
+    while True:
+        sync = SYNCBYTES.search(buf, start)
+        if sync is None:
+            start = len(buf)
+        else:
+            start = sync.start()
+            valid = verify_frame(buf, start)
+            if valid is not None:
+                if valid:
+                    return pos + start
+                start += 1
+                continue
+        data = stream.read(SYNC_WINDOW)
+        if not data:
+            return pos + len(buf)
+        buf = buf[start:] + data
+        pos += start
+        start = 0
+
+
+def verify_frame(buf: bytes, start: int) -> bool:
+    """
+    Check if buffer contains a complete UBX, NMEA or RTCM3 message with a
+    valid checksum at given offset.
+
+    :param bytes buf: buffer
+    :param int start: offset of first byte of message header
+    :return: True if message is valid, False if not, or None if buffer
+        holds incomplete message
+    :rtype: bool
+    """
+
+    frame = locate_frame(buf, start)
+    if frame is None:
+        return None
+    (prot, end) = frame
+    return bool(prot) and isvalid_frame(buf, start, end, prot)
@@ -0,0 +1,235 @@
+"""
+UBXParser class.
+
+Incremental ('sans-IO') parser for UBX, NMEA or RTCM3 messages.
+
+Unlike UBXReader, UBXParser does not read from a stream. Instead,
+arbitrary chunks of binary data (e.g. from an event loop, UDP datagram
+handler or shared memory feed) are passed to the feed() method, which
+returns an iterator of any complete (raw, parsed) message tuples found.
+Any incomplete trailing message is retained and completed by subsequent
+calls to feed().
+
+'protfilter', 'quitonerror', 'msgmode' etc. behave as for UBXReader.
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from logging import getLogger
+
+from pynmeagps import NMEAReader
+from pyrtcm import RTCMReader
+
+from pyubx2.exceptions import UBXParseError, UBXStreamError
+from pyubx2.ubxhelpers import SYNCBYTES, locate_frame
+from pyubx2.ubxreader import PARSE_ERRORS, UBXReader, _ErrorHandling
+from pyubx2.ubxtypes_core import (
+    ERR_LOG,
+    GET,
+    NMEA_PROTOCOL,
+    POLL,
+    RTCM3_PROTOCOL,
+    SET,
+    SETPOLL,
+    UBX_PROTOCOL,
+    VALCKSUM,
+)
+
+COMPACT = 1 << 16
+"""Size of processed data at start of buffer above which it is discarded"""
+
+
+class UBXParser(_ErrorHandling):
+    """
+    UBXParser class.
+    """
+
+    def __init__(
+        self,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | UBX_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        labelmsm: int = 1,
+        parsing: bool = True,
+        errorhandler: object = None,
+    ):
+        """Constructor.
+
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), UBX_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int labelmsm: RTCM3 MSM label type 1 = RINEX, 2 = BAND (1)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :raises: UBXStreamError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        self._protfilter = protfilter
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self._validate = validate
+        self._parsebf = parsebitfield
+        self._labelmsm = labelmsm
+        self._msgmode = msgmode
+        self._parsing = parsing
+        self._logger = getLogger(__name__)
+        self._buffer = bytearray()  # unprocessed data
+        self._pos = 0  # offset of first unprocessed byte in buffer
+
+        if self._msgmode not in (GET, SET, POLL, SETPOLL):
+            raise UBXStreamError(
+                f"Invalid stream mode {self._msgmode} - must be 0, 1, 2 or 3"
+            )
+
+    def feed(self, data: bytes) -> object:
+        """
+        Add a chunk of binary data to the parser's buffer and return an
+        iterator of the complete NMEA, UBX or RTCM3 messages now available.
+
+        The data is buffered immediately; messages are framed and parsed
+        as the returned iterator is consumed. Any messages not consumed
+        (e.g. following an error raised with quitonerror = ERR_RAISE)
+        are returned by the next call to feed(), which may be called
+        with an empty chunk for this purpose.
+
+        'protfilter' determines which protocols are returned.
+        'quitonerror' determines whether to raise, log or ignore parsing errors.
+
+        :param bytes data: chunk of binary data
+        :return: iterator of (raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage) tuples
+        :rtype: iterator
+        :raises: Exception (if invalid or unrecognised protocol in data)
+        """
+
+        # discard processed data only occasionally, so that feeding a
+        # long message in small chunks doesn't copy it on every call
+        if self._pos >= COMPACT or self._pos == len(self._buffer):
+            del self._buffer[: self._pos]
+            self._pos = 0
+        self._buffer += data
+        return self._iterate()
+
+    def _iterate(self):
+        """
+        Generator which frames and parses each complete message in buffer.
+
+        :return: generator of (raw_data, parsed_data) tuples
+        :rtype: generator
+        """
+
+        while True:
+            try:
+                frame = self._next_frame()
+                if frame is None:  # need more data
+                    return
+                raw_data, prot = frame
+                if not self._protfilter & prot:
+                    continue
+                yield (raw_data, self._parse(raw_data, prot))
+            except PARSE_ERRORS as err:
+                if self._quitonerror:
+                    self._do_error(err)
+                continue
+
+    def _next_frame(self) -> tuple:
+        """
+        Locate the next complete message in buffer, discarding any
+        preceding bytes which are not part of a recognised header.
+
+        :return: tuple of (raw_data as bytes, protocol as int),
+            or None if no complete message is yet available
+        :rtype: tuple
+        :raises: UBXParseError if protocol header is unrecognised
+        """
+
+        buf = self._buffer
+        sync = SYNCBYTES.search(buf, self._pos)
+        if sync is None:  # no header, discard everything
+            self._pos = len(buf)
+            return None
+        start = self._pos = sync.start()
+        frame = locate_frame(buf, start)
+        if frame is None:
+            return None
+        (prot, end) = frame
+        self._pos = end
+        # unrecognised protocol header
+        if not prot:
+            raise UBXParseError(f"Unknown protocol header {bytes(buf[start:end])}.")
+        return (bytes(buf[start:end]), prot)
+
+    def _parse(self, raw_data: bytes, prot: int) -> object:
+        """
+        Parse complete message using the appropriate protocol parser.
+
+        :param bytes raw_data: raw message
+        :param int prot: protocol of raw message
+        :return: UBXMessage, NMEAMessage, RTCMMessage or None if not parsing
+        :rtype: object
+        """
+
+        if not self._parsing:
+            return None
+        if prot == UBX_PROTOCOL:
+            return UBXReader.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+                parsebitfield=self._parsebf,
+            )
+        if prot == NMEA_PROTOCOL:
+            # invoke pynmeagps parser
+            return NMEAReader.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+            )
+        # invoke pyrtcm parser
+        return RTCMReader.parse(
+            raw_data,
+            validate=self._validate,
+            labelmsm=self._labelmsm,
+        )
+
+    def close(self):
+        """
+        Signal end of data. Any incomplete message remaining in the buffer
+        is discarded and reported according to the 'quitonerror' setting.
+
+        :raises: UBXStreamError if incomplete message remains in buffer
+            and quitonerror = ERR_RAISE
+        """
+
+        remaining = len(self._buffer) - self._pos
+        self._buffer.clear()
+        self._pos = 0
+        if remaining and self._quitonerror:
+            self._do_error(
+                UBXStreamError(
+                    "Serial stream terminated unexpectedly. "
+                    f"{remaining} bytes of incomplete message discarded."
+                )
+            )
+
+    @property
+    def buffer(self) -> bytes:
+        """
+        Getter for unprocessed data in buffer.
+
+        :return: buffer
+        :rtype: bytes
+        """
+
+        return bytes(self._buffer[self._pos :])
@@ -0,0 +1,279 @@
+"""
+ubxpipeline.py
+
+UBXPipeline class.
+
+Reads UBX, NMEA or RTCM3 messages from a live data stream (e.g. a
+high-rate serial or socket stream) and parses them in a pool of worker
+processes, so that parsing can scale beyond a single processor.
+
+A framer thread in the calling process reads complete raw messages
+from the stream (using UBXReader without parsing) and copies them into
+a ring buffer in shared memory. Only the sequence number, offset and
+length of each message are passed to the workers, which parse the
+message directly from shared memory and return the parsed result.
+Results are returned in their original sequence, and the space
+occupied by each raw message is reused once it has been returned.
+
+Usage::
+
+    with UBXPipeline(serial, workers=4) as pipe:
+        for raw, parsed in pipe:
+            print(parsed)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import threading
+from collections import deque
+from multiprocessing import Process, Queue
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxparser import UBXParser
+from pyubx2.ubxreader import PARSE_ERRORS, _FramedReader
+from pyubx2.ubxtypes_core import ERR_RAISE
+
+BUFFERSIZE = 1 << 22
+"""Default size of shared memory ring buffer (4 MB)"""
+MAXFRAME = 65543
+"""Maximum length of raw message (UBX header, 65535 byte payload and checksum)"""
+TIMEOUT = 1
+"""Interval in seconds at which worker processes are checked while waiting"""
+
+
+class UBXPipeline(_FramedReader):
+    """
+    UBXPipeline class.
+    """
+
+    def __init__(
+        self, datastream, workers: int = None, buffersize: int = BUFFERSIZE, **kwargs
+    ):
+        """Constructor.
+
+        Framing errors are handled by the framer thread, and parsing errors
+        on return of the message concerned, according to 'quitonerror'.
+        Any error handler is invoked in the calling process rather than in
+        the worker processes.
+
+        :param datastream stream: input data stream
+        :param int workers: number of worker processes, or None for number
+            of processors (None)
+        :param int buffersize: size of shared memory ring buffer (4194304)
+        :param kwargs: optional 'msgmode', 'validate', 'protfilter', 'quitonerror',
+            'parsebitfield', 'labelmsm', 'bufsize', 'errorhandler', 'msgfilter'
+            and 'msgfiltermode' keyword arguments, as for UBXReader
+        :raises: UBXStreamError (if mode, message filter or buffer size is invalid)
+        """
+
+        if buffersize < MAXFRAME:
+            raise UBXStreamError(
+                f"Invalid buffer size {buffersize} - must be at least {MAXFRAME}"
+            )
+        super().__init__(datastream, workers, **kwargs)
+        self._size = buffersize
+        self._shm = None
+        self._procs = []
+        self._tasks = None
+        self._results = None
+        self._cond = threading.Condition()
+        self._frames = deque()  # (seq, offset, length) of unreturned messages
+        self._parsed = {}  # parsed results received ahead of sequence
+        self._head = 0  # offset at which next message is written
+        self._eof = False
+
+    def start(self):
+        """
+        Create shared memory ring buffer and start worker processes and
+        framer thread. Invoked automatically on first read if necessary.
+
+        :raises: UBXStreamError (if pipeline has been closed)
+        """
+
+        if self._stopped:
+            raise UBXStreamError("Pipeline is closed")
+        if self._shm is not None:
+            return
+        self._shm = SharedMemory(create=True, size=self._size)
+        self._tasks = Queue()
+        self._results = Queue()
+        for _ in range(self._workers):
+            proc = Process(
+                target=_parse_worker,
+                args=(self._shm.name, self._tasks, self._results, self._parseargs),
+                daemon=True,
+            )
+            proc.start()
+            self._procs.append(proc)
+        self._framer = threading.Thread(target=self._frame, daemon=True)
+        self._framer.start()
+
+    def read(self) -> tuple:
+        """
+        Return the next NMEA, UBX or RTCM3 message from the pipeline,
+        waiting until it has been read and parsed if necessary.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage), or (None, None) at end of stream
+        :rtype: tuple
+        :raises: Exception (if invalid data and quitonerror = ERR_RAISE)
+        :raises: UBXStreamError (if a worker process terminates unexpectedly)
+        """
+
+        self.start()
+        while True:
+            with self._cond:
+                while not self._frames and not self._eof:
+                    self._cond.wait()
+                if not self._frames:
+                    return self._end_of_stream()
+                (seq, offset, length) = self._frames[0]
+            while seq not in self._parsed:
+                self._receive()
+            (parsed_data, err) = self._parsed.pop(seq)
+            with self._cond:
+                raw_data = bytes(self._shm.buf[offset : offset + length])
+                self._frames.popleft()
+                self._cond.notify_all()
+            if err is None:
+                return (raw_data, parsed_data)
+            if self._quitonerror:
+                self._do_error(err)
+
+    def close(self):
+        """
+        Stop framer thread and worker processes and release shared memory.
+        The data stream is not closed.
+        """
+
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._shm is None:
+            return
+        for _ in self._procs:
+            self._tasks.put(None)
+        for proc in self._procs:
+            proc.join(TIMEOUT)
+            if proc.is_alive():  # pragma: no cover
+                proc.terminate()
+                proc.join()
+        for que in (self._tasks, self._results):
+            que.close()
+            que.cancel_join_thread()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def _receive(self):
+        """
+        Receive parsed result from worker processes.
+
+        :raises: UBXStreamError (if a worker process terminates unexpectedly)
+        """
+
+        try:
+            (seq, parsed_data, err) = self._results.get(timeout=TIMEOUT)
+        except Empty as err:
+            for proc in self._procs:
+                if not proc.is_alive():
+                    raise UBXStreamError(
+                        f"Pipeline worker terminated unexpectedly ({proc.exitcode})"
+                    ) from err
+            return  # pragma: no cover
+        self._parsed[seq] = (parsed_data, err)
+
+    def _frame(self):
+        """
+        Framer thread. Reads raw messages from the data stream, copies
+        them into the ring buffer and passes their locations to the
+        worker processes.
+        """
+
+        seq = 0
+        try:
+            for raw_data, _ in self._reader:
+                length = len(raw_data)
+                with self._cond:
+                    offset = self._allocate(length)
+                    if offset is None:  # pipeline closed
+                        return
+                    self._shm.buf[offset : offset + length] = raw_data
+                    self._frames.append((seq, offset, length))
+                    self._cond.notify_all()
+                self._tasks.put((seq, offset, length))
+                seq += 1
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._error = err  # raised by read() in calling process
+        finally:
+            with self._cond:
+                self._eof = True
+                self._cond.notify_all()
+
+    def _allocate(self, length: int) -> int:
+        """
+        Allocate contiguous space for message in ring buffer, waiting until
+        preceding messages have been returned if necessary. Must be called
+        with condition lock held.
+
+        :param int length: length of message
+        :return: offset of allocated space, or None if pipeline is closed
+        :rtype: int
+        """
+
+        while not self._stopped:
+            if not self._frames:  # buffer empty
+                self._head = 0
+            tail = self._frames[0][1] if self._frames else 0
+            if not self._frames or self._head >= tail:
+                if self._head + length <= self._size:
+                    offset = self._head
+                elif length < tail:  # wrap to start of buffer
+                    offset = 0
+                else:
+                    offset = None
+            elif self._head + length < tail:
+                offset = self._head
+            else:
+                offset = None
+            if offset is not None:
+                self._head = offset + length
+                return offset
+            self._cond.wait()
+        return None
+
+
+def _parse_worker(name: str, tasks: Queue, results: Queue, parseargs: dict):
+    """
+    Worker process. Parses each message located in the shared memory
+    ring buffer by (seq, offset, length) tasks, until a None task is
+    received, and returns (seq, parsed_data, error) results.
+
+    :param str name: name of shared memory ring buffer
+    :param Queue tasks: task queue
+    :param Queue results: result queue
+    :param dict parseargs: UBXParser keyword arguments
+    """
+
+    results.cancel_join_thread()  # unreturned results are discarded on close
+    shm = SharedMemory(name)
+    parser = UBXParser(quitonerror=ERR_RAISE, **parseargs)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            (seq, offset, length) = task
+            raw_data = bytes(shm.buf[offset : offset + length])
+            try:
+                (_, parsed_data) = next(parser.feed(raw_data), (None, None))
+                results.put((seq, parsed_data, None))
+            except PARSE_ERRORS as err:
+                results.put((seq, None, err))
+    finally:
+        shm.close()
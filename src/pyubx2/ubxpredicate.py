@@ -0,0 +1,264 @@
+"""
+ubxpredicate.py
+
+UBXPredicate class.
+
+A set of simple conditions on the payload attributes of a UBX message
+(e.g. fixType >= 3, numSV > 10), which can be evaluated against a
+raw UBX message without decoding its payload. Each attribute is
+decoded individually from its offset in the payload (see
+LazyUBXMessage), so messages which fail the conditions can be
+discarded before they are parsed.
+
+A condition on a repeating group attribute named without its index
+(e.g. 'gnssId' rather than 'gnssId_01') is satisfied if any item in
+the group satisfies it. UBXReader checks that the attributes named in
+a predicate are defined for the message type it applies to.
+
+Usage::
+
+    pred = UBXPredicate([("carrSoln", "==", 2), ("numSV", ">", 10)])
+    if pred.evaluate_raw(raw_data):
+        print(UBXReader.parse(raw_data))
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import operator
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxcodec import BITFIELDS
+from pyubx2.ubxlazymessage import LazyUBXMessage
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxregistry import UBX_MSGID_KEYS
+from pyubx2.ubxtypes_core import GET, POLL, SET, SETPOLL, UBX_MSGIDS
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+from pyubx2.ubxtypes_poll import UBX_PAYLOADS_POLL
+from pyubx2.ubxtypes_set import UBX_PAYLOADS_SET
+from pyubx2.ubxvariants import VARIANTS
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda val, vals: val in vals,
+    "between": lambda val, vals: vals[0] <= val <= vals[1],
+}
+"""Predicate operators, 'between' is inclusive of (lower, upper) bounds"""
+MODES = {GET: (GET,), SET: (SET,), POLL: (POLL,), SETPOLL: (SET, POLL)}
+"""Payload definition mode(s) of each message mode"""
+
+
+class UBXPredicate:
+    """
+    UBX Predicate Class.
+    """
+
+    def __init__(self, conditions: object):
+        """
+        Constructor.
+
+        :param object conditions: collection of conditions, all of which
+            must be satisfied, as tuples of (attribute name, operator,
+            value) e.g. ("fixType", ">=", 3) or ("iTOW", "between", (a, b))
+        :raises: UBXStreamError (if condition is invalid)
+        """
+
+        self._conditions = []
+        for cond in conditions:
+            try:
+                (name, opr, value) = cond
+                func = OPERATORS[opr]
+            except (KeyError, TypeError, ValueError) as err:
+                raise UBXStreamError(f"Invalid predicate condition {cond}") from err
+            if not isinstance(name, str) or name[0:1] in ("", "_"):
+                raise UBXStreamError(f"Invalid predicate attribute {name}")
+            self._conditions.append((name, func, value))
+
+    def check(self, msg: bytes, msgmode: int = GET, parsebitfield: bool = True):
+        """
+        Check that the attributes named in the conditions are defined in
+        the payload definition(s) of the given message type, so that a
+        misspelt attribute name is reported rather than failing every
+        message. Message types whose attributes cannot be determined from
+        their payload definitions (e.g. CFG-VALGET) are not checked.
+
+        :param bytes msg: message class/id (or class/id/type) bytes
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL, 3=SETPOLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :raises: UBXStreamError (if attribute is not defined)
+        """
+
+        identity = UBX_MSGIDS.get(msg)
+        names = set()
+        grpnames = set()
+        for mode in MODES.get(msgmode, ()):
+            for pdict in _definitions(msg, identity, mode):
+                if not _attribute_names(pdict, parsebitfield, names, grpnames):
+                    return
+        if not names:  # no payload definition
+            return
+        for name, _, _ in self._conditions:
+            if not _defined(name, names, grpnames):
+                raise UBXStreamError(
+                    f"Unknown attribute {name} in predicate for {identity}"
+                )
+
+    def evaluate(self, msg: UBXMessage) -> bool:
+        """
+        Evaluate predicate against parsed (or lazily parsed) message.
+
+        A condition on an attribute which is not in the message is
+        not satisfied.
+
+        :param UBXMessage msg: UBX message
+        :return: True if all conditions are satisfied
+        :rtype: bool
+        """
+
+        for name, func, value in self._conditions:
+            if not any(func(val, value) for val in self._values(msg, name)):
+                return False
+        return True
+
+    def evaluate_raw(
+        self, raw_data: bytes, msgmode: int = GET, parsebitfield: bool = True
+    ) -> bool:
+        """
+        Evaluate predicate against raw UBX message, decoding only
+        the attributes used in the conditions.
+
+        The message checksum is not validated; UBXReader validates it (if
+        required) before evaluating a predicate, so that corrupt messages
+        are reported rather than filtered.
+
+        :param bytes raw_data: raw UBX message
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :return: True if all conditions are satisfied
+        :rtype: bool
+        :raises: UBXMessageError, UBXTypeError (if payload is invalid)
+        """
+
+        msg = LazyUBXMessage(
+            raw_data[2:3],
+            raw_data[3:4],
+            msgmode,
+            raw_data[6:-2],
+            parsebitfield,
+            raw_data[-2:],
+        )
+        return self.evaluate(msg)
+
+    @staticmethod
+    def _values(msg: UBXMessage, name: str):
+        """
+        Generate value(s) of named attribute, or of each item of named
+        repeating group attribute.
+
+        :param UBXMessage msg: UBX message
+        :param str name: attribute name e.g. 'numSV', 'gnssId_01' or 'gnssId'
+        :return: generator of attribute values
+        :rtype: generator
+        """
+
+        val = getattr(msg, name, msg)
+        if val is not msg:
+            yield val
+            return
+        i = 1
+        while True:
+            val = getattr(msg, f"{name}_{i:02d}", msg)
+            if val is msg:
+                return
+            yield val
+            i += 1
+
+
+def _definitions(msg: bytes, identity: str, mode: int) -> list:
+    """
+    Get payload definition(s) of message type in given mode, including
+    any alternative payload variants.
+
+    :param bytes msg: message class/id (or class/id/type) bytes
+    :param str identity: message identity, or None if unknown
+    :param int mode: message mode (0=GET, 1=SET, 2=POLL)
+    :return: list of payload definitions
+    :rtype: list
+    """
+
+    if identity is None:
+        return []
+    payloads = (UBX_PAYLOADS_GET, UBX_PAYLOADS_SET, UBX_PAYLOADS_POLL)[mode]
+    pdicts = [payloads[identity]] if identity in payloads else []
+    if msg[0:2] in VARIANTS[mode]:  # e.g. 'RXM-PMP-V0', 'CFG-NMEAvX'
+        pdicts += [
+            pdict
+            for key, pdict in payloads.items()
+            if key[0 : len(identity)] == identity
+            and key[len(identity) : len(identity) + 1] in ("-", "v")
+            and key not in UBX_MSGID_KEYS
+        ]
+    return pdicts
+
+
+def _attribute_names(
+    pdict: dict, parsebitfield: bool, names: set, grpnames: set, ingroup: bool = False
+) -> bool:
+    """
+    Add names of attributes in payload definition to set(s), recursing
+    into repeating groups and (if parsed) bitfields.
+
+    :param dict pdict: payload definition
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param set names: names of all attributes
+    :param set grpnames: names of attributes in repeating groups
+    :param bool ingroup: definition is within repeating group
+    :return: False if attribute names depend on payload (configuration data)
+    :rtype: bool
+    """
+
+    for anam, adef in pdict.items():
+        if isinstance(adef, tuple):  # repeating group or bitfield
+            (numr, gdict) = adef
+            if numr not in BITFIELDS:
+                if not _attribute_names(gdict, parsebitfield, names, grpnames, True):
+                    return False
+                continue
+            if parsebitfield:
+                _attribute_names(gdict, parsebitfield, names, grpnames, ingroup)
+                continue
+        if anam == "cfgData":  # configuration keynames and values
+            return False
+        names.add(anam)
+        if ingroup:
+            grpnames.add(anam)
+    return True
+
+
+def _defined(name: str, names: set, grpnames: set) -> bool:
+    """
+    Check if attribute name, which may be a repeating group attribute
+    with (nested) index suffix(es) e.g. 'gnssId_01', is defined.
+
+    :param str name: attribute name
+    :param set names: names of all attributes
+    :param set grpnames: names of attributes in repeating groups
+    :return: True if defined
+    :rtype: bool
+    """
+
+    if name in names:
+        return True
+    (base, _, idx) = name.rpartition("_")
+    while base and idx.isdigit():
+        if base in grpnames:
+            return True
+        (base, _, idx) = base.rpartition("_")
+    return False
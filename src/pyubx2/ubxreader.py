@@ -4,6 +4,11 @@ UBXReader class.
 Reads and parses individual UBX, NMEA or RTCM3 messages from any viable
 data stream which supports a read(n) -> bytes method.
 
+Where the stream can report how much data is available without blocking
+(e.g. a file, or a serial or socket stream with an 'in_waiting' property),
+data is read ahead in chunks into an internal buffer and scanned for
+message headers, rather than being read from the stream a byte at a time.
+
 Returns both the raw binary data (as bytes) and the parsed data
 (as a UBXMessage, NMEAMessage or RTCMMessage object).
 
@@ -19,12 +24,19 @@ Created on 2 Oct 2020
 :license: BSD 3-Clause
 """
 
+# pylint: disable=too-many-lines
+
+import mmap
+import os
+from abc import ABC, abstractmethod
+from io import IOBase, UnsupportedOperation
+from itertools import accumulate
 from logging import getLogger
 from socket import socket
 
 import pynmeagps.exceptions as nme
 import pyrtcm.exceptions as rte
-from pynmeagps import NMEA_HDR, NMEAReader
+from pynmeagps import NMEAReader
 from pyrtcm import RTCMReader
 
 from pyubx2.exceptions import (
@@ -34,11 +46,26 @@ from pyubx2.exceptions import (
     UBXTypeError,
 )
 from pyubx2.socket_wrapper import SocketWrapper
-from pyubx2.ubxhelpers import bytes2val, calc_checksum, getinputmode, val2bytes
+from pyubx2.ubxcodec import CODEC_ERRORS
+from pyubx2.ubxhelpers import (
+    SYNCBYTES,
+    bytes2val,
+    calc_checksum,
+    getinputmode,
+    isvalid_checksums,
+    protocol,
+    val2bytes,
+)
+from pyubx2.ubxlazymessage import LazyUBXMessage
 from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxpredicate import UBXPredicate
+from pyubx2.ubxregistry import UBX_MSGID_KEYS
 from pyubx2.ubxtypes_core import (
     ERR_LOG,
     ERR_RAISE,
+    FILTER_EXCLUDE,
+    FILTER_INCLUDE,
+    FILTER_RAW,
     GET,
     NMEA_PROTOCOL,
     POLL,
@@ -51,8 +78,52 @@ from pyubx2.ubxtypes_core import (
     VALCKSUM,
 )
 
+PARSE_ERRORS = (
+    UBXMessageError,
+    UBXTypeError,
+    UBXParseError,
+    UBXStreamError,
+    nme.NMEAMessageError,
+    nme.NMEATypeError,
+    nme.NMEAParseError,
+    nme.NMEAStreamError,
+    rte.RTCMMessageError,
+    rte.RTCMParseError,
+    rte.RTCMStreamError,
+    rte.RTCMTypeError,
+)
+"""Errors handled according to 'quitonerror' setting"""
+
+
+class _ErrorHandling:  # pylint: disable=too-few-public-methods
+    """
+    Mixin which handles errors according to the 'quitonerror' setting.
+    """
+
+    _quitonerror = ERR_LOG
+    _errorhandler = None
+    _logger = getLogger(__name__)
+
+    def _do_error(self, err: Exception):
+        """
+        Handle error.
+
+        :param Exception err: error
+        :raises: Exception if quitonerror = ERR_RAISE (2)
+        """
+
+        if self._quitonerror == ERR_RAISE:
+            raise err from err
+        if self._quitonerror == ERR_LOG:
+            # pass to error handler if there is one
+            # else just log
+            if self._errorhandler is None:
+                self._logger.error(err)
+            else:
+                self._errorhandler(err)
+
 
-class UBXReader:
+class UBXReader(_ErrorHandling):
     """
     UBXReader class.
     """
@@ -69,6 +140,12 @@ class UBXReader:
         bufsize: int = 4096,
         parsing: bool = True,
         errorhandler: object = None,
+        lazy: bool = False,
+        msgfilter: object = None,
+        msgfiltermode: int = FILTER_INCLUDE,
+        fields: dict = None,
+        where: dict = None,
+        memorymap: bool = False,
     ):
         """Constructor.
 
@@ -82,10 +159,28 @@ class UBXReader:
             ERR_RAISE (2) = (re)raise (1)
         :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
         :param int labelmsm: RTCM3 MSM label type 1 = RINEX, 2 = BAND (1)
-        :param int bufsize: socket recv buffer size (4096)
+        :param int bufsize: socket recv buffer size and stream read-ahead size (4096)
         :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
         :param object errorhandler: error handling object or function (None)
-        :raises: UBXStreamError (if mode is invalid)
+        :param bool lazy: decode UBX payload attributes on first access (False)
+        :param object msgfilter: UBX message types to filter, as collection of
+            identities e.g. "NAV-PVT" and/or class/id bytes e.g. b"\\x01\\x07" (None)
+        :param int msgfiltermode: FILTER_INCLUDE (0) = parse listed types only,
+            FILTER_EXCLUDE (1) = parse all but listed types; OR with FILTER_RAW (2)
+            to output raw data of filtered out types rather than discarding them (0)
+        :param dict fields: attributes to decode for given UBX message types, as dict of
+            {identity or class/id bytes: list of attribute names} e.g.
+            {"NAV-PVT": ["iTOW", "lat", "lon"]}; other attributes of these types are
+            not decoded (None)
+        :param dict where: conditions which given UBX message types must satisfy, as dict
+            of {identity or class/id bytes: UBXPredicate or list of conditions} e.g.
+            {"NAV-PVT": [("carrSoln", "==", 2)]}; messages which fail are discarded
+            (or output as raw data if msgfiltermode includes FILTER_RAW), messages
+            with no payload or (if validated) an invalid checksum are parsed as
+            normal; conditions must name attributes defined for the message type (None)
+        :param bool memorymap: memory map file streams and read messages directly
+            from the mapped file rather than via stream reads (False)
+        :raises: UBXStreamError (if mode, message filter, fields or predicates are invalid)
         """
         # pylint: disable=too-many-arguments
 
@@ -101,13 +196,51 @@ class UBXReader:
         self._labelmsm = labelmsm
         self._msgmode = msgmode
         self._parsing = parsing
+        self._lazy = lazy
+        self._msgfilter = None if msgfilter is None else self._filter_keys(msgfilter)
+        self._msgfiltermode = msgfiltermode
+        self._fields = None
+        if fields is not None:
+            self._fields = {
+                self._msg_key(msg, "field projection"): tuple(names)
+                for msg, names in fields.items()
+            }
+        self._where = (
+            None if where is None else self._where_preds(where, msgmode, parsebitfield)
+        )
         self._logger = getLogger(__name__)
+        self._bufsize = bufsize
+        self._buffer = b""  # read-ahead buffer
+        self._pos = 0  # offset of next unread byte in read-ahead buffer
+        # determine how much data can safely be read ahead from stream
+        if hasattr(self._stream, "in_waiting"):
+            self._readahead = self._readahead_waiting
+        elif isinstance(self._stream, IOBase) and self._stream.seekable():
+            self._readahead = self._readahead_file
+        else:
+            self._readahead = self._readahead_none
+        if memorymap:
+            self._map_file()
 
         if self._msgmode not in (GET, SET, POLL, SETPOLL):
             raise UBXStreamError(
                 f"Invalid stream mode {self._msgmode} - must be 0, 1, 2 or 3"
             )
 
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
     def __iter__(self):
         """Iterator."""
 
@@ -128,6 +261,15 @@ class UBXReader:
             raise StopIteration
         return (raw_data, parsed_data)
 
+    def close(self):
+        """
+        Discard any data in the read-ahead buffer and release any memory
+        mapped file, which is otherwise only released at the end of the
+        file. The data stream is not closed.
+        """
+
+        self._clear()
+
     def read(self) -> tuple:
         """
         Read a single NMEA, UBX or RTCM3 message from the stream buffer
@@ -147,23 +289,21 @@ class UBXReader:
 
                 raw_data = None
                 parsed_data = None
-                byte1 = self._read_bytes(1)  # read the first byte
-                # if not UBX, NMEA or RTCM3, discard and continue
-                if byte1 not in (b"\xb5", b"\x24", b"\xd3"):
-                    continue
-                byte2 = self._read_bytes(1)
-                bytehdr = byte1 + byte2
+                # discard anything preceding a UBX, NMEA or RTCM3 header
+                self._scan_sync()
+                bytehdr = self._read_header()
+                prot = protocol(bytehdr)
                 # if it's a UBX message (b'\xb5\x62')
-                if bytehdr == UBX_HDR:
+                if prot == UBX_PROTOCOL:
                     (raw_data, parsed_data) = self._parse_ubx(bytehdr)
-                    # if protocol filter passes UBX, return message,
-                    # otherwise discard and continue
-                    if self._protfilter & UBX_PROTOCOL:
+                    # if protocol and message filters pass UBX, return
+                    # message, otherwise discard and continue
+                    if self._protfilter & UBX_PROTOCOL and raw_data is not None:
                         parsing = False
                     else:
                         continue
                 # if it's an NMEA message (b'\x24\x..)
-                elif bytehdr in NMEA_HDR:
+                elif prot == NMEA_PROTOCOL:
                     (raw_data, parsed_data) = self._parse_nmea(bytehdr)
                     # if protocol filter passes NMEA, return message,
                     # otherwise discard and continue
@@ -173,7 +313,7 @@ class UBXReader:
                         continue
                 # if it's a RTCM3 message
                 # (byte1 = 0xd3; byte2 = 0b000000**)
-                elif byte1 == b"\xd3" and (byte2[0] & ~0x03) == 0:
+                elif prot == RTCM3_PROTOCOL:
                     (raw_data, parsed_data) = self._parse_rtcm3(bytehdr)
                     # if protocol filter passes RTCM, return message,
                     # otherwise discard and continue
@@ -187,20 +327,7 @@ class UBXReader:
 
             except EOFError:
                 return (None, None)
-            except (
-                UBXMessageError,
-                UBXTypeError,
-                UBXParseError,
-                UBXStreamError,
-                nme.NMEAMessageError,
-                nme.NMEATypeError,
-                nme.NMEAParseError,
-                nme.NMEAStreamError,
-                rte.RTCMMessageError,
-                rte.RTCMParseError,
-                rte.RTCMStreamError,
-                rte.RTCMTypeError,
-            ) as err:
+            except PARSE_ERRORS as err:
                 if self._quitonerror:
                     self._do_error(err)
                 continue
@@ -212,20 +339,23 @@ class UBXReader:
         Parse remainder of UBX message.
 
         :param bytes hdr: UBX header (b'\\xb5\\x62')
-        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage or None)
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage or None),
+            or (None, None) if message is discarded by message filter or predicate
         :rtype: tuple
         """
 
         # read the rest of the UBX message from the buffer
         byten = self._read_bytes(4)
-        clsid = byten[0:1]
-        msgid = byten[1:2]
-        lenb = byten[2:4]
-        leni = int.from_bytes(lenb, "little", signed=False)
-        byten = self._read_bytes(leni + 2)
-        plb = byten[0:leni]
-        cksum = byten[leni : leni + 2]
-        raw_data = hdr + clsid + msgid + lenb + plb + cksum
+        leni = int.from_bytes(byten[2:4], "little", signed=False)
+        raw_data = hdr + byten + self._read_bytes(leni + 2)
+        # apply message filter to raw class/id, and predicates to raw
+        # payload, before any parsing
+        if (self._msgfilter is not None and not self._filter_pass(raw_data)) or (
+            self._where is not None and not self._where_pass(raw_data)
+        ):
+            if self._msgfiltermode & FILTER_RAW:
+                return (raw_data, None)
+            return (None, None)
         # only parse if we need to (filter passes UBX)
         if (self._protfilter & UBX_PROTOCOL) and self._parsing:
             parsed_data = self.parse(
@@ -233,11 +363,141 @@ class UBXReader:
                 validate=self._validate,
                 msgmode=self._msgmode,
                 parsebitfield=self._parsebf,
+                lazy=self._lazy,
+                fields=None if self._fields is None else self._projection(raw_data),
             )
         else:
             parsed_data = None
         return (raw_data, parsed_data)
 
+    def _filter_pass(self, raw_data: bytes) -> bool:
+        """
+        Check if raw UBX message passes message filter.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if message is to be parsed, False if filtered out
+        :rtype: bool
+        """
+
+        (keys, mgakeys) = self._msgfilter
+        # most MGA message types are identified by first byte of payload
+        listed = raw_data[2:4] in keys or (
+            bool(mgakeys) and raw_data[2:4] + raw_data[6:7] in mgakeys
+        )
+        return listed != bool(self._msgfiltermode & FILTER_EXCLUDE)
+
+    def _where_pass(self, raw_data: bytes) -> bool:
+        """
+        Check if raw UBX message satisfies predicate for its message type.
+
+        Messages on which the predicate cannot be evaluated (those with no
+        payload, an invalid checksum if checksums are validated, or a payload
+        which does not match the payload definition) are passed to the normal
+        parsing routine, which parses them or reports the error.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if message is to be parsed, False if filtered out
+        :rtype: bool
+        """
+
+        pred = self._where.get(raw_data[2:4])
+        if pred is None:  # MGA message type identified by first byte of payload
+            pred = self._where.get(raw_data[2:4] + raw_data[6:7])
+            if pred is None:
+                return True
+        if len(raw_data) <= 8:  # no payload e.g. poll request
+            return True
+        if self._validate & VALCKSUM and calc_checksum(raw_data[2:-2]) != raw_data[-2:]:
+            return True
+        msgmode = self._msgmode
+        if msgmode == SETPOLL:
+            msgmode = getinputmode(raw_data)
+        try:
+            return pred.evaluate_raw(raw_data, msgmode, self._parsebf)
+        except (UBXMessageError, UBXTypeError):
+            return True
+
+    def _projection(self, raw_data: bytes) -> tuple:
+        """
+        Get attributes to decode for raw UBX message.
+
+        :param bytes raw_data: raw UBX message
+        :return: tuple of attribute names, or None if all attributes are decoded
+        :rtype: tuple
+        """
+
+        names = self._fields.get(raw_data[2:4])
+        if names is None:  # MGA message type identified by first byte of payload
+            names = self._fields.get(raw_data[2:4] + raw_data[6:7])
+        return names
+
+    @staticmethod
+    def _msg_key(msg: object, context: str) -> bytes:
+        """
+        Convert message identity to class/id bytes.
+
+        :param object msg: message identity e.g. "NAV-PVT" or class/id
+            bytes e.g. b"\\x01\\x07"
+        :param str context: description of argument for error messages
+        :return: class/id (or class/id/type) bytes
+        :rtype: bytes
+        :raises: UBXStreamError (if message type is unknown)
+        """
+
+        if isinstance(msg, str):
+            try:
+                msg = UBX_MSGID_KEYS[msg]
+            except KeyError as err:
+                raise UBXStreamError(
+                    f"Unknown message identity {msg} in {context}"
+                ) from err
+        if not isinstance(msg, bytes) or len(msg) not in (2, 3):
+            raise UBXStreamError(f"Invalid message type {msg} in {context}")
+        return msg
+
+    @staticmethod
+    def _filter_keys(msgfilter: object) -> tuple:
+        """
+        Convert message filter to sets of class/id bytes.
+
+        :param object msgfilter: collection of message identities
+            e.g. "NAV-PVT" and/or class/id bytes e.g. b"\\x01\\x07"
+        :return: tuple of (set of class/id, set of class/id/type) bytes
+        :rtype: tuple
+        :raises: UBXStreamError (if message type is unknown)
+        """
+
+        keys = set()
+        mgakeys = set()
+        for msg in msgfilter:
+            msg = UBXReader._msg_key(msg, "message filter")
+            (keys if len(msg) == 2 else mgakeys).add(msg)
+        return (frozenset(keys), frozenset(mgakeys))
+
+    @staticmethod
+    def _where_preds(where: dict, msgmode: int, parsebitfield: bool) -> dict:
+        """
+        Convert predicates to dict of class/id bytes and UBXPredicate,
+        checking that the attributes they name are defined.
+
+        :param dict where: dict of message identity and UBXPredicate or
+            list of conditions
+        :param int msgmode: message mode (0=GET, 1=SET, 2=POLL, 3=SETPOLL)
+        :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :return: dict of class/id (or class/id/type) bytes and UBXPredicate
+        :rtype: dict
+        :raises: UBXStreamError (if message type or predicate is invalid)
+        """
+
+        preds = {}
+        for msg, pred in where.items():
+            key = UBXReader._msg_key(msg, "predicate")
+            if not isinstance(pred, UBXPredicate):
+                pred = UBXPredicate(pred)
+            pred.check(key, msgmode, parsebitfield)
+            preds[key] = pred
+        return preds
+
     def _parse_nmea(self, hdr: bytes) -> tuple:
         """
         Parse remainder of NMEA message (using pynmeagps library).
@@ -275,7 +535,7 @@ class UBXReader:
         size = hdr3[0] | (hdr[1] << 8)
         payload = self._read_bytes(size)
         crc = self._read_bytes(3)
-        raw_data = hdr + hdr3 + payload + crc
+        raw_data = b"".join((hdr, hdr3, payload, crc))
         # only parse if we need to (filter passes RTCM)
         if (self._protfilter & RTCM3_PROTOCOL) and self._parsing:
             # invoke pyrtcm parser
@@ -288,6 +548,132 @@ class UBXReader:
             parsed_data = None
         return (raw_data, parsed_data)
 
+    def _readahead_none(self) -> int:
+        """
+        Read-ahead size for streams which block until the requested
+        number of bytes is available - no read-ahead.
+
+        :return: number of bytes which can be read ahead
+        :rtype: int
+        """
+
+        return 0
+
+    def _map_file(self):
+        """
+        Memory map file stream as read-ahead buffer, from the current
+        stream position to the end of the file. The stream itself is
+        positioned at the end of the file, so that no further data is
+        read from it.
+
+        Streams which cannot be mapped (e.g. in-memory or non-file
+        streams, or empty files) are read as normal.
+        """
+
+        try:
+            pos = self._stream.tell()
+            buf = mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            return
+        self._buffer = buf
+        self._pos = pos
+        self._stream.seek(0, 2)
+        self._readahead = self._readahead_none
+
+    def _clear(self):
+        """
+        Discard read-ahead buffer, closing it if it is a memory mapped file.
+        """
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b""
+        self._pos = 0
+
+    def _readahead_file(self) -> int:
+        """
+        Read-ahead size for file-like streams, which only return
+        fewer bytes than requested at end of file.
+
+        :return: number of bytes which can be read ahead
+        :rtype: int
+        """
+
+        return self._bufsize
+
+    def _readahead_waiting(self) -> int:
+        """
+        Read-ahead size for streams which report the number of bytes
+        waiting to be read (e.g. serial ports).
+
+        :return: number of bytes which can be read ahead
+        :rtype: int
+        """
+
+        return self._stream.in_waiting
+
+    def _fill(self, size: int):
+        """
+        Ensure that at least a specified number of unread bytes are
+        available in the read-ahead buffer, topping it up from the
+        stream as necessary.
+
+        :param int size: number of bytes required
+        :raises: EOFError if stream is at end
+        :raises: UBXStreamError if stream ends prematurely
+        """
+
+        avail = len(self._buffer) - self._pos
+        if avail >= size:
+            return
+        need = size - avail
+        data = self._stream.read(max(need, self._readahead()))
+        if len(data) < need:
+            if avail + len(data) == 0:  # EOF
+                self._clear()  # release any memory mapped file
+                raise EOFError()
+            # discard truncated data and report as an unbuffered read would
+            self._clear()
+            raise UBXStreamError(
+                "Serial stream terminated unexpectedly. "
+                f"{size} bytes requested, {len(data) or avail} bytes returned."
+            )
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+
+    def _scan_sync(self):
+        """
+        Discard any bytes preceding the next UBX, NMEA or RTCM3
+        header byte in the read-ahead buffer, topping it up from
+        the stream as necessary.
+
+        :raises: EOFError if stream is at end
+        """
+
+        while True:
+            if self._pos >= len(self._buffer):
+                self._fill(1)
+            sync = SYNCBYTES.search(self._buffer, self._pos)
+            if sync is not None:
+                self._pos = sync.start()
+                return
+            self._clear()
+
+    def _read_header(self) -> bytes:
+        """
+        Read 2-byte message header from stream.
+
+        :return: header
+        :rtype: bytes
+        :raises: EOFError if stream is at end
+        """
+
+        pos = self._pos
+        if pos + 2 <= len(self._buffer):  # header is already buffered
+            self._pos = pos + 2
+            return self._buffer[pos : pos + 2]
+        return self._read_bytes(1) + self._read_bytes(1)
+
     def _read_bytes(self, size: int) -> bytes:
         """
         Read a specified number of bytes from stream.
@@ -298,15 +684,14 @@ class UBXReader:
         :raises: UBXStreamError if stream ends prematurely
         """
 
-        data = self._stream.read(size)
-        if len(data) == 0:  # EOF
-            raise EOFError()
-        if 0 < len(data) < size:  # truncated stream
-            raise UBXStreamError(
-                "Serial stream terminated unexpectedly. "
-                f"{size} bytes requested, {len(data)} bytes returned."
-            )
-        return data
+        pos = self._pos
+        end = pos + size
+        if end > len(self._buffer):
+            self._fill(size)
+            pos = 0
+            end = size
+        self._pos = end
+        return self._buffer[pos:end]
 
     def _read_line(self) -> bytes:
         """
@@ -317,33 +702,31 @@ class UBXReader:
         :raises: UBXStreamError if stream ends prematurely
         """
 
-        data = self._stream.readline()  # NMEA protocol is CRLF-terminated
+        start = self._pos
+        while True:
+            eol = self._buffer.find(b"\x0a", start)
+            if eol != -1:
+                return self._read_bytes(eol + 1 - self._pos)
+            start = len(self._buffer)
+            readahead = self._readahead()
+            if readahead:
+                data = self._stream.read(readahead)
+            else:  # NMEA protocol is CRLF-terminated
+                data = self._stream.readline()
+            if len(data) == 0:
+                break
+            self._buffer = self._buffer[self._pos :] + data
+            start -= self._pos
+            self._pos = 0
+
+        data = self._buffer[self._pos :]
+        self._clear()
         if len(data) == 0:
             raise EOFError()  # pragma: no cover
-        if data[-1:] != b"\x0a":  # truncated stream
-            raise UBXStreamError(
-                "Serial stream terminated unexpectedly. "
-                f"Line requested, {len(data)} bytes returned."
-            )
-        return data
-
-    def _do_error(self, err: Exception):
-        """
-        Handle error.
-
-        :param Exception err: error
-        :raises: Exception if quitonerror = ERR_RAISE (2)
-        """
-
-        if self._quitonerror == ERR_RAISE:
-            raise err from err
-        if self._quitonerror == ERR_LOG:
-            # pass to error handler if there is one
-            # else just log
-            if self._errorhandler is None:
-                self._logger.error(err)
-            else:
-                self._errorhandler(err)
+        raise UBXStreamError(
+            "Serial stream terminated unexpectedly. "
+            f"Line requested, {len(data)} bytes returned."
+        )
 
     @property
     def datastream(self) -> object:
@@ -362,20 +745,32 @@ class UBXReader:
         msgmode: int = GET,
         validate: int = VALCKSUM,
         parsebitfield: bool = True,
+        lazy: bool = False,
+        fields: object = None,
     ) -> object:
         """
         Parse UBX byte stream to UBXMessage object.
 
+        If 'lazy' is True, the payload attributes are decoded on first
+        access (see LazyUBXMessage) rather than when the message is parsed.
+
+        If 'fields' is specified, only the named payload attributes are
+        decoded and the returned UBXMessage contains only those attributes
+        (see LazyUBXMessage.project()).
+
         :param bytes message: binary message to parse
         :param int msgmode: GET (0), SET (1), POLL (2) (0)
         :param int validate: VALCKSUM (1) = Validate checksum,
             VALNONE (0) = ignore invalid checksum (1)
         :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param bool lazy: decode payload attributes on first access (False)
+        :param object fields: collection of names of payload attributes
+            to decode, or None to decode all attributes (None)
         :return: UBXMessage object
         :rtype: UBXMessage
         :raises: Exception (if data stream contains invalid data or unknown message type)
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals, protected-access
 
         if msgmode not in (GET, SET, POLL, SETPOLL):
             raise UBXParseError(
@@ -394,10 +789,7 @@ class UBXReader:
             payload = message[6 : lenm - 2]
             leni = len(payload)
         ckm = message[lenm - 2 : lenm]
-        if payload is not None:
-            ckv = calc_checksum(clsid + msgid + lenb + payload)
-        else:
-            ckv = calc_checksum(clsid + msgid + lenb)
+        ckv = calc_checksum(message[2 : 6 + leni])
         if validate & VALCKSUM:
             if hdr != UBX_HDR:
                 raise UBXParseError(
@@ -419,6 +811,28 @@ class UBXReader:
             msgmode = getinputmode(message)  # returns SET or POLL
         if payload is None:
             return UBXMessage(clsid, msgid, msgmode)
+        if lazy or fields is not None:
+            # calculated checksum is reusable if payload length is consistent
+            if leni != bytes2val(lenb, U2):
+                ckv = None
+            msg = LazyUBXMessage(clsid, msgid, msgmode, payload, parsebitfield, ckv)
+            return msg if fields is None else msg.project(fields)
+        # reuse calculated checksum if payload can be decoded by compiled decoder
+        if leni == bytes2val(lenb, U2):
+            decoder = UBXMessage._batch_decoder(clsid + msgid, msgmode, parsebitfield)
+            if decoder is not None:
+                try:
+                    return UBXMessage._from_decoded(
+                        clsid,
+                        msgid,
+                        msgmode,
+                        payload,
+                        parsebitfield,
+                        ckv,
+                        decoder(payload),
+                    )
+                except CODEC_ERRORS:
+                    pass  # parse attributes individually
         return UBXMessage(
             clsid,
             msgid,
@@ -426,3 +840,293 @@ class UBXReader:
             payload=payload,
             parsebitfield=parsebitfield,
         )
+
+    @staticmethod
+    def parse_many(
+        frames: object,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        parsebitfield: bool = True,
+        offsets: object = None,
+    ) -> tuple:
+        """
+        Parse a batch of UBX byte streams to UBXMessage objects.
+
+        Equivalent to calling parse() on each frame, but the message mode
+        is validated once per batch, the payload definition and compiled
+        decoder for each message type are looked up once per batch rather
+        than once per message, and the checksums of all the frames are
+        validated together (see isvalid_checksums()). Errors are collected
+        rather than raised.
+
+        Frames may be passed either as an iterable of individual frames,
+        or as a single buffer containing all the frames and a collection
+        of the offsets at which each frame starts.
+
+        :param object frames: iterable of binary messages, or buffer
+            containing binary messages if 'offsets' is specified
+        :param int msgmode: GET (0), SET (1), POLL (2), SETPOLL (3) (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param object offsets: offsets of each message in buffer (None)
+        :return: tuple of (list of UBXMessage objects, with None for any
+            message which could not be parsed, list of (index, error) tuples)
+        :rtype: tuple
+        :raises: UBXParseError (if msgmode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals, too-many-statements, protected-access
+
+        if msgmode not in (GET, SET, POLL, SETPOLL):
+            raise UBXParseError(
+                f"Invalid message mode {msgmode} - must be 0, 1, 2 or 3"
+            )
+
+        if offsets is None:
+            frames = list(frames)
+            offsets = list(accumulate((len(frame) for frame in frames), initial=0))
+            buf = b"".join(frames)
+        else:
+            buf = frames
+            offsets = list(offsets)
+            frames = [
+                bytes(
+                    buf[
+                        off : off + 8 + int.from_bytes(buf[off + 4 : off + 6], "little")
+                    ]
+                )
+                for off in offsets
+            ]
+        valid = isvalid_checksums(buf, offsets[0 : len(frames)])
+        decoders = {}  # compiled decoder for each message type and mode
+        parsed = []
+        errors = []
+        for i, message in enumerate(frames):
+            try:
+                lenm = len(message)
+                lenb = message[4:6]
+                payload = message[6 : lenm - 2]
+                leni = len(payload)
+                ckm = message[lenm - 2 : lenm]
+                if valid[i] and lenm == 8 + int.from_bytes(lenb, "little"):
+                    ckv = ckm  # checksum was validated in batch
+                else:
+                    ckv = calc_checksum(message[2 : 6 + leni])
+                if validate & VALCKSUM:
+                    if message[0:2] != UBX_HDR:
+                        raise UBXParseError(
+                            (
+                                f"Invalid message header {message[0:2]}"
+                                f" - should be {UBX_HDR}"
+                            )
+                        )
+                    if leni != bytes2val(lenb, U2):
+                        raise UBXParseError(
+                            (
+                                f"Invalid payload length {lenb}"
+                                f" - should be {val2bytes(leni, U2)}"
+                            )
+                        )
+                    if ckm != ckv:
+                        raise UBXParseError(
+                            (f"Message checksum {ckm}" f" invalid - should be {ckv}")
+                        )
+                mode = getinputmode(message) if msgmode == SETPOLL else msgmode
+                clsid = message[2:3]
+                msgid = message[3:4]
+                if lenb == b"\x00\x00":
+                    parsed.append(UBXMessage(clsid, msgid, mode))
+                    continue
+                key = (clsid + msgid, mode)
+                if key not in decoders:
+                    decoders[key] = UBXMessage._batch_decoder(
+                        key[0], mode, parsebitfield
+                    )
+                decoder = decoders[key]
+                vals = None
+                if decoder is not None and leni == bytes2val(lenb, U2):
+                    try:
+                        vals = decoder(payload)
+                    except CODEC_ERRORS:
+                        pass  # parse attributes individually
+                if vals is None:
+                    parsed.append(
+                        UBXMessage(
+                            clsid,
+                            msgid,
+                            mode,
+                            payload=payload,
+                            parsebitfield=parsebitfield,
+                        )
+                    )
+                else:
+                    parsed.append(
+                        UBXMessage._from_decoded(
+                            clsid, msgid, mode, payload, parsebitfield, ckv, vals
+                        )
+                    )
+            except PARSE_ERRORS as err:
+                parsed.append(None)
+                errors.append((i, err))
+        return (parsed, errors)
+
+
+class _FramedReader(_ErrorHandling, ABC):
+    """
+    Base class of readers which read complete raw messages from a data
+    stream in a framer thread, using UBXReader without parsing, and
+    parse them in a pool of workers (see ThreadedUBXReader and UBXPipeline).
+    """
+
+    def __init__(
+        self,
+        datastream,
+        workers: int = None,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | UBX_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        labelmsm: int = 1,
+        bufsize: int = 4096,
+        errorhandler: object = None,
+        msgfilter: object = None,
+        msgfiltermode: int = FILTER_INCLUDE,
+    ):
+        """Constructor.
+
+        Framing errors are handled by the framer thread, and parsing errors
+        on return of the message concerned, according to 'quitonerror'.
+
+        :param datastream stream: input data stream
+        :param int workers: number of workers, or None for number of processors (None)
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), UBX_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int labelmsm: RTCM3 MSM label type 1 = RINEX, 2 = BAND (1)
+        :param int bufsize: socket recv buffer size and stream read-ahead size (4096)
+        :param object errorhandler: error handling object or function (None)
+        :param object msgfilter: UBX message types to filter, as collection of
+            identities e.g. "NAV-PVT" and/or class/id bytes e.g. b"\\x01\\x07" (None)
+        :param int msgfiltermode: FILTER_INCLUDE (0) = parse listed types only,
+            FILTER_EXCLUDE (1) = parse all but listed types (0)
+        :raises: UBXStreamError (if mode or message filter is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        if msgfiltermode & FILTER_RAW:
+            raise UBXStreamError("FILTER_RAW message filter mode is not supported")
+        self._reader = UBXReader(
+            datastream,
+            msgmode=msgmode,
+            validate=validate,
+            protfilter=protfilter,
+            quitonerror=quitonerror,
+            bufsize=bufsize,
+            parsing=False,
+            errorhandler=errorhandler,
+            msgfilter=msgfilter,
+            msgfiltermode=msgfiltermode,
+        )
+        self._parseargs = {
+            "msgmode": msgmode,
+            "validate": validate,
+            "parsebitfield": parsebitfield,
+            "labelmsm": labelmsm,
+        }
+        self._quitonerror = quitonerror
+        self._errorhandler = errorhandler
+        self._logger = getLogger(type(self).__module__)
+        self._workers = workers or os.cpu_count() or 1
+        self._framer = None
+        self._stopped = False
+        self._error = None  # error raised by framer thread
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(self):
+        """Iterator."""
+
+        return self
+
+    def __next__(self) -> tuple:
+        """
+        Return next item in iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage)
+        :rtype: tuple
+        :raises: StopIteration
+
+        """
+
+        (raw_data, parsed_data) = self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopIteration
+        return (raw_data, parsed_data)
+
+    @abstractmethod
+    def start(self):
+        """
+        Start framer thread and workers.
+        """
+
+    @abstractmethod
+    def read(self) -> tuple:
+        """
+        Return the next NMEA, UBX or RTCM3 message, waiting until it has
+        been read and parsed if necessary.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage), or (None, None) at end of stream
+        :rtype: tuple
+        """
+
+    @abstractmethod
+    def close(self):
+        """
+        Stop framer thread and workers. The data stream is not closed.
+        """
+
+    def _end_of_stream(self) -> tuple:
+        """
+        Return end of stream, raising any error raised by framer thread.
+
+        :return: tuple of (None, None)
+        :rtype: tuple
+        :raises: Exception (if framer thread raised an error)
+        """
+
+        err = self._error
+        if err is not None:
+            self._error = None
+            raise err
+        return (None, None)
+
+    @property
+    def datastream(self) -> object:
+        """
+        Getter for stream.
+
+        :return: data stream
+        :rtype: object
+        """
+
+        return self._reader.datastream
@@ -0,0 +1,87 @@
+"""
+ubxregistry.py
+
+Indexed registry of UBX message classes and identities.
+
+Forward and reverse indexes of the message class and identity
+definitions in ubxtypes_core (name to class/id bytes, name to integer
+and integer to name) are built once on import, so that message types
+given by name (e.g. 'CFG', 'CFG-MSG') are resolved with a single
+dictionary lookup rather than a scan of the definitions.
+
+Message identities, including MGA identities which depend on the
+message type (first payload byte) and the 'NOMINAL' identities of
+unrecognised messages, are resolved via a cache keyed on the message
+class/id (or class/id/type) bytes.
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+from pyubx2.ubxtypes_core import UBX_CLASSES, UBX_MSGIDS
+
+
+def _reverse(dictionary: dict) -> dict:
+    """
+    Build reverse index of dictionary. Where values are not unique,
+    the first key is used (c.f. key_from_val()).
+
+    :param dict dictionary: dictionary
+    :return: dictionary of value and key
+    :rtype: dict
+    """
+
+    rev = {}
+    for key, val in dictionary.items():
+        rev.setdefault(val, key)
+    return rev
+
+
+UBX_CLASS_KEYS = _reverse(UBX_CLASSES)
+"""UBX message class bytes by class name e.g. 'CFG': b'\\x06'"""
+UBX_MSGID_KEYS = _reverse(UBX_MSGIDS)
+"""UBX message class/id (class/id/type for MGA) bytes by identity
+e.g. 'CFG-MSG': b'\\x06\\x01'"""
+UBX_MSGID_INTS = {
+    name: int.from_bytes(key, "big") for name, key in UBX_MSGID_KEYS.items()
+}
+"""UBX message class/id (class/id/type for MGA) as big-endian integer by
+identity e.g. 'CFG-MSG': 0x0601"""
+UBX_INT_MSGIDS = {int.from_bytes(key, "big"): name for key, name in UBX_MSGIDS.items()}
+"""UBX message identity by class/id (class/id/type for MGA) as big-endian
+integer e.g. 0x0601: 'CFG-MSG'"""
+
+_identities = dict(UBX_MSGIDS)  # cache of identities, including NOMINAL
+
+
+def msg_identity(ubxclass: bytes, ubxid: bytes, payload: bytes = None) -> str:
+    """
+    Get message identity from message class, id and (for MGA messages
+    other than MGA-DBD) type.
+
+    If the message is unrecognised, the term 'NOMINAL' is appended to
+    the identity e.g. 'NAV-01ff-NOMINAL'.
+
+    :param bytes ubxclass: message class e.g. b'\\x06'
+    :param bytes ubxid: message id e.g. b'\\x01'
+    :param bytes payload: payload, whose first byte is the MGA message
+        type, or None (None)
+    :return: message identity e.g. 'CFG-MSG'
+    :rtype: str
+    """
+
+    key = ubxclass + ubxid
+    # all MGA messages except MGA-DBD need to be identified by the
+    # 'type' attribute - the first byte of the payload
+    if ubxclass == b"\x13" and ubxid != b"\x80" and payload:
+        key += payload[0:1]
+    name = _identities.get(key)
+    if name is None:  # unrecognised u-blox message
+        name = _identities[key] = (
+            f"{UBX_CLASSES.get(ubxclass, 'UNKNOWN')}"
+            + f"-{int.from_bytes(ubxclass, 'little'):02x}"
+            + f"{int.from_bytes(ubxid, 'little'):02x}-NOMINAL"
+        )
+    return name
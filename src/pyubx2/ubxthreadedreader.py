@@ -0,0 +1,185 @@
+"""
+ThreadedUBXReader class.
+
+Reads UBX, NMEA or RTCM3 messages from a data stream and parses them
+in a pool of decoding threads within the calling process.
+
+A framer thread reads complete raw messages from the stream (using
+UBXReader without parsing) and submits each one to the thread pool.
+Results are returned in their original sequence. Messages are decoded
+without the overhead of passing them between processes (c.f.
+UBXPipeline); decoding is serialized by the GIL, but the stream
+continues to be read while messages are decoded.
+
+Usage::
+
+    with ThreadedUBXReader(serial, workers=4) as ubr:
+        for raw, parsed in ubr:
+            print(parsed)
+
+Created on 18 Oct 2026
+
+:author: agent
+:license: BSD 3-Clause
+"""
+
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from queue import Empty, Full, Queue
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxparser import UBXParser
+from pyubx2.ubxreader import PARSE_ERRORS, _FramedReader
+from pyubx2.ubxtypes_core import ERR_RAISE
+
+TIMEOUT = 1
+"""Interval in seconds at which framer thread checks for close while waiting"""
+
+
+class ThreadedUBXReader(_FramedReader):
+    """
+    ThreadedUBXReader class.
+    """
+
+    def __init__(
+        self, datastream, workers: int = None, queuesize: int = None, **kwargs
+    ):
+        """Constructor.
+
+        Framing errors are handled by the framer thread, and parsing errors
+        on return of the message concerned, according to 'quitonerror'.
+
+        :param datastream stream: input data stream
+        :param int workers: number of decoding threads, or None for number
+            of processors (None)
+        :param int queuesize: maximum number of messages read ahead of
+            the consumer, or None for four per decoding thread (None)
+        :param kwargs: optional 'msgmode', 'validate', 'protfilter', 'quitonerror',
+            'parsebitfield', 'labelmsm', 'bufsize', 'errorhandler', 'msgfilter'
+            and 'msgfiltermode' keyword arguments, as for UBXReader
+        :raises: UBXStreamError (if mode or message filter is invalid)
+        """
+
+        super().__init__(datastream, workers, **kwargs)
+        self._pending = Queue(maxsize=queuesize or 4 * self._workers)
+        self._local = threading.local()  # per-thread UBXParser
+        self._pool = None
+
+    def start(self):
+        """
+        Start decoding threads and framer thread. Invoked automatically
+        on first read if necessary.
+
+        :raises: UBXStreamError (if reader has been closed)
+        """
+
+        if self._stopped:
+            raise UBXStreamError("Reader is closed")
+        if self._pool is not None:
+            return
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="ubxdecode"
+        )
+        self._framer = threading.Thread(target=self._frame, daemon=True)
+        self._framer.start()
+
+    def read(self) -> tuple:
+        """
+        Return the next NMEA, UBX or RTCM3 message, waiting until it has
+        been read and parsed if necessary.
+
+        :return: tuple of (raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage), or (None, None) at end of stream
+        :rtype: tuple
+        :raises: Exception (if invalid data and quitonerror = ERR_RAISE)
+        """
+
+        self.start()
+        while True:
+            item = self._pending.get()
+            if item is None:  # end of stream
+                self._pending.put(None)
+                return self._end_of_stream()
+            (raw_data, future) = item
+            try:
+                return (raw_data, future.result())
+            except CancelledError:  # reader closed
+                return (None, None)
+            except PARSE_ERRORS as err:
+                if self._quitonerror:
+                    self._do_error(err)
+
+    def close(self):
+        """
+        Stop framer thread and decoding threads, waiting for any stream
+        read in progress to complete. Any read() waiting for a message
+        returns end of stream. The data stream is not closed.
+        """
+
+        if self._stopped:
+            return
+        self._stopped = True
+        if self._pool is None:
+            return
+        self._framer.join()  # so no more messages are submitted
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        while True:  # discard pending messages and signal end of stream
+            try:
+                self._pending.get_nowait()
+            except Empty:
+                break
+        try:
+            self._pending.put_nowait(None)
+        except Full:  # pragma: no cover
+            pass  # end of stream already signalled by read()
+
+    def _frame(self):
+        """
+        Framer thread. Reads raw messages from the data stream and
+        submits them to the decoding threads.
+        """
+
+        try:
+            for raw_data, _ in self._reader:
+                if not self._put((raw_data, self._pool.submit(self._parse, raw_data))):
+                    return
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._error = err  # raised by read() in consumer thread
+        finally:
+            self._put(None)
+
+    def _put(self, item: object) -> bool:
+        """
+        Add item to queue of pending messages, waiting for space if
+        necessary.
+
+        :param object item: tuple of (raw_data, future), or None at end of stream
+        :return: True if added, False if reader has been closed
+        :rtype: bool
+        """
+
+        while not self._stopped:
+            try:
+                self._pending.put(item, timeout=TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _parse(self, raw_data: bytes) -> object:
+        """
+        Parse raw message (invoked in decoding thread).
+
+        :param bytes raw_data: raw message
+        :return: UBXMessage, NMEAMessage or RTCMMessage
+        :rtype: object
+        :raises: Exception (if message is invalid)
+        """
+
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = UBXParser(
+                quitonerror=ERR_RAISE, **self._parseargs
+            )
+        (_, parsed_data) = next(parser.feed(raw_data), (None, None))
+        return parsed_data
@@ -34,6 +34,14 @@ ERR_LOG = 1
 """Log errors"""
 ERR_IGNORE = 0
 """Ignore errors"""
+FILTER_INCLUDE = 0
+"""Message filter parses only listed message types"""
+FILTER_EXCLUDE = 1
+"""Message filter parses all but listed message types"""
+FILTER_RAW = 2
+"""Message filter outputs raw data of filtered out message types"""
+NMEA_MAXLEN = 4096
+"""Maximum length of NMEA message when scanning for message boundaries"""
 
 # scaling factor constants
 SCAL9 = 1e-9  # 0.000000001
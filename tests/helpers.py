@@ -0,0 +1,43 @@
+"""
+Shared helpers for threaded reader and pipeline tests.
+
+Created on 18 Oct 2026
+
+:author: agent
+"""
+
+import os
+import time
+from io import BytesIO
+
+from pyubx2 import UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class SlowStream:  # pylint: disable=too-few-public-methods
+    """Blocking stream whose data arrives after a delay."""
+
+    def __init__(self, data: bytes):
+        self._stream = BytesIO(data)
+        self._delay = 0.2
+
+    def read(self, size: int) -> bytes:
+        """Read data, after a delay on first read."""
+
+        time.sleep(self._delay)
+        self._delay = 0
+        return self._stream.read(size)
+
+
+def readlog(log: str) -> bytes:
+    """Read contents of test log file."""
+
+    with open(os.path.join(DIRNAME, log), "rb") as stream:
+        return stream.read()
+
+
+def expected(data: bytes, **kwargs) -> list:
+    """Read (raw, str(parsed)) messages from data sequentially with UBXReader."""
+
+    return [(raw, str(parsed)) for raw, parsed in UBXReader(BytesIO(data), **kwargs)]
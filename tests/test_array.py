@@ -0,0 +1,391 @@
+"""
+Repeating group array and column extraction tests for pyubx2.ubxarray.
+
+Compares each column of the structured arrays, and each extracted
+column, with the corresponding attributes of the parsed messages.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member, protected-access
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyubx2 import (
+    GET,
+    UBX_PROTOCOL,
+    VALNONE,
+    UBXLog,
+    UBXMessage,
+    UBXReader,
+    extract_columns,
+    group_array,
+    group_arrays,
+)
+from pyubx2 import ubxhelpers
+from pyubx2.exceptions import UBXMessageError, UBXTypeError
+from pyubx2.ubxarray import _compile, _layouts
+from pyubx2.ubxtypes_core import CH, U1, U2, U3, U12, X6, X24
+
+np = ubxhelpers._numpy()
+
+DIRNAME = os.path.dirname(__file__)
+
+I3 = "I003"  # no 3 byte signed integers in current payload definitions
+
+LOGS = (
+    "pygpsdata-RXMRAWX.log",
+    "pygpsdata-MIXED3.log",
+    "pygpsdata-MON.log",
+    "pygpsdata-NAV.log",
+    "pygpsdata-ESF.log",
+    "pygpsdata-RXM.log",
+    "pygpsdata-SEC.log",
+    "pygpsdata-CFG.log",
+)
+
+
+class FakeMessage:  # pylint: disable=too-few-public-methods
+    """Message with arbitrary payload definition."""
+
+    def __init__(
+        self, pdict: dict, payload: bytes, parsebitfield: bool = True, **kwargs
+    ):
+        self.__dict__.update(kwargs)
+        self._pdict = pdict
+        self.payload = payload
+        self._parsebf = parsebitfield
+        self.msg_cls = b"\xff"
+        self.msg_id = b"\xff"
+        self.msgmode = GET
+        self.identity = "FAKE-MSG"
+
+    def _get_dict(self, **kwargs) -> dict:  # pylint: disable=unused-argument
+        return self._pdict
+
+
+def readlog(log: str) -> bytes:
+    with open(os.path.join(DIRNAME, log), "rb") as stream:
+        return stream.read()
+
+
+def parsed(data: bytes, identity: str, **kwargs) -> list:
+    return [
+        msg
+        for _, msg in UBXReader(BytesIO(data), protfilter=UBX_PROTOCOL, **kwargs)
+        if msg.identity == identity
+    ]
+
+
+def attvalue(msg: object, name: str, shape: tuple, chars: bool) -> object:
+    """
+    Get (indexed) attribute value(s) in the same form as array column.
+    """
+
+    if shape:  # nested group
+        return [
+            attvalue(msg, f"{name}_{i + 1:02d}", shape[1:], chars)
+            for i in range(shape[0])
+        ]
+    val = getattr(msg, name)
+    if isinstance(val, bytes):  # 'C' type or unparsed bitfield
+        return val.rstrip(b"\x00") if chars else int.from_bytes(val, "little")
+    return val
+
+
+def colvalue(val: object, shape: tuple) -> object:
+    """
+    Get array column value in the same form as attribute value.
+    """
+
+    if shape:
+        return [colvalue(v, shape[1:]) for v in val]
+    if isinstance(val, bytes):
+        return val
+    return val.item()
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ArrayTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def checkArrays(self, msg: object, arrays: dict):
+        for name, arr in arrays.items():
+            for col in arr.dtype.names:
+                shape = arr.dtype[col].shape
+                if arr.dtype[col].base == np.uint8 and shape and col[0:3] != "msg":
+                    shape = ()  # 'A' type array attribute
+                for i, item in enumerate(arr):
+                    att = f"{col}_{i + 1:02d}"
+                    exp = attvalue(msg, att, shape, arr.dtype[col].kind == "S")
+                    if shape or arr.dtype[col].base != np.uint8:
+                        val = colvalue(item[col], shape)
+                    else:
+                        val = item[col].tolist()
+                    if isinstance(exp, float):
+                        self.assertAlmostEqual(
+                            val, exp, 12, f"{msg.identity} {name} {att}"
+                        )
+                    else:
+                        self.assertEqual(val, exp, f"{msg.identity} {name} {att}")
+
+    def testARRAYS(self):  # columns must match message attributes
+        identities = set()
+        for log in LOGS:
+            with open(os.path.join(DIRNAME, log), "rb") as stream:
+                raws = [
+                    raw
+                    for raw, _ in UBXReader(
+                        stream, protfilter=UBX_PROTOCOL, parsing=False
+                    )
+                ]
+            for raw in raws:
+                for parsebitfield in (True, False):
+                    try:
+                        msg = UBXReader.parse(raw, parsebitfield=parsebitfield)
+                        arrays = group_arrays(msg)
+                    except (UBXMessageError, UBXTypeError):
+                        continue  # e.g. repeats in unparsed bitfield
+                    lazy = UBXReader.parse(raw, parsebitfield=parsebitfield, lazy=True)
+                    self.checkArrays(msg, arrays)
+                    self.checkArrays(lazy, group_arrays(lazy))
+                    if arrays:
+                        identities.add(msg.identity)
+        for identity in ("RXM-RAWX", "NAV-SAT", "NAV-SIG", "MON-COMMS", "ESF-MEAS"):
+            self.assertIn(identity, identities)
+
+    def testRAWX(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-RXMRAWX.log"), "rb") as stream:
+            msg = next(
+                msg
+                for _, msg in UBXReader(stream, protfilter=UBX_PROTOCOL)
+                if msg.identity == "RXM-RAWX"
+            )
+        meas = group_array(msg)
+        self.assertEqual(len(meas), msg.numMeas)
+        self.assertEqual(meas.dtype["prMes"], np.float64)
+        self.assertEqual(meas.dtype["cno"], np.uint8)
+        self.assertEqual(
+            meas["prMes"].tolist(),
+            [getattr(msg, f"prMes_{i + 1:02d}") for i in range(msg.numMeas)],
+        )
+        self.assertEqual(
+            meas["prValid"].tolist(),
+            [getattr(msg, f"prValid_{i + 1:02d}") for i in range(msg.numMeas)],
+        )
+        self.assertEqual(group_array(msg, "group").tolist(), meas.tolist())
+
+    def testNESTED(self):  # nested group as subarrays
+        msg = UBXMessage(
+            "MON",
+            "MON-COMMS",
+            GET,
+            nPorts=2,
+            protIds_02=1,
+            portId_01=256,
+            msgs_01_02=12,
+            msgs_02_04=34,
+            txBytes_02=5678,
+        )
+        arrays = group_arrays(msg)
+        self.assertEqual(list(arrays), ["protgroup", "portsgroup"])
+        ports = group_array(msg, "portsgroup")
+        self.assertEqual(ports.dtype["msgs"].shape, (4,))
+        self.assertEqual(ports["msgs"].tolist(), [[0, 12, 0, 0], [0, 0, 0, 34]])
+        self.assertEqual(ports["portId"].tolist(), [256, 0])
+        self.assertEqual(ports["txBytes"].tolist(), [0, 5678])
+        self.assertEqual(arrays["protgroup"]["protIds"].tolist(), [0, 1, 0, 0])
+
+    def testEMPTY(self):  # no repeats and no groups
+        msg = UBXMessage("NAV", "NAV-SAT", GET, iTOW=1, numSvs=0)
+        sats = group_array(msg)
+        self.assertEqual(len(sats), 0)
+        self.assertIn("cno", sats.dtype.names)
+        msg = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=1)
+        self.assertEqual(group_arrays(msg), {})
+        with self.assertRaisesRegex(
+            UBXMessageError, "NAV-CLOCK has no repeating groups"
+        ):
+            group_array(msg)
+
+    def testNOMINAL(self):  # unrecognised messages are not cached
+        raw = UBXMessage(b"\x01", b"\xfe", GET, payload=b"\x01\x02").serialize()
+        size = len(_layouts)
+        for _ in range(1000):
+            msg = UBXReader.parse(raw)
+            self.assertEqual(group_arrays(msg), {})
+        self.assertEqual(msg.identity, "NAV-01fe-NOMINAL")
+        self.assertEqual(len(_layouts), size)
+
+    def testERRORS(self):
+        msg = UBXMessage("NAV", "NAV-SAT", GET, iTOW=1, numSvs=1)
+        with self.assertRaisesRegex(
+            UBXMessageError, "NAV-SAT has no repeating group xyz"
+        ):
+            group_array(msg, "xyz")
+        msg = UBXReader.parse(b"\xb5\x62\x0a\x09\x00\x00\x13\x43")  # MON-HW poll
+        with self.assertRaisesRegex(
+            UBXMessageError, "MON-HW payload too short for 17 repeats of groupVP"
+        ):
+            group_arrays(msg)
+        msg = UBXMessage.config_set(0, 0, [("CFG_UART1_BAUDRATE", 9600)])
+        with self.assertRaisesRegex(
+            UBXMessageError, "CFG-VALSET configuration data cannot be represented"
+        ):
+            group_arrays(msg)
+        with patch.object(ubxhelpers, "_NUMPY", [None]):
+            with self.assertRaisesRegex(ImportError, "numpy must be installed"):
+                group_arrays(msg)
+
+    def testUNSUPPORTED(self):  # groups which cannot be represented as arrays
+        for pdict, parsebitfield, err in (
+            ({"text": CH, "group": ("None", {"val": U1})}, True, "group follows"),
+            ({"group": (2, {"text": CH})}, True, "text attribute type"),
+            ({"group": (2, {"big": U12})}, True, "big integer is too large"),
+            ({"group": (2, {"mask": (X24, {"bit0": U1})})}, True, "mask bitfield"),
+            (
+                {"num": U1, "group": (2, {"sub": ("num", {"val": U1})})},
+                True,
+                "group sub has variable",
+            ),
+        ):
+            with self.assertRaisesRegex(ValueError, err):
+                _compile(np, pdict, parsebitfield)
+            with self.assertRaisesRegex(UBXMessageError, "FAKE-MSG repeating groups"):
+                group_arrays(FakeMessage(pdict, b"\x00" * 64, parsebitfield))
+
+    def testCOMBINE(self):  # integers with no equivalent numpy dtype
+        pdict = {
+            "num": U1,
+            "group": (
+                "num",
+                {
+                    "signed": I3,
+                    "unsigned": U3,
+                    "scaled": [I3, 0.5],
+                    "flags": (X6, {"flag1": U1, "reserved0": U2, "flag2": U3}),
+                },
+            ),
+            "tail": U2,
+        }
+        payload = (
+            b"\x02"
+            + b"\xfe\xff\xff\x01\x00\x80\x03\x00\x80"
+            + b"\x21\x00\x00\x00\x00\x00"
+            + b"\x00\x00\x80\xff\xff\xff\xff\xff\x7f"
+            + b"\x38\x00\x00\x00\x00\x80"
+            + b"\x00\x00"
+        )
+        arr = group_arrays(FakeMessage(pdict, payload, num=2))["group"]
+        self.assertEqual(arr["signed"].tolist(), [-2, -8388608])
+        self.assertEqual(arr["unsigned"].tolist(), [8388609, 16777215])
+        self.assertEqual(arr["scaled"].tolist(), [-4194302.5, 4194303.5])
+        self.assertEqual(arr["flag1"].tolist(), [1, 0])
+        self.assertEqual(arr["flag2"].tolist(), [4, 7])
+        self.assertNotIn("reserved0", arr.dtype.names)
+        arr = group_arrays(FakeMessage(pdict, payload, False, num=2))["group"]
+        self.assertEqual(arr["flags"].tolist(), [0x21, 0x800000000038])
+        pdict = {"group": (1, {"mask": (X24, {"bit0": U1})})}
+        arr = group_arrays(FakeMessage(pdict, bytes(range(24)), False))["group"]
+        self.assertEqual(arr["mask"].tolist(), [list(range(24))])
+
+    def testEXTRACT(self):  # columns must match message attributes
+        for log in ("pygpsdata-NAV.log", "pygpsdata-HNR.log", "pygpsdata-ESF.log"):
+            data = readlog(log)
+            identities = {
+                msg.identity
+                for _, msg in UBXReader(BytesIO(data), protfilter=UBX_PROTOCOL)
+            }
+            for identity in identities:
+                for parsebitfield in (True, False):
+                    try:
+                        cols = extract_columns(
+                            data, identity, parsebitfield=parsebitfield
+                        )
+                    except UBXMessageError:
+                        continue  # not fixed layout e.g. NAV-SAT
+                    msgs = parsed(data, identity, parsebitfield=parsebitfield)
+                    for name, col in cols.items():
+                        self.assertEqual(len(col), len(msgs), f"{identity} {name}")
+                        if col.ndim > 1:  # fixed group e.g. MON-TXBUF
+                            continue
+                        exp = [
+                            attvalue(msg, name, (), col.dtype.kind == "S")
+                            for msg in msgs
+                        ]
+                        self.assertEqual(col.tolist(), exp, f"{identity} {name}")
+
+    def testEXTRACTSOURCES(self):  # stream, log and buffers
+        data = readlog("pygpsdata-NAVHPPOS.log")
+        msgs = parsed(data, "NAV-HPPOSLLH")
+        fields = ["iTOW", "lat", "lon", "height", "hMSL", "invalidLlh"]
+        expected = {name: [getattr(msg, name) for msg in msgs] for name in fields}
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, "pygpsdata-NAVHPPOS.log")
+            shutil.copy(os.path.join(DIRNAME, "pygpsdata-NAVHPPOS.log"), filename)
+            with UBXLog(filename) as log:
+                cols = extract_columns(log, "NAV-HPPOSLLH", fields)
+                self.assertEqual({k: v.tolist() for k, v in cols.items()}, expected)
+        finally:
+            shutil.rmtree(tmpdir)
+        for source in (data, bytearray(data), memoryview(data), BytesIO(data)):
+            cols = extract_columns(source, "NAV-HPPOSLLH", fields)
+            self.assertEqual(list(cols), fields)
+            self.assertEqual({k: v.tolist() for k, v in cols.items()}, expected)
+        self.assertEqual(cols["height"].dtype, np.float64)  # high precision added
+        self.assertEqual(cols["iTOW"].dtype, np.uint32)
+        self.assertNotIn("_HPlat", extract_columns(data, "NAV-HPPOSLLH"))
+
+    def testEXTRACTVALIDATE(self):  # message with invalid checksum
+        data = readlog("pygpsdata-MIXED3BADCK.log")
+        self.assertEqual(len(extract_columns(data, "NAV-PVT")["iTOW"]), 1)
+        cols = extract_columns(data, "NAV-PVT", ["iTOW", "lat"], validate=VALNONE)
+        self.assertEqual(
+            cols["lat"].tolist(),
+            [msg.lat for msg in parsed(data, "NAV-PVT", validate=VALNONE)],
+        )
+
+    def testEXTRACTVARIANT(self):  # definition depends on version
+        data = readlog("ucenter-ZEDF9P-configdebug.log")
+        msgs = parsed(data, "NAV-RELPOSNED")
+        cols = extract_columns(data, "NAV-RELPOSNED", ["relPosN", "relPosE"])
+        self.assertEqual(cols["relPosN"].tolist(), [msg.relPosN for msg in msgs])
+        cols = extract_columns(b"", "NAV-RELPOSNED", ["relPosN"])
+        self.assertEqual(cols["relPosN"].tolist(), [])
+        self.assertEqual(cols["relPosN"].dtype, np.float64)
+
+    def testEXTRACTERRORS(self):
+        with self.assertRaisesRegex(UBXMessageError, "Unknown message type XXX-YYY"):
+            extract_columns(b"", "XXX-YYY")
+        with self.assertRaisesRegex(
+            UBXMessageError, "MGA-ACK-DATA0 does not have a fixed layout"
+        ):
+            extract_columns(b"", "MGA-ACK-DATA0")
+        with self.assertRaisesRegex(
+            UBXMessageError, "NAV-SAT does not have a fixed layout - group group"
+        ):
+            extract_columns(b"", "NAV-SAT")
+        with self.assertRaisesRegex(UBXMessageError, "NAV-PVT has no attribute xyz"):
+            extract_columns(b"", "NAV-PVT", ["lat", "xyz"])
+        with patch.object(ubxhelpers, "_NUMPY", [None]):
+            with self.assertRaisesRegex(ImportError, "numpy must be installed"):
+                extract_columns(b"", "NAV-PVT")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
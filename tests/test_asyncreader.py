@@ -0,0 +1,144 @@
+"""
+Asynchronous reader tests for pyubx2.AsyncUBXReader, using asyncio
+StreamReaders fed with actual receiver binary outputs.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import asyncio
+import os
+import unittest
+
+from pyubx2 import (
+    ERR_IGNORE,
+    ERR_RAISE,
+    POLL,
+    UBX_PROTOCOL,
+    AsyncUBXReader,
+    UBXMessage,
+    UBXReader,
+)
+from pyubx2.exceptions import UBXParseError, UBXStreamError
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class DummyWriter:
+    """
+    Dummy asyncio StreamWriter which records written data.
+    """
+
+    def __init__(self):
+        self.data = b""
+        self.drained = 0
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        self.drained += 1
+
+
+def stream_reader(data: bytes) -> asyncio.StreamReader:
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+class AsyncReaderTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def read_log(self, log: str, **kwargs) -> tuple:
+        with open(os.path.join(DIRNAME, log), "rb") as stream:
+            data = stream.read()
+            stream.seek(0)
+            expected = [
+                (raw, str(parsed)) for raw, parsed in UBXReader(stream, **kwargs)
+            ]
+        return data, expected
+
+    async def testASYNCITER(self):  # output must match UBXReader
+        for log in ("pygpsdata-MIXED-RTCM3.log", "ucenter-ZEDF9P-configdebug.log"):
+            data, expected = self.read_log(log)
+            for bufsize in (13, 4096):
+                aubr = AsyncUBXReader(stream_reader(data), bufsize=bufsize)
+                res = [(raw, str(parsed)) async for raw, parsed in aubr]
+                self.assertEqual(res, expected, f"{log} bufsize {bufsize}")
+                self.assertEqual(await aubr.read(), (None, None))
+
+    async def testASYNCPROTFILTER(self):  # protocol filter
+        data, expected = self.read_log(
+            "pygpsdata-MIXED-RTCM3.log", protfilter=UBX_PROTOCOL
+        )
+        aubr = AsyncUBXReader(stream_reader(data), protfilter=UBX_PROTOCOL)
+        res = [(raw, str(parsed)) async for raw, parsed in aubr]
+        self.assertEqual(res, expected)
+
+    async def testASYNCMANY(self):  # many streams serviced by one event loop
+        data, expected = self.read_log("pygpsdata-MIXED-RTCM3.log")
+
+        async def consume(stream):
+            return [(raw, str(parsed)) async for raw, parsed in AsyncUBXReader(stream)]
+
+        streams = [asyncio.StreamReader() for _ in range(20)]
+        tasks = [asyncio.create_task(consume(stream)) for stream in streams]
+        for i in range(0, len(data), 100):
+            for stream in streams:
+                stream.feed_data(data[i : i + 100])
+            await asyncio.sleep(0)
+        for stream in streams:
+            stream.feed_eof()
+        for res in await asyncio.gather(*tasks):
+            self.assertEqual(res, expected)
+
+    async def testASYNCBADHDR(self):  # invalid header, reader remains usable
+        data, expected = self.read_log("pygpsdata-BADHDR.log", quitonerror=ERR_IGNORE)
+        aubr = AsyncUBXReader(stream_reader(data), quitonerror=ERR_RAISE)
+        res = []
+        with self.assertRaisesRegex(UBXParseError, "Unknown protocol header"):
+            async for raw, parsed in aubr:
+                res.append((raw, str(parsed)))
+        res += [(raw, str(parsed)) async for raw, parsed in aubr]
+        self.assertEqual(res, expected)
+
+    async def testASYNCBADEOF(self):  # premature EOF
+        with open(os.path.join(DIRNAME, "pygpsdata-BADEOF1.log"), "rb") as stream:
+            data = stream.read()
+        aubr = AsyncUBXReader(stream_reader(data), quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(
+            UBXStreamError, "Serial stream terminated unexpectedly"
+        ):
+            async for _ in aubr:
+                pass
+
+    async def testASYNCWRITE(self):  # write to output stream
+        msg = UBXMessage("NAV", "NAV-PVT", POLL)
+        writer = DummyWriter()
+        aubr = AsyncUBXReader(stream_reader(b""), writer)
+        await aubr.write(msg.serialize())
+        self.assertEqual(writer.data, msg.serialize())
+        self.assertEqual(writer.drained, 1)
+        self.assertIs(aubr.writer, writer)
+        self.assertIsInstance(aubr.datastream, asyncio.StreamReader)
+
+    async def testASYNCNOWRITER(self):  # write with no output stream
+        aubr = AsyncUBXReader(stream_reader(b""))
+        with self.assertRaisesRegex(UBXStreamError, "No output stream"):
+            await aubr.write(b"\xb5b\x01\x07\x00\x00\x08\x19")
+
+    def testBADMODE(self):  # invalid msgmode
+        with self.assertRaisesRegex(UBXStreamError, "Invalid stream mode 4"):
+            AsyncUBXReader(None, msgmode=4)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,302 @@
+"""
+Compiled payload decoder and encoder tests for pyubx2.ubxcodec.
+
+Compares compiled decoder and encoder output with the output of
+UBXMessage's recursive attribute routines.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from unittest.mock import patch
+
+from pyubx2 import (
+    GET,
+    POLL,
+    SET,
+    UBX_PROTOCOL,
+    C2,
+    U1,
+    U3,
+    U4,
+    UBXMessage,
+    UBXReader,
+    X2,
+    X6,
+)
+from pyubx2.exceptions import UBXTypeError
+from pyubx2.ubxcodec import (
+    _DecoderCompiler,
+    _EncoderCompiler,
+    _accessors,
+    _decoders,
+    get_decoder,
+    get_encoder,
+)
+from pyubx2.ubxhelpers import key_from_val
+from pyubx2.ubxpredicate import UBXPredicate
+from pyubx2.ubxtypes_core import UBX_MSGIDS
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+from pyubx2.ubxtypes_poll import UBX_PAYLOADS_POLL
+from pyubx2.ubxtypes_set import UBX_PAYLOADS_SET
+
+DIRNAME = os.path.dirname(__file__)
+
+LOGS = (
+    "pygpsdata-ALL.log",
+    "pygpsdata-ESF.log",
+    "pygpsdata-MIXED3.log",
+    "pygpsdata-NAVHPPOS.log",
+    "pygpsdata-RXMRAWX.log",
+    "ucenter-ZEDF9P-configdebug.log",
+)
+
+
+def attributes(msg: UBXMessage) -> list:
+    return list(msg.__dict__.items())
+
+
+class CodecTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testCOMPILEDLOGS(self):  # compiled decoders must match recursive parsing
+        for log in LOGS:
+            with open(os.path.join(DIRNAME, log), "rb") as stream:
+                raws = [
+                    raw
+                    for raw, _ in UBXReader(
+                        stream, protfilter=UBX_PROTOCOL, parsing=False
+                    )
+                ]
+            self.assertTrue(len(raws) > 0)
+            for parsebf in (True, False):
+                compiled = [UBXReader.parse(raw, parsebitfield=parsebf) for raw in raws]
+                with patch("pyubx2.ubxmessage.get_decoder", return_value=None):
+                    expected = [
+                        UBXReader.parse(raw, parsebitfield=parsebf) for raw in raws
+                    ]
+                self.assertEqual(
+                    [attributes(msg) for msg in compiled],
+                    [attributes(msg) for msg in expected],
+                )
+                self.assertEqual(
+                    [str(msg) for msg in compiled], [str(msg) for msg in expected]
+                )
+
+    def testCOMPILEDCACHE(self):  # decoder compiled once per definition
+        pdict = UBX_PAYLOADS_GET["NAV-PVT"]
+        dec1 = get_decoder(pdict, b"\x01\x07", GET, True, UBXMessage)
+        dec2 = get_decoder(pdict, b"\x01\x07", GET, True, UBXMessage)
+        dec3 = get_decoder(pdict, b"\x01\x07", GET, False, UBXMessage)
+        self.assertIs(dec1, dec2)
+        self.assertIsNot(dec1, dec3)
+
+    def testNOMINALCACHE(self):  # unrecognised messages share one cache entry
+        payload = b"\x01\x02\x03\x04"
+        raw = UBXMessage(b"\x01", b"\xfe", GET, payload=payload).serialize()
+        pred = UBXPredicate([("iTOW", ">", 0)])
+        UBXReader.parse(raw)
+        sizes = (len(_decoders), len(_accessors))
+        for _ in range(1000):
+            msg = UBXReader.parse(raw)
+            lazy = UBXReader.parse(raw, lazy=True)
+            self.assertFalse(hasattr(lazy, "iTOW"))
+            self.assertFalse(pred.evaluate_raw(raw))
+        self.assertEqual(msg.identity, "NAV-01fe-NOMINAL")
+        self.assertEqual(msg.payload, payload)
+        self.assertLessEqual(len(_decoders), sizes[0])
+        self.assertLessEqual(len(_accessors), sizes[1] + 1)
+
+    def testTRUNCATED(self):  # truncated payload reverts to recursive parsing
+        payload = b"\x00\x01\x02\x03\x04\x05\x06"
+        pdict = UBX_PAYLOADS_GET["NAV-CLOCK"]
+        with self.assertRaises(Exception):
+            get_decoder(pdict, b"\x01\x22", GET, True, UBXMessage)(payload)
+        msg = UBXMessage(b"\x01", b"\x22", GET, payload=payload)
+        self.assertEqual(
+            str(msg),
+            "<UBX(NAV-CLOCK, iTOW=14:00:44.976000, clkB=394500, clkD=0, tAcc=0, fAcc=0)>",
+        )
+
+    def testPROPERTYCLASH(self):  # attribute clashes with read-only property
+        self.assertIsNone(
+            get_decoder(
+                UBX_PAYLOADS_GET["CFG-FIXSEED"], b"\x06\x84", GET, True, UBXMessage
+            )
+        )
+        with self.assertRaisesRegex(
+            UBXTypeError, "Incorrect type for attribute 'length'"
+        ):
+            UBXMessage(b"\x06", b"\x84", GET, payload=b"\x00" * 12)
+
+    def testESFMEASSET(self):  # ESF-MEAS SET with calibTtagValid set
+        payload = b"\x00\x00\x00\x00\x18\x10\x00\x00\x01\x00\x00\x05\x02\x00\x00\x00"
+        msg1 = UBXMessage(b"\x10", b"\x02", SET, payload=payload)
+        with patch("pyubx2.ubxmessage.get_decoder", return_value=None):
+            msg2 = UBXMessage(b"\x10", b"\x02", SET, payload=payload)
+        self.assertEqual(attributes(msg1), attributes(msg2))
+        self.assertEqual(msg1.dataField_02, 2)
+
+    def testBITFIELD6(self):  # bitfield with no native integer format
+        pdict = {"id": U1, "flags": (X6, {"a": U4, "b": U4, "c": U4}), "val": X2}
+        decoder = _DecoderCompiler(pdict, b"\xff\xff", GET, True).compile()
+        self.assertEqual(
+            decoder(b"\x07\x21\x03\x00\x00\x00\x80\x01\x02"),
+            {"id": 7, "a": 1, "b": 2, "c": 3, "val": b"\x01\x02"},
+        )
+
+    def testUNCOMPILABLE(self):  # unknown attribute type
+        self.assertIsNone(
+            get_decoder({"val": "Z001"}, b"\xff\xff", GET, True, UBXMessage)
+        )
+
+    def testCOMPILEDENCODE(self):  # compiled encoders must match recursive routines
+        kwargs = {
+            "msgClass": 240,
+            "msgID": 1,
+            "rateUART1": 1,
+            "portID": 1,
+            "baudRate": 115200,
+            "charLen": 3,
+            "inUBX": 1,
+            "outUBX": 1,
+            "dynModel": 2,
+            "fixedAlt": 10.55,
+            "measRate": 100,
+            "navRate": 1,
+            "numCh": 2,
+            "gnssId_02": 6,
+            "maxTrkCh_02": 14,
+            "enable_02": 1,
+            "reserved0": b"\x00\x00",
+        }
+        for mode, payloads in ((SET, UBX_PAYLOADS_SET), (POLL, UBX_PAYLOADS_POLL)):
+            for name in payloads:
+                if name not in UBX_MSGIDS.values():
+                    continue
+                msg = key_from_val(UBX_MSGIDS, name)
+                for parsebf in (True, False):
+                    try:
+                        compiled = UBXMessage(
+                            msg[0:1], msg[1:2], mode, parsebitfield=parsebf, **kwargs
+                        )
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        compiled = repr(err)
+                    with patch("pyubx2.ubxmessage.get_encoder", return_value=None):
+                        try:
+                            expected = UBXMessage(
+                                msg[0:1],
+                                msg[1:2],
+                                mode,
+                                parsebitfield=parsebf,
+                                **kwargs,
+                            )
+                        except (
+                            Exception
+                        ) as err:  # pylint: disable=broad-exception-caught
+                            expected = repr(err)
+                    if isinstance(expected, str):
+                        self.assertEqual(compiled, expected, name)
+                    else:
+                        self.assertEqual(
+                            attributes(compiled), attributes(expected), name
+                        )
+                        self.assertEqual(
+                            compiled.serialize(), expected.serialize(), name
+                        )
+
+    def testENCODECACHE(self):  # encoder compiled once per definition
+        pdict = UBX_PAYLOADS_SET["CFG-PRT"]
+        enc1 = get_encoder(pdict, b"\x06\x00", SET, True, UBXMessage)
+        enc2 = get_encoder(pdict, b"\x06\x00", SET, True, UBXMessage)
+        self.assertIs(enc1, enc2)
+        payload, vals = enc1({"portID": 1, "baudRate": 9600, "charLen": 3})
+        self.assertEqual(
+            payload,
+            b"\x01\x00\x00\x00\xc0\x00\x00\x00\x80\x25\x00\x00" + b"\x00" * 8,
+        )
+        self.assertEqual(vals["baudRate"], 9600)
+        self.assertIsNone(
+            get_encoder(
+                UBX_PAYLOADS_SET["CFG-VALSET"], b"\x06\x8a", SET, True, UBXMessage
+            )
+        )
+
+    def testENCODEFALLBACK(self):  # invalid keyword values revert to recursive routines
+        msg = UBXMessage("CFG", "CFG-RATE", SET, measRate=True, navRate=1)
+        self.assertEqual(msg.measRate, True)
+        self.assertEqual(msg.payload, b"\x01\x00\x01\x00\x00\x00")
+        with self.assertRaisesRegex(
+            UBXTypeError, "Incorrect type for attribute 'navRate'"
+        ):
+            UBXMessage("CFG", "CFG-RATE", SET, measRate=100, navRate=1.5)
+        with self.assertRaisesRegex(
+            UBXTypeError, "Overflow error for attribute 'navRate'"
+        ):
+            UBXMessage("CFG", "CFG-RATE", SET, measRate=100, navRate=70000)
+
+    def testENCODETYPES(self):  # attribute types with no native struct format
+        pdict = {
+            "id": U1,
+            "flags": (X6, {"a": U4, "reserved0": U4, "c": U4}),
+            "val": U3,
+            "sval": ["I003", 0.1],
+            "arr": "A002",
+            "chr": C2,
+            "grp": ("None", {"x": U1}),
+        }
+        encoder = _EncoderCompiler(pdict, b"\xff\xff", SET, True).compile()
+        (payload, vals) = encoder(
+            {"a": 1, "reserved0": 2, "c": 3, "val": 258, "sval": -1.0, "chr": "ab"}
+        )
+        self.assertEqual(
+            payload,
+            b"\x00\x21\x03\x00\x00\x00\x00\x02\x01\x00\xf6\xff\xff\x00\x00ab",
+        )
+        self.assertEqual(
+            vals,
+            {
+                "id": 0,
+                "a": 1,
+                "c": 3,
+                "val": 258,
+                "sval": -1.0,
+                "arr": [0, 0],
+                "chr": "ab",
+            },
+        )
+        with self.assertRaises(TypeError):
+            encoder({"chr": "abc"})
+        self.assertEqual(
+            _DecoderCompiler(pdict, b"\xff\xff", GET, True).compile()(payload),
+            {
+                "id": 0,
+                "a": 1,
+                "c": 3,
+                "val": 258,
+                "sval": -1.0,
+                "arr": [0, 0],
+                "chr": b"ab",
+            },
+        )
+
+    def testENCODEUNCOMPILABLE(self):  # variable length string
+        self.assertIsNone(
+            get_encoder({"msg": "CH"}, b"\xff\xff", SET, True, UBXMessage)
+        )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
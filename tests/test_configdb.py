@@ -11,7 +11,19 @@ Created on 19 Apr 2021
 
 import unittest
 
-from pyubx2 import UBXMessage, SET, POLL, SET_LAYER_FLASH, TXN_NONE
+from pyubx2 import (
+    UBX_CONFIGDB,
+    ConfigDatabase,
+    UBXMessage,
+    UBXMessageError,
+    SET,
+    POLL,
+    SET_LAYER_FLASH,
+    TXN_COMMIT,
+    TXN_NONE,
+    TXN_ONGOING,
+    TXN_START,
+)
 from pyubx2.ubxtypes_configdb import UBX_CONFIG_DATABASE
 from tests.configdb_baseline import UBX_CONFIG_DATABASE_BASELINE
 
@@ -73,6 +85,227 @@ class ConfigTest(unittest.TestCase):
         # print(msg)
         self.assertEqual(str(msg), EXPECTED_RESULT)
 
+    def testIndex(self):  # indexes must agree with linear scans of definitions
+        self.assertEqual(len(UBX_CONFIGDB), len(UBX_CONFIG_DATABASE))
+        self.assertEqual(list(UBX_CONFIGDB), list(UBX_CONFIG_DATABASE))
+        for keyname, (keyid, typ) in UBX_CONFIG_DATABASE.items():
+            self.assertEqual(UBX_CONFIGDB.name2key(keyname), (keyid, typ))
+            first = [k for k, v in UBX_CONFIG_DATABASE.items() if v[0] == keyid][0]
+            self.assertEqual(UBX_CONFIGDB.key2name(keyid), (first, typ))
+            self.assertIn(keyname, UBX_CONFIGDB)
+            self.assertIn(keyid, UBX_CONFIGDB)
+            self.assertEqual(UBX_CONFIGDB.keysize(keyid), int(typ[1:]))
+        self.assertEqual(
+            UBX_CONFIGDB.key2name(0x10340014), ("CFG_BDS_USE_GEO_PRN", "L001")
+        )
+        self.assertNotIn("FOO_BAR", UBX_CONFIGDB)
+        self.assertNotIn(0x11223344, UBX_CONFIGDB)
+
+    def testGroups(self):  # group / item decomposition of keyIDs
+        self.assertEqual(ConfigDatabase.keygroup(0x20910007), 0x91)
+        self.assertEqual(ConfigDatabase.keyitem(0x20910007), 0x007)
+        self.assertEqual(ConfigDatabase.keysize(0x40520001), 4)
+        self.assertEqual(ConfigDatabase.keysize(0x50520001), 8)
+        self.assertEqual(UBX_CONFIGDB.groups["MSGOUT"], 0x91)
+        self.assertEqual(UBX_CONFIGDB.groups["UART1"], 0x52)
+        res = UBX_CONFIGDB.group("CFG_UART1")
+        self.assertEqual(res, UBX_CONFIGDB.group("UART1"))
+        self.assertEqual(res, UBX_CONFIGDB.group(0x52))
+        self.assertEqual(res[0], "CFG_UART1_ENABLED")  # keyID 0x10520005
+        self.assertEqual(
+            sorted(res),
+            sorted(k for k in UBX_CONFIG_DATABASE if k.startswith("CFG_UART1_")),
+        )
+        total = sum(
+            len(UBX_CONFIGDB.group(grp)) for grp in UBX_CONFIGDB.groups.values()
+        )
+        self.assertEqual(total, len(UBX_CONFIG_DATABASE) - 1)  # one duplicate keyID
+        self.assertEqual(UBX_CONFIGDB.group(0xFF), [])
+        with self.assertRaisesRegex(
+            UBXMessageError, "Undefined configuration group FOO"
+        ):
+            UBX_CONFIGDB.group("FOO")
+        with self.assertRaisesRegex(
+            UBXMessageError, "Invalid configuration database key 0x1234"
+        ):
+            ConfigDatabase.keysize(0x1234)
+
+    def testEncodeDecode(self):  # round trip of every value type
+        cfgdata = [
+            ("CFG_UART1_BAUDRATE", 9600),  # U4
+            ("CFG_NAVSPG_DYNMODEL", 4),  # E1
+            ("CFG_UART1INPROT_UBX", 1),  # L
+            ("CFG_NAVSPG_USRDAT_ROTY", 0.5),  # R4
+            ("CFG_TMODE_ECEF_X", -12345),  # I4
+            (0x20910007, 1),  # U1 by keyID
+            (0x50180001, b"\x01\x02\x03\x04\x05\x06\x07\x08"),  # X8
+            (0x11223344, b"\x01"),  # undocumented X1
+        ]
+        payload = b"\x00\x00\x00\x00" + b"".join(
+            UBX_CONFIGDB.encode(key, val) for key, val in cfgdata
+        )
+        res = UBX_CONFIGDB.decode(payload, 4)
+        self.assertEqual(list(res.values()), [val for _, val in cfgdata])
+        self.assertEqual(list(res)[5], UBX_CONFIGDB.key2name(0x20910007)[0])
+        self.assertEqual(list(res)[7], "CFG_0x11223344")
+        msg = UBXMessage("CFG", "CFG-VALSET", SET, payload=payload)
+        self.assertEqual(msg.CFG_TMODE_ECEF_X, -12345)
+        self.assertEqual(
+            UBX_CONFIGDB.encode_key("CFG_UART1_BAUDRATE"), b"\x01\x00\x52\x40"
+        )
+        self.assertEqual(UBX_CONFIGDB.keyid(0x40520001), 0x40520001)
+
+    def testDecodeTruncated(self):  # truncated final value decoded as per bytes2val
+        res = UBX_CONFIGDB.decode(b"\x01\x00\x52\x40\x80\x25")
+        self.assertEqual(res, {"CFG_UART1_BAUDRATE": 9600})
+        res = UBX_CONFIGDB.decode(b"\x07\x00\x35\x50\x01\x02\x03\x04\x05")
+        self.assertEqual(res, {"CFG_0x50350007": b"\x01\x02\x03\x04\x05"})
+        res = UBX_CONFIGDB.decode(b"\x04\x00\x03\x40\xff\xff")  # I4
+        self.assertEqual(res, {"CFG_TMODE_ECEF_Y": -1})
+        with self.assertRaises(Exception):
+            UBX_CONFIGDB.decode(b"\x68\x00\x11\x40\xb6\xf3")  # R4
+
+    def testEncodeErrors(self):
+        with self.assertRaisesRegex(
+            UBXMessageError, "Undefined configuration database key FOO_BAR"
+        ):
+            UBX_CONFIGDB.encode("FOO_BAR", 1)
+        with self.assertRaisesRegex(
+            UBXMessageError, "Invalid configuration database key 0x81111111"
+        ):
+            UBX_CONFIGDB.encode(0x81111111, 1)
+        with self.assertRaisesRegex(
+            UBXMessageError, "Invalid configuration database key -1"
+        ):
+            UBX_CONFIGDB.encode_key(-1)
+        with self.assertRaisesRegex(
+            UBXMessageError, "Invalid configuration database key -1"
+        ):
+            UBXMessage.config_poll(0, 0, [-1])
+        with self.assertRaisesRegex(TypeError, "Attribute type U001 value 0.5"):
+            UBX_CONFIGDB.encode(0x20910007, 0.5)
+        with self.assertRaisesRegex(
+            OverflowError, "Attribute type U001 value 256 out of range"
+        ):
+            UBX_CONFIGDB.encode(0x20910007, 256)
+
+    def testConfigSetBatch(self):  # chunked transactional CFG-VALSET
+        cfgdata = [
+            (name, 1)
+            for name, (keyid, typ) in UBX_CONFIG_DATABASE.items()
+            if typ in ("U001", "L001", "E001")
+            and UBX_CONFIGDB.key2name(keyid)[0] == name  # exclude duplicate keyIDs
+        ][0:600]
+        msgs = UBXMessage.config_set_batch(SET_LAYER_FLASH, cfgdata)
+        self.assertEqual(len(msgs), 10)
+        self.assertEqual(
+            [msg.payload[2] for msg in msgs],
+            [TXN_START] + [TXN_ONGOING] * 8 + [TXN_COMMIT],
+        )
+        res = []
+        for msg in msgs:
+            self.assertEqual(msg.identity, "CFG-VALSET")
+            self.assertEqual((msg.version, msg.flash), (1, 1))
+            vals = UBX_CONFIGDB.decode(msg.payload, 4)
+            self.assertLessEqual(len(vals), 64)
+            res += list(vals.items())
+        self.assertEqual(res, cfgdata)
+        self.assertEqual(
+            msgs[1].serialize(),
+            UBXMessage.config_set(
+                SET_LAYER_FLASH, TXN_ONGOING, cfgdata[64:128]
+            ).serialize(),
+        )
+        msgs = UBXMessage.config_set_batch(SET_LAYER_FLASH, dict(cfgdata[0:64]))
+        self.assertEqual(len(msgs), 1)
+        self.assertEqual(
+            msgs[0].serialize(),
+            UBXMessage.config_set(SET_LAYER_FLASH, TXN_NONE, cfgdata[0:64]).serialize(),
+        )
+        msgs = UBXMessage.config_set_batch(SET_LAYER_FLASH, cfgdata[0:25], maxkeys=10)
+        self.assertEqual(
+            [msg.payload[2] for msg in msgs], [TXN_START, TXN_ONGOING, TXN_COMMIT]
+        )
+        self.assertEqual([len(msg.payload) for msg in msgs], [54, 54, 29])
+        msgs = UBXMessage.config_set_batch(SET_LAYER_FLASH, cfgdata[0:20], maxkeys=10)
+        self.assertEqual([msg.payload[2] for msg in msgs], [TXN_START, TXN_COMMIT])
+        self.assertEqual(UBXMessage.config_set_batch(SET_LAYER_FLASH, []), [])
+        for maxkeys in (0, 65):
+            with self.assertRaisesRegex(
+                UBXMessageError, f"per message {maxkeys} must be between 1 and 64"
+            ):
+                UBXMessage.config_set_batch(SET_LAYER_FLASH, cfgdata, maxkeys)
+        with self.assertRaisesRegex(
+            UBXMessageError, "Undefined configuration database key FOO_BAR"
+        ):
+            UBXMessage.config_set_batch(SET_LAYER_FLASH, cfgdata + [("FOO_BAR", 1)])
+
+    def testExpand(self):  # keyname patterns resolved via prefix trie
+        self.assertEqual(
+            UBX_CONFIGDB.expand("CFG_MSGOUT_UBX_NAV_PVT*"),
+            [
+                "CFG_MSGOUT_UBX_NAV_PVT_I2C",
+                "CFG_MSGOUT_UBX_NAV_PVT_SPI",
+                "CFG_MSGOUT_UBX_NAV_PVT_UART1",
+                "CFG_MSGOUT_UBX_NAV_PVT_UART2",
+                "CFG_MSGOUT_UBX_NAV_PVT_USB",
+            ],
+        )
+        for pattern in (
+            "CFG_MSGOUT_UBX_NAV_",
+            "CFG_UART1",
+            "CFG_NAVSPG_USRDAT_ROT",
+            "CFG_",
+            "",
+        ):
+            self.assertEqual(
+                UBX_CONFIGDB.expand(pattern + "*"),
+                [name for name in UBX_CONFIG_DATABASE if name.startswith(pattern)],
+            )
+        self.assertEqual(UBX_CONFIGDB.expand("CFG_RATE_MEAS"), ["CFG_RATE_MEAS"])
+        self.assertEqual(UBX_CONFIGDB.expand("CFG_RATE_MEAS*"), ["CFG_RATE_MEAS"])
+        self.assertEqual(UBX_CONFIGDB.expand("CFG_RATE_FOO"), [])
+        self.assertEqual(UBX_CONFIGDB.expand("CFG_FOO_*"), [])
+        self.assertEqual(UBX_CONFIGDB.expand("CFG_RATE_FOO*"), [])
+        with self.assertRaisesRegex(
+            UBXMessageError, "Invalid configuration key pattern CFG_\\*_MEAS\\*"
+        ):
+            UBX_CONFIGDB.expand("CFG_*_MEAS*")
+        cdb = ConfigDatabase(
+            {
+                "CFG_FOO_BAR": (0x10FF0001, "L001"),
+                "CFG_FOO_BAR_BAZ": (0x10FF0002, "L001"),
+                "CFG_FOO__QUX": (0x10FF0003, "L001"),
+            }
+        )
+        self.assertEqual(
+            cdb.expand("CFG_FOO_*"), ["CFG_FOO_BAR", "CFG_FOO_BAR_BAZ", "CFG_FOO__QUX"]
+        )
+        self.assertEqual(UBX_CONFIGDB.wildcard("MSGOUT"), 0x2091FFFF)
+        self.assertEqual(UBX_CONFIGDB.wildcard(0x21), 0x2021FFFF)
+        with self.assertRaisesRegex(UBXMessageError, "Undefined configuration group FOO"):
+            UBX_CONFIGDB.wildcard("FOO")
+        with self.assertRaisesRegex(UBXMessageError, "Undefined configuration group 238"):
+            UBX_CONFIGDB.wildcard(0xEE)
+
+    def testRefresh(self):  # indexes rebuilt when keys added to definitions
+        database = {"CFG_FOO_BAR": (0x10FF0001, "L001")}
+        cdb = ConfigDatabase(database)
+        self.assertEqual(len(cdb), 1)
+        self.assertEqual(cdb.key2name(0x10FF0002), ("CFG_0x10ff0002", "X001"))
+        self.assertNotIn("CFG_FOO_BAZ", cdb)
+        database["CFG_FOO_BAZ"] = (0x10FF0002, "L001")
+        self.assertIn("CFG_FOO_BAZ", cdb)
+        self.assertEqual(cdb.key2name(0x10FF0002), ("CFG_FOO_BAZ", "L001"))
+        database["CFG_FOO_QUX"] = (0x10FF0003, "L001")
+        self.assertEqual(cdb.name2key("CFG_FOO_QUX"), (0x10FF0003, "L001"))
+        database["CFG_FOO_QUUX"] = (0x10FF0004, "L001")
+        self.assertIn(0x10FF0004, cdb)
+        database["CFG_FOO_CORGE"] = (0x10FF0005, "L001")
+        self.assertEqual(cdb.key2name(0x10FF0005), ("CFG_FOO_CORGE", "L001"))
+        database["CFG_QUX_FOO"] = (0x10FE0001, "L001")
+        self.assertEqual(cdb.groups, {"FOO": 0xFF, "QUX": 0xFE})
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,397 @@
+"""
+Configuration polling, comparison and synchronisation tests for pyubx2.
+
+Uses a simulated receiver whose configuration database responds to
+CFG-VALGET, CFG-VALSET and CFG-VALDEL messages as per the UBX protocol,
+interspersed with unrelated messages.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+
+from pyubx2 import (
+    GET,
+    POLL_LAYER_BBR,
+    POLL_LAYER_DEFAULT,
+    POLL_LAYER_FLASH,
+    POLL_LAYER_RAM,
+    SET_LAYER_BBR,
+    SET_LAYER_FLASH,
+    SET_LAYER_RAM,
+    TXN_COMMIT,
+    TXN_NONE,
+    TXN_START,
+    UBX_CONFIGDB,
+    UBXMessage,
+    UBXReader,
+    config_diff,
+    config_get,
+    config_iter,
+    config_sync,
+)
+from pyubx2.exceptions import UBXMessageError, UBXStreamError
+from pyubx2.ubxtypes_configdb import UBX_CONFIG_DATABASE
+
+NOISE = (
+    b"$GNGLL,5327.04319,N,00214.41396,W,223232.00,A,A*67\r\n"
+    + UBXMessage("ACK", "ACK-ACK", GET, clsID=0x06, msgID=0x01).serialize()
+)
+
+# unique keyIDs of integer type, and their default values
+PROFILE = {
+    name: 1
+    for name, (keyid, typ) in UBX_CONFIG_DATABASE.items()
+    if typ in ("U001", "L001", "E001") and UBX_CONFIGDB.key2name(keyid)[0] == name
+}
+DEFAULTS = {name: 0 for name in PROFILE}
+DEFAULTS["CFG_NAVSPG_USRDAT_ROTX"] = 0.0
+
+
+class FakeReceiver:  # simulated receiver configuration database
+    def __init__(self, default: dict, reject: tuple = (), mute: tuple = ()):
+        self.layers = {
+            layer: {} for layer in (POLL_LAYER_RAM, POLL_LAYER_BBR, POLL_LAYER_FLASH)
+        }
+        self.layers[POLL_LAYER_DEFAULT] = self._encode(default)
+        self.layers[POLL_LAYER_RAM].update(self.layers[POLL_LAYER_DEFAULT])
+        self.reject = [UBX_CONFIGDB.keyid(key) for key in reject]
+        self.mute = mute
+        self.received = []
+        self._pending = []
+        self._out = b""
+
+    @staticmethod
+    def _encode(vals: dict) -> dict:
+        return {
+            UBX_CONFIGDB.keyid(name): UBX_CONFIGDB.encode(name, val)[4:]
+            for name, val in vals.items()
+        }
+
+    @staticmethod
+    def _pairs(payload: bytes, values: bool = True) -> list:
+        pairs = []
+        offset = 4
+        while offset < len(payload):
+            keyid = int.from_bytes(payload[offset : offset + 4], "little")
+            size = UBX_CONFIGDB.keysize(keyid) if values else 0
+            pairs.append((keyid, payload[offset + 4 : offset + 4 + size]))
+            offset += 4 + size
+        return pairs
+
+    def polls(self) -> list:  # keyIDs and position of CFG-VALGET polls received
+        return [
+            (
+                [keyid for keyid, _ in self._pairs(payload, False)],
+                int.from_bytes(payload[2:4], "little"),
+            )
+            for msgid, payload in self.received
+            if msgid == 0x8B
+        ]
+
+    def values(self, layer: int) -> dict:
+        return {
+            UBX_CONFIGDB.key2name(keyid)[0]: valb
+            for keyid, valb in self.layers[layer].items()
+        }
+
+    def _respond(self, msgid: int, *payloads: bytes, ack: bool = True):
+        for payload in payloads:
+            self._out += (
+                NOISE
+                + UBXMessage("CFG", "CFG-VALGET", GET, payload=payload).serialize()
+            )
+        self._out += UBXMessage(
+            "ACK", "ACK-ACK" if ack else "ACK-NAK", GET, clsID=0x06, msgID=msgid
+        ).serialize()
+
+    def write(self, data: bytes) -> int:
+        msgid = data[3]
+        payload = data[6:-2]
+        self.received.append((msgid, payload))
+        if msgid in self.mute:
+            return len(data)
+        if msgid == 0x8B:  # CFG-VALGET
+            self._valget(payload)
+        elif msgid == 0x8A:  # CFG-VALSET
+            pairs = self._pairs(payload)
+            if any(keyid in self.reject for keyid, _ in pairs):
+                self._pending = []
+                self._respond(msgid, ack=False)
+                return len(data)
+            self._pending += [(payload[1], keyid, valb) for keyid, valb in pairs]
+            self._commit(payload[2])
+            self._respond(msgid)
+        elif msgid == 0x8C:  # CFG-VALDEL
+            self._pending += [
+                (payload[1], keyid, None) for keyid, _ in self._pairs(payload, False)
+            ]
+            self._commit(payload[2])
+            self._respond(msgid)
+        return len(data)
+
+    def _commit(self, txn: int):
+        if txn not in (TXN_NONE, TXN_COMMIT):
+            return
+        for mask, keyid, valb in self._pending:
+            for bit, layer in (
+                (1, POLL_LAYER_RAM),
+                (2, POLL_LAYER_BBR),
+                (4, POLL_LAYER_FLASH),
+            ):
+                if mask & bit:
+                    if valb is None:
+                        self.layers[layer].pop(keyid, None)
+                    else:
+                        self.layers[layer][keyid] = valb
+        self._pending = []
+
+    def _valget(self, payload: bytes):
+        layer = payload[1]
+        position = int.from_bytes(payload[2:4], "little")
+        stored = self.layers[layer]
+        found = {}
+        for keyid, _ in self._pairs(payload, False):
+            if keyid & 0xFFFF == 0xFFFF:
+                for kid in sorted(stored):
+                    if UBX_CONFIGDB.keygroup(kid) == UBX_CONFIGDB.keygroup(keyid):
+                        found[kid] = stored[kid]
+            elif keyid in stored:
+                found[keyid] = stored[keyid]
+        page = list(found.items())[position : position + 64]
+        if not page:
+            self._respond(0x8B, ack=False)
+            return
+        header = b"\x01" + payload[1:4]
+        # unrelated response to earlier poll precedes response
+        if position:
+            self._out += UBXMessage(
+                "CFG", "CFG-VALGET", GET, payload=b"\x01" + payload[1:2] + b"\x00\x00"
+            ).serialize()
+        self._respond(
+            0x8B,
+            header + b"".join(kid.to_bytes(4, "little") + valb for kid, valb in page),
+        )
+
+    def read(self, size: int) -> bytes:
+        data = self._out[0:size]
+        self._out = self._out[size:]
+        return data
+
+    def readline(self) -> bytes:
+        return self.read(self._out.find(b"\n") + 1)
+
+
+class ConfigSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testGET(self):  # named and paged wildcard polls
+        rcvr = FakeReceiver(DEFAULTS)
+        ubr = UBXReader(rcvr)
+        names = list(PROFILE)[0:100] + ["CFG_NAVSPG_USRDAT_ROTX"]
+        res = config_get(ubr, names)
+        self.assertEqual(res, {name: DEFAULTS[name] for name in names})
+        self.assertEqual(len(rcvr.received), 2)  # no paging of named keys
+        msgout = [name for name in PROFILE if name.startswith("CFG_MSGOUT_")]
+        self.assertGreater(len(msgout), 128)
+        rcvr.received = []
+        res = config_get(ubr, [0x2091FFFF], POLL_LAYER_DEFAULT)
+        self.assertEqual(res, {name: 0 for name in msgout})
+        positions = [
+            int.from_bytes(payload[2:4], "little") for _, payload in rcvr.received
+        ]
+        self.assertEqual(positions, list(range(0, len(msgout) + 1, 64)))
+        self.assertEqual(config_get(ubr, ["CFG_UART1_BAUDRATE"], POLL_LAYER_FLASH), {})
+        self.assertEqual(config_get(ubr, []), {})
+
+    def testITER(self):  # keyname patterns and full database dumps
+        rcvr = FakeReceiver(DEFAULTS)
+        ubr = UBXReader(rcvr)
+        navout = [name for name in PROFILE if name.startswith("CFG_MSGOUT_UBX_NAV_")]
+        res = list(config_iter(ubr, ["CFG_MSGOUT_UBX_NAV_*"]))
+        self.assertEqual(
+            [len(page) for page in res], [64] * (len(navout) // 64) + [len(navout) % 64]
+        )
+        self.assertEqual(
+            {k: v for page in res for k, v in page.items()}, dict.fromkeys(navout, 0)
+        )
+        self.assertEqual(
+            {position for _, position in rcvr.polls()}, {0}
+        )  # keys by name, not paged
+        rcvr.received = []
+        res = config_get(
+            ubr, ["CFG_MSGOUT_*", "CFG_MSGOUT_UBX_NAV_PVT_USB", 0x2091FFFF]
+        )
+        self.assertEqual(
+            res, {name: 0 for name in PROFILE if name.startswith("CFG_MSGOUT_")}
+        )
+        self.assertEqual(rcvr.polls()[0], ([0x2091FFFF, 0x20910009], 0))
+        for pattern in ("*", "CFG_*"):  # full database dump
+            rcvr.received = []
+            res = config_get(ubr, [pattern], POLL_LAYER_DEFAULT)
+            self.assertEqual(
+                res, {**dict.fromkeys(PROFILE, 0), "CFG_NAVSPG_USRDAT_ROTX": 0.0}
+            )
+            polls = rcvr.polls()
+            self.assertEqual(len(polls[0][0]), len(UBX_CONFIGDB.groups))
+            self.assertEqual(
+                [position for _, position in polls], list(range(0, len(res) + 1, 64))
+            )
+        self.assertEqual(config_get(ubr, ["*"], POLL_LAYER_FLASH), {})
+        with self.assertRaisesRegex(
+            UBXMessageError, "No configuration keys match CFG_FOO_"
+        ):
+            config_get(ubr, ["CFG_FOO_*"])
+
+    def testDIFF(self):  # minimal CFG-VALSET / CFG-VALDEL sequence
+        current = {
+            POLL_LAYER_RAM: {
+                "CFG_RATE_MEAS": 1000,
+                "CFG_NAVSPG_DYNMODEL": 4,
+                "CFG_NAVSPG_USRDAT_ROTY": 0.10000000149011612,
+            },
+            POLL_LAYER_BBR: {"CFG_NAVSPG_DYNMODEL": 2},
+            POLL_LAYER_FLASH: {"CFG_RATE_MEAS": 200, "CFG_NAVSPG_DYNMODEL": 4},
+            POLL_LAYER_DEFAULT: {
+                "CFG_RATE_MEAS": 1000,
+                "CFG_NAVSPG_DYNMODEL": 0,
+                "CFG_NAVSPG_USRDAT_ROTY": 0.0,
+            },
+        }
+        desired = {
+            "CFG_RATE_MEAS": 1000,
+            "CFG_NAVSPG_DYNMODEL": 4,
+            "CFG_NAVSPG_USRDAT_ROTY": 0.1,
+        }
+        self.assertEqual(config_diff(desired, current), [])  # RAM unchanged
+        res = config_diff(desired, current, SET_LAYER_RAM | SET_LAYER_FLASH)
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                "<UBX(CFG-VALSET, version=0, ram=0, bbr=0, flash=1, action=0, reserved0=0, CFG_NAVSPG_USRDAT_ROTY=0.10000000149011612)>",
+                "<UBX(CFG-VALDEL, version=0, bbr=0, flash=1, action=0, reserved0=0, keys_01=807469057)>",
+            ],
+        )
+        # BBR value reverts to Flash value if deleted
+        res = config_diff(desired, current, SET_LAYER_BBR)
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                "<UBX(CFG-VALSET, version=0, ram=0, bbr=1, flash=0, action=0, reserved0=0, CFG_RATE_MEAS=1000, CFG_NAVSPG_USRDAT_ROTY=0.10000000149011612)>",
+                "<UBX(CFG-VALDEL, version=0, bbr=1, flash=0, action=0, reserved0=0, keys_01=537985057)>",
+            ],
+        )
+        res = config_diff(
+            {"CFG_RATE_MEAS": 200}, current, SET_LAYER_RAM | SET_LAYER_BBR
+        )
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                "<UBX(CFG-VALSET, version=0, ram=1, bbr=0, flash=0, action=0, reserved0=0, CFG_RATE_MEAS=200)>"
+            ],
+        )
+        res = config_diff(
+            {"CFG_RATE_MEAS": 1000}, current, SET_LAYER_BBR | SET_LAYER_FLASH
+        )
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                "<UBX(CFG-VALDEL, version=0, bbr=0, flash=1, action=0, reserved0=0, keys_01=807469057)>"
+            ],
+        )
+        res = config_diff(
+            {"CFG_RATE_MEAS": 500}, {}, SET_LAYER_RAM | SET_LAYER_BBR | SET_LAYER_FLASH
+        )
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [
+                "<UBX(CFG-VALSET, version=0, ram=1, bbr=0, flash=1, action=0, reserved0=0, CFG_RATE_MEAS=500)>"
+            ],
+        )
+        with self.assertRaises(TypeError):
+            config_diff({"CFG_RATE_MEAS": "1000"}, current)
+
+    def testDIFFBATCH(self):  # changes exceeding 64 keys are sent as transactions
+        current = {
+            POLL_LAYER_RAM: dict.fromkeys(PROFILE, 0),
+            POLL_LAYER_FLASH: dict.fromkeys(PROFILE, 0),
+            POLL_LAYER_DEFAULT: dict.fromkeys(PROFILE, 1),
+        }
+        res = config_diff(PROFILE, current, SET_LAYER_RAM | SET_LAYER_FLASH)
+        num = (len(PROFILE) + 63) // 64
+        self.assertEqual(len(res), num * 2)
+        self.assertEqual([msg.identity for msg in res[num:]], ["CFG-VALDEL"] * num)
+        self.assertEqual(res[num].payload[2], TXN_START)
+        self.assertEqual(res[-1].payload[2], TXN_COMMIT)
+        self.assertEqual(
+            sum(len(msg.payload) - 4 for msg in res[num:]), len(PROFILE) * 4
+        )
+
+    def testSYNC(self):  # only changed keys are sent
+        rcvr = FakeReceiver(DEFAULTS)
+        ubr = UBXReader(rcvr)
+        layers = SET_LAYER_RAM | SET_LAYER_BBR | SET_LAYER_FLASH
+        sent = config_sync(ubr, PROFILE, layers)
+        num = (len(PROFILE) + 63) // 64
+        self.assertEqual(len(sent), num)
+        # BBR value reverts to Flash value
+        self.assertEqual(
+            [msg.payload[1] for msg in sent], [SET_LAYER_RAM | SET_LAYER_FLASH] * num
+        )
+        self.assertEqual(
+            rcvr.values(POLL_LAYER_RAM),
+            {**rcvr.values(POLL_LAYER_DEFAULT), **dict.fromkeys(PROFILE, b"\x01")},
+        )
+        self.assertEqual(rcvr.values(POLL_LAYER_FLASH), dict.fromkeys(PROFILE, b"\x01"))
+        self.assertEqual(rcvr.values(POLL_LAYER_BBR), {})
+        # receiver already configured
+        rcvr.received = []
+        self.assertEqual(config_sync(ubr, PROFILE, layers), [])
+        self.assertEqual({msgid for msgid, _ in rcvr.received}, {0x8B})
+        # one key changed, one reverted to default
+        profile = dict(PROFILE)
+        profile["CFG_RATE_NAV"] = 2
+        profile["CFG_NAVSPG_DYNMODEL"] = 0
+        sent = config_sync(ubr, profile, layers)
+        self.assertEqual(
+            [str(msg) for msg in sent],
+            [
+                "<UBX(CFG-VALSET, version=0, ram=1, bbr=0, flash=0, action=0, reserved0=0, CFG_NAVSPG_DYNMODEL=0)>",
+                "<UBX(CFG-VALSET, version=0, ram=1, bbr=0, flash=1, action=0, reserved0=0, CFG_RATE_NAV=2)>",
+                "<UBX(CFG-VALDEL, version=0, bbr=0, flash=1, action=0, reserved0=0, keys_01=537985057)>",
+            ],
+        )
+        self.assertEqual(config_sync(ubr, profile, layers), [])
+        self.assertNotIn("CFG_NAVSPG_DYNMODEL", rcvr.values(POLL_LAYER_FLASH))
+
+    def testSYNCERRORS(self):
+        rcvr = FakeReceiver(DEFAULTS, reject=("CFG_RATE_NAV",))
+        ubr = UBXReader(rcvr)
+        with self.assertRaisesRegex(UBXStreamError, "CFG-VALSET rejected by receiver"):
+            config_sync(ubr, {"CFG_RATE_NAV": 2, "CFG_RATE_MEAS": 2})
+        self.assertNotIn("CFG_RATE_MEAS", rcvr.values(POLL_LAYER_RAM))
+        ubr = UBXReader(FakeReceiver(DEFAULTS, mute=(0x8B,)))
+        with self.assertRaisesRegex(
+            UBXStreamError, "Timed out waiting for CFG-VALGET response"
+        ):
+            config_get(ubr, ["CFG_RATE_NAV"], timeout=0.05)
+        ubr = UBXReader(FakeReceiver(DEFAULTS, mute=(0x8A,)))
+        with self.assertRaisesRegex(
+            UBXStreamError, "Timed out waiting for CFG-VALSET response"
+        ):
+            config_sync(ubr, {"CFG_RATE_NAV": 2}, timeout=0.05)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Lazy attribute decoding tests for pyubx2.LazyUBXMessage.
+
+Compares lazily decoded attributes with those of eagerly parsed
+UBXMessage objects.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import copy
+import os
+import pickle
+import unittest
+
+from pyubx2 import (
+    GET,
+    SET,
+    U1,
+    U2,
+    UBX_PROTOCOL,
+    VALNONE,
+    X6,
+    LazyUBXMessage,
+    UBXMessage,
+    UBXReader,
+)
+from pyubx2.exceptions import UBXTypeError
+from pyubx2.ubxcodec import _AccessorCompiler, get_accessor
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+
+DIRNAME = os.path.dirname(__file__)
+
+LOGS = (
+    "pygpsdata-ALL.log",
+    "pygpsdata-ESF.log",
+    "pygpsdata-NAVHPPOS.log",
+    "pygpsdata-RXMRAWX.log",
+    "ucenter-ZEDF9P-configdebug.log",
+)
+
+
+def read_raw(log: str) -> list:
+    with open(os.path.join(DIRNAME, log), "rb") as stream:
+        return [
+            raw for raw, _ in UBXReader(stream, protfilter=UBX_PROTOCOL, parsing=False)
+        ]
+
+
+def instance_dict(msg: UBXMessage) -> dict:
+    # instance attributes, without triggering lazy decoding
+    return object.__getattribute__(msg, "__dict__")
+
+
+class LazyMessageTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.rawx = read_raw("pygpsdata-RXMRAWX.log")[0]
+
+    def tearDown(self):
+        pass
+
+    def testLAZYLOGS(self):  # lazy output must match eager parsing
+        for log in LOGS:
+            for raw in read_raw(log):
+                expected = UBXReader.parse(raw)
+                names = [att for att in expected.__dict__ if att[0] != "_"]
+                msg = UBXReader.parse(raw, lazy=True)
+                for name in names[0:2] + names[-2:]:
+                    self.assertEqual(getattr(msg, name), getattr(expected, name))
+                self.assertEqual(str(msg), str(expected))
+                self.assertEqual(
+                    list(msg.__dict__.items()), list(expected.__dict__.items())
+                )
+                self.assertIs(type(msg), UBXMessage)
+
+    def testLAZYACCESS(self):  # individual attributes decoded on demand
+        expected = UBXReader.parse(self.rawx)
+        msg = UBXReader.parse(self.rawx, lazy=True)
+        self.assertIsInstance(msg, LazyUBXMessage)
+        self.assertEqual(msg.identity, "RXM-RAWX")
+        self.assertEqual(msg.serialize(), self.rawx)
+        self.assertEqual(msg.length, len(self.rawx) - 8)
+        self.assertEqual(msg.numMeas, 23)
+        self.assertEqual(msg.prMes_05, expected.prMes_05)
+        self.assertEqual(getattr(msg, "cpValid_23"), expected.cpValid_23)
+        self.assertEqual(msg.leapSec, expected.leapSec)
+        self.assertIs(type(msg), LazyUBXMessage)  # not fully decoded
+        self.assertEqual(
+            [att for att in instance_dict(msg) if att[0] != "_"],
+            ["numMeas", "prMes_05", "cpValid_23", "leapSec"],
+        )
+        self.assertEqual(list(msg.__dict__), list(expected.__dict__))
+        self.assertIs(type(msg), UBXMessage)
+
+    def testLAZYMISSING(self):  # attribute not in payload
+        msg = UBXReader.parse(self.rawx, lazy=True)
+        for name in ("prMes_24", "prMes_5", "prMes_00", "prMes_xx", "trkStat_01"):
+            self.assertIsNone(getattr(msg, name, None))
+        with self.assertRaises(AttributeError):
+            _ = UBXReader.parse(self.rawx, lazy=True)._private
+        with self.assertRaises(AttributeError):
+            _ = UBXReader.parse(self.rawx, lazy=True).nonexistent
+        self.assertTrue(hasattr(msg, "prMes_23"))
+
+    def testLAZYUNINDEXED(self):  # attributes decoded from complete payload
+        raw = read_raw("pygpsdata-NAVHPPOS.log")[1]
+        expected = UBXReader.parse(raw)
+        for name in ("lat", "height"):  # combined with high precision component
+            msg = UBXReader.parse(raw, lazy=True)
+            self.assertEqual(getattr(msg, name), getattr(expected, name))
+            self.assertIs(type(msg), UBXMessage)
+        msg = UBXReader.parse(raw, lazy=True)
+        self.assertEqual(msg.hAcc, expected.hAcc)
+        self.assertIs(type(msg), LazyUBXMessage)
+
+    def testLAZYERROR(self):  # invalid payload raises on first access
+        msg = LazyUBXMessage(b"\x06", b"\x84", GET, b"\x00" * 12)
+        for _ in range(2):
+            with self.assertRaisesRegex(
+                UBXTypeError, "Incorrect type for attribute 'length'"
+            ):
+                _ = msg.seedHi
+            self.assertIsInstance(msg, LazyUBXMessage)
+
+    def testLAZYCHECKSUM(self):  # inconsistent length with validation disabled
+        raw = self.rawx[0:4] + b"\x00\x01" + self.rawx[6:]
+        expected = UBXReader.parse(raw, validate=VALNONE)
+        msg = UBXReader.parse(raw, validate=VALNONE, lazy=True)
+        self.assertEqual(msg.serialize(), expected.serialize())
+        msg = LazyUBXMessage(b"\x06", b"\x01", SET, b"\xf0\x01\x01")
+        self.assertEqual(
+            msg.serialize(), UBXReader.parse(msg.serialize(), msgmode=SET).serialize()
+        )
+
+    def testLAZYPICKLE(self):  # pickle and copy
+        msg = UBXReader.parse(self.rawx, lazy=True)
+        _ = msg.prMes_05
+        for msg2 in (pickle.loads(pickle.dumps(msg)), copy.copy(msg)):
+            self.assertIsInstance(msg2, LazyUBXMessage)
+            self.assertEqual(str(msg2), str(msg))
+
+    def testLAZYREADER(self):  # UBXReader lazy option
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            res = [parsed for _, parsed in UBXReader(stream, lazy=True)]
+            stream.seek(0)
+            expected = [str(parsed) for _, parsed in UBXReader(stream)]
+        self.assertEqual(
+            {type(msg) for msg in res if isinstance(msg, UBXMessage)},
+            {LazyUBXMessage},
+        )
+        self.assertEqual([str(msg) for msg in res], expected)
+
+    def testPROJECT(self):  # decode only selected attributes
+        expected = UBXReader.parse(self.rawx)
+        fields = ["numMeas", "prMes_05", "rcvTow", "prMes_24", "identity", "_payload"]
+        msg = UBXReader.parse(self.rawx, fields=fields)
+        self.assertIs(type(msg), UBXMessage)
+        self.assertEqual(
+            list(msg.__dict__.items())[-3:],
+            [
+                ("numMeas", expected.numMeas),
+                ("prMes_05", expected.prMes_05),
+                ("rcvTow", expected.rcvTow),
+            ],
+        )
+        self.assertEqual(msg.identity, "RXM-RAWX")
+        self.assertEqual(msg.serialize(), self.rawx)
+        self.assertEqual(
+            str(msg),
+            f"<UBX(RXM-RAWX, numMeas=23, prMes_05={expected.prMes_05}, rcvTow={expected.rcvTow})>",
+        )
+        self.assertIsNone(getattr(msg, "leapSec", None))
+        raw = read_raw("pygpsdata-NAVHPPOS.log")[1]
+        expected = UBXReader.parse(raw)
+        msg = UBXReader.parse(raw, fields=("lat", "hAcc"))  # decoded in full
+        self.assertEqual(
+            [att for att in msg.__dict__ if att[0] != "_"], ["lat", "hAcc"]
+        )
+        self.assertEqual((msg.lat, msg.hAcc), (expected.lat, expected.hAcc))
+
+    def testACCESSOR(self):  # group items and attributes after group
+        pdict = {
+            "id": U1,
+            "grp": ("None", {"a": [U2, 0.5], "b": ["I003", 0.1]}),
+        }
+        accessor = _AccessorCompiler(pdict, b"\xff\xff", GET, True).compile()
+        payload = b"\x01\x04\x00\xfe\xff\xff\x06\x00\x02\x00\x00"
+        self.assertEqual(accessor(payload, "a_01"), 2.0)
+        self.assertEqual(accessor(payload, "b_01"), -0.2)
+        self.assertEqual(accessor(payload, "b_02"), 0.2)
+        with self.assertRaises(KeyError):
+            accessor(payload[0:-1], "a_01")
+        pdict = {
+            "numCh": U1,
+            "grp": ("numCh", {"a": U1}),
+            "flags": (X6, {"b": U1, "reserved0": U1, "c": U1}),
+        }
+        accessor = _AccessorCompiler(pdict, b"\xff\xff", GET, True).compile()
+        payload = b"\x02\x07\x08\x05\x00\x00\x00\x00\x80"
+        self.assertEqual(accessor(payload, "a_02"), 8)
+        self.assertEqual(accessor(payload, "c"), 1)
+        with self.assertRaises(AttributeError):
+            accessor(payload, "reserved0")
+
+    def testACCESSORUNCOMPILABLE(self):
+        for pdict in (
+            {"grp": ("None", {"a": U1}), "b": U1},  # attribute after variable group
+            {"grp": ("num", {"a": U1})},  # unknown count attribute
+            {"grp": (2, {"a": U1}), "grp2": (2, {"b": U1})},  # multiple groups
+            {"msg": "CH"},  # variable length string
+            {"val": "Z001"},  # unknown attribute type
+        ):
+            self.assertIsNone(
+                get_accessor(pdict, b"\xff\xff", GET, True, UBXMessage), pdict
+            )
+        self.assertIsNotNone(
+            get_accessor(
+                UBX_PAYLOADS_GET["NAV-HPPOSLLH"], b"\x01\x14", GET, True, UBXMessage
+            )
+        )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,347 @@
+"""
+Indexed log file tests for pyubx2.UBXLog.
+
+Compares randomly accessed messages with those read sequentially
+by UBXReader.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyubx2 import (
+    ERR_IGNORE,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    GET,
+    SET,
+    UBX_PROTOCOL,
+    VALNONE,
+    UBXLog,
+    UBXMessage,
+    UBXReader,
+)
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxlog import itow_offset
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class LogTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def copylog(self, name: str) -> str:
+        filename = os.path.join(self.tmpdir, name)
+        shutil.copy(os.path.join(DIRNAME, name), filename)
+        return filename
+
+    def readlog(self, filename: str, **kwargs) -> list:
+        with open(filename, "rb") as stream:
+            return [(raw, str(parsed)) for raw, parsed in UBXReader(stream, **kwargs)]
+
+    def testINDEX(self):  # messages must match sequential reads
+        filename = self.copylog("pygpsdata-MIXED-RTCM3.log")
+        expected = self.readlog(filename)
+        with UBXLog(filename) as log:
+            self.assertEqual(len(log), len(expected))
+            self.assertEqual([(raw, str(parsed)) for raw, parsed in log], expected)
+            (raw, parsed) = log[-1]
+            self.assertEqual((raw, str(parsed)), expected[-1])
+            self.assertEqual(log.raw(3), expected[3][0])
+            self.assertEqual(
+                {log.info(i)[0] for i in range(len(log))},
+                {NMEA_PROTOCOL, UBX_PROTOCOL, RTCM3_PROTOCOL},
+            )
+            self.assertEqual(log.filename, filename)
+            self.assertEqual(log.indexfile, filename + ".idx")
+            with self.assertRaises(IndexError):
+                log.raw(len(log))
+        self.assertTrue(os.path.exists(filename + ".idx"))
+
+    def testINFO(self):  # index entries
+        filename = self.copylog("pygpsdata-MIXED.log")
+        with UBXLog(filename) as log:
+            offset = 0
+            for i, (raw, parsed) in enumerate(log):
+                (prot, off, length, itow) = log.info(i)
+                self.assertEqual(off, offset)
+                self.assertEqual(length, len(raw))
+                self.assertEqual(itow, getattr(parsed, "iTOW", None))
+                self.assertEqual(
+                    prot, UBX_PROTOCOL if raw[0:1] == b"\xb5" else NMEA_PROTOCOL
+                )
+                offset += length
+
+    def testSIDECAR(self):  # index reused while log file is unchanged
+        filename = self.copylog("pygpsdata-MIXED.log")
+        with UBXLog(filename) as log:
+            expected = [log.info(i) for i in range(len(log))]
+        with patch.object(UBXLog, "_scan") as scan:
+            with UBXLog(filename) as log:
+                self.assertEqual([log.info(i) for i in range(len(log))], expected)
+            scan.assert_not_called()
+            with UBXLog(filename, rebuild=True) as log:
+                scan.assert_called_once()
+                self.assertEqual(len(log), 0)
+        with UBXLog(filename, rebuild=True) as log:
+            self.assertEqual([log.info(i) for i in range(len(log))], expected)
+        with open(filename + ".idx", "ab") as idx:
+            idx.write(b"\x00")
+        with UBXLog(filename) as log:  # corrupt index rebuilt
+            self.assertEqual(len(log), len(expected))
+        with open(filename + ".idx", "r+b") as idx:
+            idx.truncate(100)
+        with UBXLog(filename) as log:  # truncated index rebuilt
+            self.assertEqual(len(log), len(expected))
+        with open(filename, "ab") as stream:
+            stream.write(b"\xb5\x62\x05\x01\x02\x00\x06\x01\x0f\x38")
+        with UBXLog(filename) as log:  # log file changed
+            self.assertEqual(len(log), len(expected) + 1)
+            self.assertEqual(
+                str(log[-1][1]), "<UBX(ACK-ACK, clsID=CFG, msgID=CFG-MSG)>"
+            )
+
+    def testBIGENDIAN(self):  # index file is little-endian on all platforms
+        filename = self.copylog("pygpsdata-MIXED.log")
+        with UBXLog(filename) as log:
+            expected = [log.info(i) for i in range(len(log))]
+        with open(filename + ".idx", "rb") as idx:
+            data = idx.read()
+        with patch.object(sys, "byteorder", "big"):
+            with UBXLog(filename, rebuild=True) as log:
+                pass
+            with open(filename + ".idx", "rb") as idx:
+                self.assertNotEqual(idx.read(), data)
+            with UBXLog(filename) as log:
+                self.assertEqual([log.info(i) for i in range(len(log))], expected)
+
+    def testREADONLY(self):  # index cannot be saved
+        filename = self.copylog("pygpsdata-MIXED.log")
+        indexfile = os.path.join(self.tmpdir, "nonexistent", "log.idx")
+        with self.assertLogs("pyubx2.ubxlog", level="WARNING"):
+            with UBXLog(filename, indexfile=indexfile) as log:
+                self.assertEqual(len(log), len(self.readlog(filename)))
+                self.assertEqual(log.indexfile, indexfile)
+
+    def testSELECT(self):  # select by message type and iTOW
+        filename = self.copylog("pygpsdata-MIXED.log")
+        expected = self.readlog(filename)
+        with UBXLog(filename) as log:
+            res = [str(parsed) for _, parsed in log.select("NAV-PVT")]
+            self.assertEqual(
+                res, [parsed for _, parsed in expected if "NAV-PVT" in parsed]
+            )
+            self.assertEqual(len(res), 39)
+            self.assertEqual(
+                log.indices("NAV-PVT", b"\x01\x35"),
+                [
+                    i
+                    for i, (_, parsed) in enumerate(expected)
+                    if parsed[5:12] in ("NAV-PVT", "NAV-SAT")
+                ],
+            )
+            self.assertEqual(log.indices(), list(range(len(log))))
+            pvts = [parsed for _, parsed in log.select("NAV-PVT")]
+            (start, end) = (pvts[10].iTOW, pvts[20].iTOW)
+            res = list(log.select("NAV-PVT", itow=(start, end)))
+            self.assertEqual(
+                [parsed.iTOW for _, parsed in res], [p.iTOW for p in pvts[10:21]]
+            )
+            self.assertTrue(len(log.indices(itow=(start, end))) > 11)
+            i = log.seek_itow(start)
+            self.assertEqual(log.info(i)[3], start)
+            self.assertTrue(
+                all(
+                    log.info(j)[3] < start
+                    for j in range(i)
+                    if log.info(j)[3] is not None
+                )
+            )
+            self.assertEqual(log.seek_itow(start + 1), log.seek_itow(start + 999))
+            self.assertEqual(log.seek_itow(0xFFFFFFF0), len(log))
+            with self.assertRaisesRegex(
+                UBXStreamError, "Unknown message identity NAV-XXX"
+            ):
+                log.indices("NAV-XXX")
+            with self.assertRaisesRegex(UBXStreamError, "Invalid message type 263"):
+                log.indices(263)
+
+    def testQUERY(self):  # indexed queries must match scan of index entries
+        for name, msgs in (
+            (
+                "pygpsdata-MIXED.log",
+                (("NAV-PVT",), ("NAV-PVT", b"\x01\x35"), ("NAV-EOE",)),
+            ),
+            ("pygpsdata-NAV.log", (("NAV-SAT", "NAV-STATUS", b"\x01\x07"),)),
+            ("pygpsdata-MIXED-RTCM3.log", (("1077", "NAV-PVT"), ("4072",))),
+        ):
+            filename = self.copylog(name)
+            with UBXLog(filename) as log:
+                entries = [log.info(i) for i in range(len(log))]
+                itows = sorted({e[3] for e in entries if e[3] is not None})
+                (lo, hi) = (itows[len(itows) // 3], itows[len(itows) * 2 // 3])
+                for msg in msgs:
+                    typed = set(log.indices(*msg))
+                    for itow in (
+                        None,
+                        (itows[0], itows[-1]),
+                        (lo, hi),
+                        (hi, hi),
+                        (itows[-1] + 1, 0xFFFFFFFF),
+                        (hi + 1, lo),
+                    ):
+                        self.assertEqual(
+                            log.indices(*msg, itow=itow),
+                            [
+                                i
+                                for i, e in enumerate(entries)
+                                if i in typed
+                                and (
+                                    itow is None
+                                    or (e[3] is not None and itow[0] <= e[3] <= itow[1])
+                                )
+                            ],
+                        )
+                        self.assertEqual(
+                            log.indices(itow=itow),
+                            [
+                                i
+                                for i, e in enumerate(entries)
+                                if itow is None
+                                or (e[3] is not None and itow[0] <= e[3] <= itow[1])
+                            ],
+                        )
+
+    def testSELECTRTCM(self):  # select RTCM3 message types
+        filename = self.copylog("pygpsdata-MIXED-RTCM3.log")
+        expected = self.readlog(filename)
+        with UBXLog(filename) as log:
+            for msg in ("1005", "1077", "4072"):
+                self.assertEqual(
+                    [str(parsed) for _, parsed in log.select(msg)],
+                    [
+                        parsed
+                        for _, parsed in expected
+                        if parsed.startswith(f"<RTCM({msg}")
+                    ],
+                )
+
+    def testSELECTMGA(self):  # select MGA message types
+        filename = self.copylog("assistnow.log")
+        expected = self.readlog(filename, msgmode=SET)
+        with UBXLog(filename, msgmode=SET) as log:
+            self.assertEqual(
+                [str(parsed) for _, parsed in log.select("MGA-INI-TIME-UTC")],
+                [parsed for _, parsed in expected if "MGA-INI-TIME-UTC" in parsed],
+            )
+            self.assertEqual(
+                len(log.indices("MGA-GPS-EPH")),
+                len([parsed for _, parsed in expected if "MGA-GPS-EPH" in parsed]),
+            )
+            self.assertEqual(
+                log.indices(b"\x13\x00"),
+                log.indices(
+                    "MGA-GPS-EPH",
+                    "MGA-GPS-ALM",
+                    "MGA-GPS-HEALTH",
+                    "MGA-GPS-IONO",
+                    "MGA-GPS-UTC",
+                ),
+            )
+
+    def testSCAN(self):  # messages spanning chunks, unknown and incomplete data
+        relposned = UBXMessage(
+            "NAV", "NAV-RELPOSNED", GET, version=1, iTOW=12345, relPosN=100
+        ).serialize()
+        first = self.readlog(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"))[0][0]
+        data = (
+            first
+            + b"\xb5\x99\x24\x47"
+            + b"x" * 5000
+            + relposned
+            + b"\xb5\x62\x13\x21\x01\x00\x05\x3a\xeb"  # unknown MGA-FLASH type
+            + b"\xb5\x62\x01\x07\x00\x00\x08\x19"  # no payload
+            + b"\xd3\x00"  # incomplete
+        )
+        filename = os.path.join(self.tmpdir, "scan.log")
+        with open(filename, "wb") as stream:
+            stream.write(data)
+        with patch("pyubx2.ubxlog.SCAN_CHUNK", 7):
+            with UBXLog(filename) as log:
+                self.assertEqual(len(log), 4)
+                self.assertEqual(
+                    log.info(1),
+                    (UBX_PROTOCOL, len(first) + 5004, len(relposned), 12345),
+                )
+                self.assertEqual(log.raw(1), relposned)
+                self.assertIsNone(log.info(2)[3])
+                self.assertEqual(log.indices("NAV-PVT"), [3])
+
+    def testSCANGARBAGE(self):  # long runs of unrecognised data between chunks
+        relposned = UBXMessage(
+            "NAV", "NAV-RELPOSNED", GET, version=1, iTOW=12345, relPosN=100
+        ).serialize()
+        garbage = b"\xb5" * 100000
+        data = garbage + relposned + b"$G" * 50000 + relposned + garbage
+        filename = os.path.join(self.tmpdir, "garbage.log")
+        with open(filename, "wb") as stream:
+            stream.write(data)
+        with patch("pyubx2.ubxlog.SCAN_CHUNK", 1 << 15):
+            with UBXLog(filename) as log:
+                self.assertEqual(len(log), 2)
+                self.assertEqual(log.info(0)[1], len(garbage))
+                self.assertEqual(log.info(1)[1], data.rindex(relposned))
+                self.assertEqual(log.raw(1), relposned)
+
+    def testVALIDATE(self):  # UBX messages with invalid checksums excluded
+        filename = self.copylog("pygpsdata-MIXED3BADCK.log")
+        expected = self.readlog(filename, quitonerror=ERR_IGNORE)
+        allmsgs = self.readlog(filename, validate=VALNONE)
+        self.assertEqual(len(allmsgs), len(expected) + 1)
+        with self.assertLogs("pyubx2.ubxlog", level="WARNING") as logs:
+            with UBXLog(filename) as log:
+                self.assertEqual([(raw, str(parsed)) for raw, parsed in log], expected)
+        self.assertIn("1 UBX messages with invalid checksums", logs.output[0])
+        with UBXLog(filename, validate=VALNONE) as log:  # index rebuilt
+            self.assertEqual(len(log), len(allmsgs))
+            self.assertEqual([log.raw(i) for i in range(len(log))], [raw for raw, _ in allmsgs])
+        with patch.object(UBXLog, "_scan") as scan:
+            with UBXLog(filename, validate=VALNONE) as log:
+                scan.assert_not_called()
+                self.assertEqual(len(log), len(allmsgs))
+
+    def testITOWOFFSET(self):
+        self.assertEqual(
+            itow_offset(
+                {"version": "U001", "flags": ("X001", {"a": "U001"}), "iTOW": "U004"}
+            ),
+            2,
+        )
+        self.assertIsNone(
+            itow_offset(
+                {"numSv": "U001", "group": ("numSv", {"a": "U001"}), "iTOW": "U004"}
+            )
+        )
+        self.assertIsNone(itow_offset({"msg": "CH", "iTOW": "U004"}))
+        self.assertIsNone(itow_offset({"lat": ["I004", 1e-7]}))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Multi-process parsing tests for pyubx2.parse_file_parallel.
+
+Compares messages parsed in parallel with those read sequentially
+by UBXReader.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+
+from pyubx2 import (
+    ERR_IGNORE,
+    ERR_RAISE,
+    UBX_PROTOCOL,
+    UBXReader,
+    parse_file_parallel,
+    split_frames,
+)
+from pyubx2.exceptions import UBXParseError
+from pyubx2.ubxparallel import (
+    _parse_range,
+    file_boundaries,
+    find_boundary,
+    verify_frame,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+LOGS = (
+    "pygpsdata-MIXED-RTCM3.log",
+    "pygpsdata-MIXED.log",
+    "pygpsdata-BADHDR.log",
+)
+
+
+def identity(_, parsed):  # picklable function applied by worker
+    return getattr(parsed, "identity", None)
+
+
+def readlog(filename: str, **kwargs) -> list:
+    with open(filename, "rb") as stream:
+        return [(raw, str(parsed)) for raw, parsed in UBXReader(stream, **kwargs)]
+
+
+class ParallelTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testPARALLEL(self):  # parallel output must match sequential reads
+        for log in LOGS:
+            filename = os.path.join(DIRNAME, log)
+            expected = readlog(filename, quitonerror=ERR_IGNORE)
+            res = [
+                (raw, str(parsed))
+                for raw, parsed in parse_file_parallel(
+                    filename, workers=2, chunksize=500, quitonerror=ERR_IGNORE
+                )
+            ]
+            self.assertEqual(res, expected, log)
+
+    def testPARALLELFUNC(self):  # results of function applied by workers
+        filename = os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log")
+        with open(filename, "rb") as stream:
+            expected = [
+                parsed.identity
+                for _, parsed in UBXReader(stream, protfilter=UBX_PROTOCOL)
+            ]
+        res = list(
+            parse_file_parallel(
+                filename,
+                workers=2,
+                chunksize=100,
+                func=identity,
+                protfilter=UBX_PROTOCOL,
+            )
+        )
+        self.assertEqual(res, expected)
+        self.assertEqual(
+            _parse_range(
+                filename,
+                0,
+                os.path.getsize(filename),
+                identity,
+                {"protfilter": UBX_PROTOCOL},
+            ),
+            expected,
+        )
+        self.assertEqual(
+            [
+                (raw, str(parsed))
+                for raw, parsed in _parse_range(
+                    filename, 0, os.path.getsize(filename), None, {}
+                )
+            ],
+            readlog(filename),
+        )
+
+    def testPARALLELRAISE(self):  # errors raised by workers
+        filename = os.path.join(DIRNAME, "pygpsdata-BADHDR.log")
+        with self.assertRaises(UBXParseError):
+            list(parse_file_parallel(filename, workers=1, quitonerror=ERR_RAISE))
+
+    def testPARALLELCLOSE(self):  # consumer stops early
+        filename = os.path.join(DIRNAME, "pygpsdata-MIXED.log")
+        gen = parse_file_parallel(filename, workers=1, chunksize=100)
+        raw, _ = next(gen)
+        gen.close()
+        self.assertEqual(raw, readlog(filename)[0][0])
+
+    def testBOUNDARIES(self):  # ranges start at verified message boundaries
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            data = stream.read()
+        raws = [raw for raw, _ in UBXReader(BytesIO(data))]
+        starts = set()
+        offset = 0
+        for raw in raws:
+            starts.add(offset)
+            offset += len(raw)
+        for chunksize in (1, 50, 333):
+            bounds = file_boundaries(BytesIO(data), chunksize)
+            self.assertEqual(bounds[0], 0)
+            self.assertEqual(bounds[-1], len(data))
+            self.assertTrue(set(bounds[:-1]) <= starts)
+            self.assertEqual(bounds, sorted(set(bounds)))
+        self.assertEqual(file_boundaries(BytesIO(data), len(data)), [0, len(data)])
+
+    def testFINDBOUNDARY(self):  # spurious headers are not message boundaries
+        ubx = b"\xb5\x62\x05\x01\x02\x00\x06\x01\x0f\x38"
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            rtcm = [raw for raw, _ in UBXReader(stream) if raw[0] == 0xD3][0]
+        for valid in (ubx, nmea, rtcm):
+            for prefix in (
+                b"",
+                b"\x00\xb5\x62\x05\x01\x02\x00\x06\x01\x0f\x39",  # bad UBX checksum
+                b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*69\r\n",  # bad NMEA checksum
+                b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A\r\n",  # no NMEA checksum
+                rtcm[:-1] + b"\x00",  # bad RTCM3 CRC
+                b"$G" + b"x" * 5000,  # unterminated NMEA
+                b"\xb5\x01\xd3\xff" * 20000,  # invalid headers
+            ):
+                self.assertEqual(find_boundary(BytesIO(prefix + valid), 0), len(prefix))
+        self.assertEqual(find_boundary(BytesIO(b"\x00" * 70000 + b"\xb5"), 5), 70001)
+        self.assertIsNone(verify_frame(ubx[:9], 0))
+        self.assertIsNone(verify_frame(rtcm[:2], 0))
+        self.assertIsNone(verify_frame(rtcm[:-1], 0))
+        self.assertIsNone(verify_frame(ubx[:4], 0))
+        self.assertIsNone(verify_frame(nmea[:-1], 0))
+        # NMEA checksum is validated as it is by split_frames()
+        for nmea in (b"$GNRMC,,V,,,,,,,,,,N*4D\r\n", b"$GNRMC,,V,,,,,,,,,,N*4d\r\n"):
+            self.assertTrue(verify_frame(nmea, 0))
+            self.assertEqual(list(split_frames(nmea)), [(1, 0, len(nmea), True)])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
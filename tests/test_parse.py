@@ -11,7 +11,8 @@ Created on 3 Oct 2020
 
 import unittest
 
-from pyubx2 import UBXMessage, UBXReader, VALCKSUM, VALNONE, SET, SETPOLL
+from pyubx2 import UBXMessage, UBXReader, VALCKSUM, VALNONE, SET, SETPOLL, POLL
+from pyubx2.exceptions import UBXMessageError, UBXParseError
 
 
 class ParseTest(unittest.TestCase):
@@ -63,7 +64,8 @@ class ParseTest(unittest.TestCase):
         )
 
     def testAckCkF(self):
-        UBXReader.parse(self.ack_ack_badck, validate=VALNONE)
+        res = UBXReader.parse(self.ack_ack_badck, validate=VALNONE)
+        self.assertEqual(res.serialize(), self.ack_ack)  # calculated checksum
 
     def testCfg(self):
         res = UBXReader.parse(self.ack_ack)
@@ -293,6 +295,111 @@ class ParseTest(unittest.TestCase):
             "<UBX(ESF-STATUS, iTOW=23:59:42, version=2, wtInitStatus=0, mntAlgStatus=1, insInitStatus=1, imuInitStatus=2, reserved0=0, fusionMode=0, reserved1=0, numSens=6, type_01=5, used_01=0, ready_01=1, calibStatus_01=0, timeStatus_01=1, freq_01=0, badMeas_01=0, badTTag_01=0, missingMeas_01=0, noisyMeas_01=0, type_02=13, used_02=0, ready_02=0, calibStatus_02=0, timeStatus_02=1, freq_02=10, badMeas_02=0, badTTag_02=0, missingMeas_02=0, noisyMeas_02=0, type_03=14, used_03=0, ready_03=1, calibStatus_03=0, timeStatus_03=1, freq_03=10, badMeas_03=0, badTTag_03=0, missingMeas_03=0, noisyMeas_03=0, type_04=0, used_04=0, ready_04=0, calibStatus_04=0, timeStatus_04=1, freq_04=10, badMeas_04=0, badTTag_04=0, missingMeas_04=0, noisyMeas_04=0, type_05=1, used_05=0, ready_05=0, calibStatus_05=0, timeStatus_05=0, freq_05=10, badMeas_05=0, badTTag_05=0, missingMeas_05=0, noisyMeas_05=0, type_06=18, used_06=0, ready_06=1, calibStatus_06=0, timeStatus_06=1, freq_06=0, badMeas_06=0, badTTag_06=0, missingMeas_06=0, noisyMeas_06=0)>",
         )
 
+    def testPARSEMANY(self):  # batch parse must match individual parse
+        frames = [
+            val
+            for name, val in vars(self).items()
+            if isinstance(val, bytes) and val and name != "ack_ack_badck"
+        ]
+        frames += frames  # decoders reused within batch
+        for mode in (0, SET):
+            (res, errors) = UBXReader.parse_many(frames, msgmode=mode)
+            for frame, msg in zip(frames, res):
+                try:
+                    expected = UBXReader.parse(frame, msgmode=mode)
+                except (UBXMessageError, UBXParseError) as err:
+                    self.assertIn(
+                        (frames.index(frame), str(err)),
+                        [(i, str(e)) for i, e in errors],
+                    )
+                    self.assertIsNone(msg)
+                    continue
+                self.assertIs(type(msg), UBXMessage)
+                self.assertEqual(
+                    list(msg.__dict__.items()), list(expected.__dict__.items())
+                )
+                self.assertEqual(msg.serialize(), frame)
+
+    def testPARSEMANYBUFFER(self):  # batch parse from single buffer and offsets
+        frames = [
+            self.nav_velned,
+            self.cfg_msg,
+            self.ack_ack_badck,
+            self.cfg_prt,
+            self.esf_meas,
+        ]
+        buf = b"".join(frames)
+        offsets = [sum(len(frm) for frm in frames[:i]) for i in range(len(frames))]
+        for data in (buf, memoryview(buf)):
+            (res, errors) = UBXReader.parse_many(data, offsets=offsets)
+            self.assertEqual(
+                [str(msg) for msg in res],
+                [
+                    str(UBXReader.parse(frm)) if frm != self.ack_ack_badck else "None"
+                    for frm in frames
+                ],
+            )
+            self.assertEqual([i for i, _ in errors], [2])
+            self.assertEqual(
+                str(errors[0][1]),
+                "Message checksum b'\\x0f7' invalid - should be b'\\x0f8'",
+            )
+
+    def testPARSEMANYERRORS(self):  # errors collected rather than raised
+        frames = [
+            self.ack_ack,
+            self.ack_ack_badck,
+            b"\xb5c" + self.ack_ack[2:],
+            self.ack_ack[:-3] + self.ack_ack[-2:],
+            b"\xb5b\x01\xff\x02\x00\x06\x01\x09\x16",
+        ]
+        (res, errors) = UBXReader.parse_many(frames)
+        self.assertEqual(str(res[0]), "<UBX(ACK-ACK, clsID=CFG, msgID=CFG-MSG)>")
+        self.assertEqual(str(res[4]), "<UBX(NAV-01ff-NOMINAL, payload=b'\\x06\\x01')>")
+        self.assertEqual(res[1:4], [None, None, None])
+        self.assertEqual(
+            [(i, str(err)) for i, err in errors],
+            [
+                (1, "Message checksum b'\\x0f7' invalid - should be b'\\x0f8'"),
+                (2, "Invalid message header b'\\xb5c' - should be b'\\xb5b'"),
+                (3, "Invalid payload length b'\\x02\\x00' - should be b'\\x01\\x00'"),
+            ],
+        )
+        (res, errors) = UBXReader.parse_many(frames[1:2], validate=VALNONE)
+        self.assertEqual(
+            (str(res[0]), errors), ("<UBX(ACK-ACK, clsID=CFG, msgID=CFG-MSG)>", [])
+        )
+        self.assertEqual(res[0].serialize(), frames[0])  # calculated checksum
+        (res, errors) = UBXReader.parse_many(
+            [self.cfg_msg], msgmode=SET, parsebitfield=False
+        )
+        self.assertEqual(
+            str(res[0]),
+            str(UBXReader.parse(self.cfg_msg, msgmode=SET, parsebitfield=False)),
+        )
+        (res, errors) = UBXReader.parse_many([self.nav_velned], msgmode=SET)
+        self.assertEqual(res, [None])
+        self.assertIn("Unknown message type", str(errors[0][1]))
+        with self.assertRaisesRegex(UBXParseError, "Invalid message mode 4"):
+            UBXReader.parse_many(frames, msgmode=4)
+
+    def testPARSEMANYSETPOLL(self):  # auto detection of SET or POLL mode
+        frames = [
+            UBXMessage.config_poll(0, 0, ["CFG_UART1_BAUDRATE"]).serialize(),
+            UBXMessage.config_set(0, 0, [("CFG_UART1_BAUDRATE", 9600)]).serialize(),
+            UBXMessage(
+                "CFG", "CFG-MSG", SET, msgClass=0xF0, msgID=0x05, rateUART1=1
+            ).serialize(),
+            UBXMessage("CFG", "CFG-MSG", POLL, msgClass=0xF0, msgID=0x05).serialize(),
+        ]
+        (res, errors) = UBXReader.parse_many(frames, msgmode=SETPOLL)
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            [str(msg) for msg in res],
+            [str(UBXReader.parse(frm, msgmode=SETPOLL)) for frm in frames],
+        )
+        self.assertEqual([msg.msgmode for msg in res], [POLL, SET, SET, POLL])
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
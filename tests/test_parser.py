@@ -0,0 +1,181 @@
+"""
+Incremental parser tests for pyubx2.UBXParser, using actual
+receiver binary outputs fed in arbitrary sized chunks.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from logging import ERROR
+
+from pyubx2 import (
+    ERR_IGNORE,
+    ERR_LOG,
+    ERR_RAISE,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    SET,
+    UBX_PROTOCOL,
+    UBXParser,
+    UBXReader,
+)
+from pyubx2.exceptions import UBXParseError, UBXStreamError
+from pyubx2.ubxparser import COMPACT
+
+DIRNAME = os.path.dirname(__file__)
+
+LOGS = (
+    "pygpsdata-MIXED-RTCM3.log",
+    "pygpsdata-MIXED3.log",
+    "pygpsdata-NMEA.log",
+    "pygpsdata-RXMRAWX.log",
+    "ucenter-ZEDF9P-configdebug.log",
+)
+
+
+def chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class ParserTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def read_log(self, log: str, **kwargs) -> tuple:
+        with open(os.path.join(DIRNAME, log), "rb") as stream:
+            data = stream.read()
+            stream.seek(0)
+            expected = [
+                (raw, str(parsed)) for raw, parsed in UBXReader(stream, **kwargs)
+            ]
+        return data, expected
+
+    def testFEEDCHUNKS(self):  # output must match UBXReader for any chunk size
+        for log in LOGS:
+            data, expected = self.read_log(log)
+            self.assertTrue(len(expected) > 0)
+            for size in (1, 7, 64, 4096, len(data)):
+                ubp = UBXParser()
+                res = []
+                for chunk in chunks(data, size):
+                    res += [(raw, str(parsed)) for raw, parsed in ubp.feed(chunk)]
+                self.assertEqual(res, expected, f"{log} chunk size {size}")
+                self.assertEqual(ubp.buffer, b"")
+
+    def testFEEDCOMPACT(self):  # buffer appended in place, processed data discarded
+        data, expected = self.read_log("pygpsdata-RXMRAWX.log")
+        data, expected = data * 20, expected * 20
+        self.assertTrue(len(data) > COMPACT * 2)
+        ubp = UBXParser()
+        buf = ubp._buffer
+        res = []
+        for chunk in chunks(data, 64):
+            res += [(raw, str(parsed)) for raw, parsed in ubp.feed(chunk)]
+            self.assertIs(ubp._buffer, buf)
+            self.assertLess(len(buf), COMPACT + 4096)
+        self.assertEqual(res, expected)
+
+    def testFEEDPROTFILTER(self):  # protocol filter
+        for prot in (NMEA_PROTOCOL, UBX_PROTOCOL, RTCM3_PROTOCOL):
+            data, expected = self.read_log("pygpsdata-MIXED-RTCM3.log", protfilter=prot)
+            ubp = UBXParser(protfilter=prot)
+            res = []
+            for chunk in chunks(data, 33):
+                res += [(raw, str(parsed)) for raw, parsed in ubp.feed(chunk)]
+            self.assertEqual(res, expected)
+
+    def testFEEDNOPARSE(self):  # raw data only
+        data, expected = self.read_log("pygpsdata-MIXED-RTCM3.log")
+        ubp = UBXParser(parsing=False)
+        res = list(ubp.feed(data))
+        self.assertEqual([raw for raw, _ in res], [raw for raw, _ in expected])
+        self.assertEqual({parsed for _, parsed in res}, {None})
+
+    def testFEEDPARTIAL(self):  # incomplete message retained until next feed
+        msg = b"\xb5b\x05\x01\x02\x00\x06\x01\x0f\x38"
+        ubp = UBXParser()
+        self.assertEqual(list(ubp.feed(b"\x00\x01" + msg[:3])), [])
+        self.assertEqual(ubp.buffer, msg[:3])
+        res = list(ubp.feed(msg[3:] + b"$GNGLL"))
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0][0], msg)
+        self.assertEqual(str(res[0][1]), "<UBX(ACK-ACK, clsID=CFG, msgID=CFG-MSG)>")
+        self.assertEqual(ubp.buffer, b"$GNGLL")
+
+    def testFEEDSET(self):  # input message mode
+        msg = b"\xb5b\x06\x01\x03\x00\xf0\x01\x01\xfc\x12"
+        ubp = UBXParser(msgmode=SET)
+        raw, parsed = next(ubp.feed(msg))
+        self.assertEqual(raw, msg)
+        self.assertEqual(
+            str(parsed),
+            "<UBX(CFG-MSG, msgClass=NMEA-Standard, msgID=GLL, rateDDC=1, rateUART1=0, rateUART2=0, rateUSB=0, rateSPI=0, reserved=0)>",
+        )
+
+    def testBADMODE(self):  # invalid msgmode
+        EXPECTED_ERROR = "Invalid stream mode 4 - must be 0, 1, 2 or 3"
+        with self.assertRaisesRegex(UBXStreamError, EXPECTED_ERROR):
+            UBXParser(msgmode=4)
+
+    def testBADHDR_FAIL(self):  # invalid header, parser remains usable
+        data, expected = self.read_log("pygpsdata-BADHDR.log", quitonerror=ERR_IGNORE)
+        ubp = UBXParser(quitonerror=ERR_RAISE)
+        res = []
+        with self.assertRaisesRegex(
+            UBXParseError, "Unknown protocol header b'\\\\xb5w'"
+        ):
+            for raw, parsed in ubp.feed(data):
+                res.append((raw, str(parsed)))
+        res += [(raw, str(parsed)) for raw, parsed in ubp.feed(b"")]
+        self.assertEqual(res, expected)
+
+    def testBADHDR_LOG(self):  # invalid header with quitonerror = 1
+        data, _ = self.read_log("pygpsdata-BADHDR.log", quitonerror=ERR_IGNORE)
+        with self.assertLogs(level=ERROR) as log:
+            res = list(UBXParser(quitonerror=ERR_LOG).feed(data))
+            self.assertEqual(
+                ["ERROR:pyubx2.ubxparser:Unknown protocol header b'\\xb5w'."],
+                log.output,
+            )
+        self.assertEqual(len(res), 2)
+
+    def testBADHDR_HANDLER(self):  # invalid header with error handler
+        errs = []
+        data, _ = self.read_log("pygpsdata-BADHDR.log", quitonerror=ERR_IGNORE)
+        ubp = UBXParser(quitonerror=ERR_LOG, errorhandler=errs.append)
+        self.assertEqual(len(list(ubp.feed(data))), 2)
+        self.assertEqual(str(errs[0]), "Unknown protocol header b'\\xb5w'.")
+
+    def testBADCK(self):  # invalid checksum ignored
+        data, expected = self.read_log(
+            "pygpsdata-MIXED3BADCK.log", quitonerror=ERR_IGNORE
+        )
+        ubp = UBXParser(quitonerror=ERR_IGNORE)
+        res = [(raw, str(parsed)) for raw, parsed in ubp.feed(data)]
+        self.assertEqual(res, expected)
+
+    def testCLOSE(self):  # incomplete message discarded on close
+        ubp = UBXParser(quitonerror=ERR_RAISE)
+        self.assertEqual(list(ubp.feed(b"\xd3\x00\x13\x3e\xd7")), [])
+        with self.assertRaisesRegex(
+            UBXStreamError, "5 bytes of incomplete message discarded"
+        ):
+            ubp.close()
+        self.assertEqual(ubp.buffer, b"")
+        ubp.close()  # nothing to discard
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
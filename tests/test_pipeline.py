@@ -0,0 +1,170 @@
+"""
+Shared memory pipeline tests for pyubx2.UBXPipeline.
+
+Compares messages parsed by the pipeline worker processes with those
+read sequentially by UBXReader.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+from multiprocessing import Queue
+from multiprocessing.shared_memory import SharedMemory
+
+from pyubx2 import (
+    ERR_LOG,
+    ERR_RAISE,
+    FILTER_EXCLUDE,
+    FILTER_RAW,
+    UBXPipeline,
+    UBXReader,
+)
+from pyubx2.exceptions import UBXParseError, UBXStreamError
+from pyubx2.ubxpipeline import MAXFRAME, _parse_worker
+from tests.helpers import SlowStream, expected, readlog
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testPIPELINE(self):  # pipeline output must match sequential reads
+        for log in ("pygpsdata-MIXED-RTCM3.log", "pygpsdata-NMEA.log"):
+            data = readlog(log)
+            with UBXPipeline(BytesIO(data), workers=2) as pipe:
+                res = [(raw, str(parsed)) for raw, parsed in pipe]
+            self.assertEqual(res, expected(data), log)
+
+    def testPIPELINEWRAP(self):  # stream larger than ring buffer
+        data = readlog("pygpsdata-MIXED.log") * 4
+        pipe = UBXPipeline(BytesIO(data), workers=2, buffersize=MAXFRAME)
+        res = [(raw, str(parsed)) for raw, parsed in pipe]
+        pipe.close()
+        self.assertEqual(res, expected(data))
+        self.assertEqual(len(res), 1232)
+
+    def testPIPELINESLOW(self):  # blocking stream
+        data = readlog("pygpsdata-NAV.log")
+        with UBXPipeline(SlowStream(data), workers=1) as pipe:
+            res = [(raw, str(parsed)) for raw, parsed in pipe]
+        self.assertEqual(res, expected(data))
+
+    def testPIPELINEFILTER(self):  # framer message filter
+        data = readlog("pygpsdata-MIXED3.log")
+        kwargs = {
+            "msgfilter": ("NAV-PVT", "NAV-SVINFO"),
+            "msgfiltermode": FILTER_EXCLUDE,
+        }
+        with UBXPipeline(BytesIO(data), workers=1, **kwargs) as pipe:
+            res = [(raw, str(parsed)) for raw, parsed in pipe]
+            self.assertEqual(pipe.read(), (None, None))
+        self.assertEqual(res, expected(data, **kwargs))
+
+    def testPIPELINEERRORS(self):  # parsing errors returned from workers
+        data = readlog("pygpsdata-MIXED3BADCK.log")
+        errs = []
+        with UBXPipeline(
+            BytesIO(data), workers=2, quitonerror=ERR_LOG, errorhandler=errs.append
+        ) as pipe:
+            res = [(raw, str(parsed)) for raw, parsed in pipe]
+        experrs = []
+        self.assertEqual(
+            res,
+            expected(data, quitonerror=ERR_LOG, errorhandler=experrs.append),
+        )
+        self.assertEqual([str(err) for err in errs], [str(err) for err in experrs])
+        self.assertEqual(len(errs), 1)
+        with self.assertLogs("pyubx2.ubxpipeline", "ERROR") as logs:
+            with UBXPipeline(BytesIO(data), quitonerror=ERR_LOG) as pipe:
+                self.assertEqual(len(list(pipe)), len(res))
+        self.assertEqual(len(logs.output), 1)
+        with UBXPipeline(BytesIO(data), quitonerror=ERR_RAISE) as pipe:
+            with self.assertRaisesRegex(UBXParseError, "Message checksum"):
+                for _ in pipe:
+                    pass
+
+    def testPIPELINEFRAMEERROR(self):  # framing errors raised after preceding messages
+        data = readlog("pygpsdata-BADHDR.log")
+        with UBXPipeline(BytesIO(data), workers=1, quitonerror=ERR_RAISE) as pipe:
+            count = 0
+            with self.assertRaisesRegex(UBXParseError, "Unknown protocol header"):
+                for _ in pipe:
+                    count += 1
+            self.assertEqual(pipe.read(), (None, None))
+        self.assertGreater(count, 0)
+
+    def testPIPELINEBAD(self):
+        with self.assertRaisesRegex(UBXStreamError, "Invalid buffer size 4096"):
+            UBXPipeline(BytesIO(b""), buffersize=4096)
+        with self.assertRaisesRegex(UBXStreamError, "FILTER_RAW"):
+            UBXPipeline(BytesIO(b""), msgfiltermode=FILTER_RAW)
+        with self.assertRaisesRegex(UBXStreamError, "Invalid stream mode"):
+            UBXPipeline(BytesIO(b""), msgmode=4)
+        pipe = UBXPipeline(BytesIO(b""))
+        pipe.close()
+        with self.assertRaisesRegex(UBXStreamError, "Pipeline is closed"):
+            pipe.read()
+
+    def testPIPELINECLOSE(self):  # close while framer is waiting for buffer space
+        stream = BytesIO(readlog("pygpsdata-MIXED.log") * 4)
+        pipe = UBXPipeline(stream, workers=1, buffersize=MAXFRAME)
+        self.assertIs(pipe.datastream, stream)
+        self.assertIsNotNone(pipe.read()[1])
+        pipe.close()
+        pipe._framer.join(5)
+        self.assertFalse(pipe._framer.is_alive())
+        self.assertFalse(any(proc.is_alive() for proc in pipe._procs))
+        pipe.close()
+
+    def testPIPELINEWORKER(self):  # worker process terminated
+        data = readlog("pygpsdata-MIXED.log")
+        with UBXPipeline(BytesIO(data), workers=1) as pipe:
+            pipe._procs[0].kill()
+            pipe._procs[0].join()
+            with self.assertRaisesRegex(
+                UBXStreamError, "Pipeline worker terminated unexpectedly"
+            ):
+                for _ in pipe:
+                    pass
+
+    def testPARSEWORKER(self):  # worker parses messages located in shared memory
+        data = readlog("pygpsdata-MIXED3BADCK.log")
+        frames = [raw for raw, _ in UBXReader(BytesIO(data), parsing=False)]
+        shm = SharedMemory(create=True, size=MAXFRAME)
+        try:
+            tasks = Queue()
+            results = Queue()
+            offset = 0
+            for seq, raw in enumerate(frames):
+                shm.buf[offset : offset + len(raw)] = raw
+                tasks.put((seq, offset, len(raw)))
+                offset += len(raw)
+            tasks.put(None)
+            _parse_worker(shm.name, tasks, results, {})
+            res = [results.get(timeout=5) for _ in frames]
+        finally:
+            shm.close()
+            shm.unlink()
+        self.assertEqual([seq for seq, _, _ in res], list(range(len(frames))))
+        self.assertEqual(
+            [str(parsed) for _, parsed, err in res if err is None],
+            [str(parsed) for _, parsed in expected(data, quitonerror=0)],
+        )
+        self.assertEqual(
+            [type(err) for _, _, err in res if err is not None], [UBXParseError]
+        )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
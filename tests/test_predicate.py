@@ -0,0 +1,193 @@
+"""
+Predicate tests for pyubx2.UBXPredicate.
+
+Evaluates predicates against raw and parsed UBX messages.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+from pyubx2 import (
+    ERR_RAISE,
+    FILTER_RAW,
+    GET,
+    POLL,
+    SET,
+    SETPOLL,
+    UBX_PROTOCOL,
+    VALNONE,
+    UBXMessage,
+    UBXPredicate,
+    UBXReader,
+    calc_checksum,
+)
+from pyubx2.exceptions import UBXParseError, UBXStreamError, UBXTypeError
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class PredicateTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED.log"), "rb") as stream:
+            self.data = stream.read()
+        self.msgs = list(UBXReader(BytesIO(self.data), protfilter=UBX_PROTOCOL))
+
+    def tearDown(self):
+        pass
+
+    def testEVALUATE(self):  # conditions on individual attributes
+        (raw, msg) = next(m for m in self.msgs if m[1].identity == "NAV-PVT")
+        for conditions, expected in (
+            ([("fixType", ">=", 3), ("numSV", ">", 10)], True),
+            ([("fixType", ">=", 3), ("numSV", ">", 20)], False),
+            ([("iTOW", "between", (msg.iTOW, msg.iTOW + 1000))], True),
+            ([("iTOW", "between", (msg.iTOW + 1, msg.iTOW + 1000))], False),
+            ([("carrSoln", "in", (1, 2))], False),
+            ([("carrSoln", "!=", 2), ("lat", "<", 90)], True),
+            ([("carrSoln", "==", 0), ("headVeh", "<=", 0)], True),
+            ([("nonexistent", "==", 0)], False),
+            ([], True),
+        ):
+            pred = UBXPredicate(conditions)
+            self.assertEqual(pred.evaluate(msg), expected, conditions)
+            self.assertEqual(pred.evaluate_raw(raw), expected, conditions)
+
+    def testEVALUATEGROUP(self):  # conditions on repeating group attributes
+        (raw, msg) = next(m for m in self.msgs if m[1].identity == "NAV-SAT")
+        for conditions, expected in (
+            ([("gnssId", "==", 6)], True),
+            ([("gnssId", "==", 2)], False),
+            ([("gnssId_01", "==", msg.gnssId_01)], True),
+            ([("svId", "in", (msg.svId_24,)), ("cno", ">", 0)], True),
+        ):
+            pred = UBXPredicate(conditions)
+            self.assertEqual(pred.evaluate(msg), expected, conditions)
+            self.assertEqual(pred.evaluate_raw(raw), expected, conditions)
+
+    def testEVALUATERAWMODE(self):  # input message and invalid payload
+        raw = UBXMessage("CFG", "CFG-RATE", SET, measRate=100, navRate=1).serialize()
+        self.assertTrue(UBXPredicate([("measRate", "==", 100)]).evaluate_raw(raw, SET))
+        raw = b"\xb5b\x06\x84\x0c\x00" + b"\x00" * 14
+        with self.assertRaises(UBXTypeError):
+            UBXPredicate([("seedHi", "==", 0)]).evaluate_raw(raw)
+
+    def testINVALID(self):  # invalid conditions
+        for cond in (("fixType", "=", 3), ("fixType", ">="), 3):
+            with self.assertRaisesRegex(UBXStreamError, "Invalid predicate condition"):
+                UBXPredicate([cond])
+        for name in ("", "_payload", 3):
+            with self.assertRaisesRegex(UBXStreamError, "Invalid predicate attribute"):
+                UBXPredicate([(name, "==", 3)])
+
+    def testREADER(self):  # UBXReader predicate pushdown
+        where = {
+            "NAV-PVT": [("numSV", ">", 13)],
+            b"\x01\x35": UBXPredicate([("gnssId", "==", 2)]),
+        }
+        expected = [
+            (raw, str(msg))
+            for raw, msg in self.msgs
+            if not (
+                (msg.identity == "NAV-PVT" and msg.numSV <= 13)
+                or msg.identity == "NAV-SAT"
+            )
+        ]
+        ubr = UBXReader(BytesIO(self.data), protfilter=UBX_PROTOCOL, where=where)
+        self.assertEqual([(raw, str(msg)) for raw, msg in ubr], expected)
+        ubr = UBXReader(
+            BytesIO(self.data),
+            protfilter=UBX_PROTOCOL,
+            where=where,
+            msgfiltermode=FILTER_RAW,
+        )
+        res = list(ubr)
+        self.assertEqual([raw for raw, _ in res], [raw for raw, _ in self.msgs])
+        self.assertEqual(sum(1 for _, msg in res if msg is None), 32)
+        with open(os.path.join(DIRNAME, "assistnow.log"), "rb") as stream:
+            ubr = UBXReader(
+                stream,
+                msgmode=SETPOLL,
+                where={"MGA-INI-TIME-UTC": [("year", "!=", 2021)]},
+            )
+            res = [msg.identity for _, msg in ubr]
+        self.assertTrue(len(res) > 0)
+        self.assertNotIn("MGA-INI-TIME-UTC", res)
+        with self.assertRaisesRegex(
+            UBXStreamError, "Unknown message identity NAV-XXX in predicate"
+        ):
+            UBXReader(BytesIO(b""), where={"NAV-XXX": [("iTOW", ">", 0)]})
+
+    def testREADERATTRIBUTES(self):  # attribute names checked against definitions
+        valid = (
+            ("NAV-PVT", GET, True, "carrSoln"),
+            ("NAV-PVT", GET, False, "flags"),
+            ("NAV-SAT", GET, True, "gnssId"),
+            ("NAV-SAT", GET, True, "gnssId_01"),
+            ("RXM-PMP", GET, True, "numBytesUserData"),  # payload variant
+            ("CFG-VALGET", GET, True, "CFG_RATE_MEAS"),  # not checked
+            ("MGA-INI-TIME-UTC", SETPOLL, True, "year"),
+            (b"\x01\xff", GET, True, "anything"),  # no payload definition
+        )
+        for msg, mode, pbf, name in valid:
+            UBXReader(
+                BytesIO(b""),
+                msgmode=mode,
+                parsebitfield=pbf,
+                where={msg: [(name, "==", 1)]},
+            )
+        invalid = (
+            ("NAV-PVT", GET, True, "fixtype"),
+            ("NAV-PVT", GET, True, "flags"),
+            ("NAV-PVT", GET, False, "carrSoln"),
+            ("NAV-PVT", GET, True, "numSV_01"),
+            ("NAV-SAT", GET, True, "gnssId_xx"),
+            ("MGA-INI-TIME-UTC", SETPOLL, True, "yaer"),
+        )
+        for msg, mode, pbf, name in invalid:
+            with self.assertRaisesRegex(
+                UBXStreamError, f"Unknown attribute {name} in predicate for {msg}"
+            ):
+                UBXReader(
+                    BytesIO(b""),
+                    msgmode=mode,
+                    parsebitfield=pbf,
+                    where={msg: [(name, "==", 1)]},
+                )
+
+    def testREADERPASSTHROUGH(self):  # messages on which predicate cannot be evaluated
+        where = {"NAV-PVT": [("numSV", ">", 99)], "CFG-FIXSEED": [("seedHi", "==", 0)]}
+        poll = UBXMessage("NAV", "NAV-PVT", POLL).serialize()
+        res = list(UBXReader(BytesIO(poll), msgmode=POLL, where=where))
+        self.assertEqual(
+            [(raw, str(msg)) for raw, msg in res], [(poll, "<UBX(NAV-PVT)>")]
+        )
+        pvt = next(raw for raw, msg in self.msgs if msg.identity == "NAV-PVT")
+        self.assertEqual(list(UBXReader(BytesIO(pvt), where=where)), [])
+        corrupt = pvt[:-1] + bytes([pvt[-1] ^ 0xFF])
+        self.assertEqual(
+            list(UBXReader(BytesIO(corrupt), where=where, validate=VALNONE)), []
+        )
+        ubr = UBXReader(BytesIO(corrupt), where=where, quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UBXParseError, "checksum"):
+            ubr.read()
+        fixseed = UBXMessage(b"\x06", b"\x84", POLL).serialize()[:4]
+        fixseed += b"\x0c\x00" + b"\x00" * 12
+        fixseed += calc_checksum(fixseed[2:])
+        ubr = UBXReader(BytesIO(fixseed), where=where, quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UBXTypeError, "Incorrect type for attribute"):
+            ubr.read()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -11,7 +11,7 @@ Created on 11 May 2022
 
 import unittest
 from socket import socket
-from pyubx2 import UBXReader, UBXMessage, POLL
+from pyubx2 import UBXReader, UBXMessage, POLL, SocketWrapper
 
 
 class DummySocket(socket):
@@ -51,6 +51,11 @@ class DummySocket(socket):
         self._buffer = self._buffer[num:]
         return buff
 
+    def recv_into(self, buffer, nbytes: int = 0) -> int:
+        buff = self.recv(nbytes or len(buffer))
+        buffer[: len(buff)] = buff
+        return len(buff)
+
     def send(self, data: bytes):
         if self._timeout:
             raise TimeoutError
@@ -128,6 +133,32 @@ class SocketTest(unittest.TestCase):
                 break
         self.assertEqual(i, 0)
 
+    def testSocketWrapper(self):  # test reads across buffer boundaries
+        stream = DummySocket()
+        pool = stream._stream
+        sw = SocketWrapper(stream, bufsize=16)
+        self.assertEqual(sw.in_waiting, 16)
+        buff = sw.buffer
+        self.assertIsInstance(buff, bytearray)
+        self.assertEqual(buff, pool[:16])
+        self.assertEqual(sw.read(3), pool[:3])
+        self.assertEqual(sw.read(100), pool[3:103])  # enlarges buffer
+        line = sw.readline()
+        self.assertEqual(line, pool[103 : pool.index(b"\n", 103) + 1])
+        pos = 103 + len(line)
+        for _ in range(200):  # reuses buffer
+            data = sw.read(7)
+            self.assertEqual(data, pool[pos : pos + 7])
+            self.assertIsInstance(data, bytes)
+            pos += 7
+        self.assertEqual(sw.buffer, pool[pos : pos + sw.in_waiting])
+        self.assertEqual(buff, pool[:16])  # copy unaffected by later reads
+
+    def testSocketWrapperError(self):  # test read after simulated timeout
+        sw = SocketWrapper(DummySocket(timeout=True))
+        self.assertEqual(sw.in_waiting, 0)
+        self.assertEqual(sw.read(1), b"")
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -11,11 +11,27 @@ Created on 3 Oct 2020
 # pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
 
 import os
+import sys
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
 import pyubx2.ubxtypes_core as ubt
-from pyubx2 import POLL, SET, UBX_CLASSES, UBXMessage, UBXReader
+from pyubx2 import (
+    GET,
+    POLL,
+    SET,
+    UBX_CLASS_KEYS,
+    UBX_CLASSES,
+    UBX_INT_MSGIDS,
+    UBX_MSGID_INTS,
+    UBX_MSGID_KEYS,
+    UBXMessage,
+    UBXReader,
+    msg_identity,
+    ubxhelpers,
+)
+from pyubx2.exceptions import UBXMessageError
 from pyubx2.ubxhelpers import (
     attsiz,
     att2idx,
@@ -33,11 +49,15 @@ from pyubx2.ubxhelpers import (
     gpsfix2str,
     hextable,
     isvalid_checksum,
+    isvalid_checksums,
+    isvalid_frame,
     itow2utc,
     key_from_val,
+    locate_frame,
     msgstr2bytes,
     process_monver,
     protocol,
+    split_frames,
     utc2itow,
     val2bytes,
     val2sphp,
@@ -154,6 +174,31 @@ class StaticTest(unittest.TestCase):
         res = key_from_val(UBX_CLASSES, "MON")
         self.assertEqual(res, (b"\x0A"))
 
+    def testRegistry(self):  # indexes must agree with linear key_from_val scans
+        for name in set(ubt.UBX_MSGIDS.values()):
+            key = key_from_val(ubt.UBX_MSGIDS, name)
+            self.assertEqual(UBX_MSGID_KEYS[name], key)
+            self.assertEqual(UBX_MSGID_INTS[name], int.from_bytes(key, "big"))
+            self.assertEqual(UBX_INT_MSGIDS[UBX_MSGID_INTS[name]], name)
+        for name in UBX_CLASSES.values():
+            self.assertEqual(UBX_CLASS_KEYS[name], key_from_val(UBX_CLASSES, name))
+        self.assertEqual(UBX_MSGID_KEYS["CFG-MSG"], b"\x06\x01")
+        self.assertEqual(UBX_MSGID_INTS["MGA-GPS-EPH"], 0x130001)
+        self.assertEqual(UBX_INT_MSGIDS[0x0107], "NAV-PVT")
+        self.assertEqual(msg_identity(b"\x01", b"\x07"), "NAV-PVT")
+        self.assertEqual(msg_identity(b"\x13", b"\x00", b"\x01\x00"), "MGA-GPS-EPH")
+        self.assertEqual(msg_identity(b"\x13", b"\x80", b"\x01\x00"), "MGA-DBD")
+        self.assertEqual(msg_identity(b"\x13", b"\x00", b"\xff"), "MGA-1300-NOMINAL")
+        self.assertEqual(msg_identity(b"\x13", b"\x00"), "MGA-1300-NOMINAL")
+        self.assertEqual(msg_identity(b"\x01", b"\xff"), "NAV-01ff-NOMINAL")
+        self.assertEqual(msg_identity(b"\xff", b"\x01"), "UNKNOWN-ff01-NOMINAL")
+        with self.assertRaisesRegex(
+            UBXMessageError, "Undefined message, class CFG, id XXX"
+        ):
+            msgstr2bytes("CFG", "XXX")
+        msg = UBXMessage("CFG", "CFG-MSG", POLL, msgClass=1, msgID=7)
+        self.assertEqual(msg.__dict__["_identity"], "CFG-MSG")  # resolved once
+
     def testCalcChecksum(self):
         res = calc_checksum(b"\x06\x01\x02\x00\xf0\x05")
         self.assertEqual(res, b"\xfe\x16")
@@ -166,6 +211,38 @@ class StaticTest(unittest.TestCase):
         res = isvalid_checksum(b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x15")
         self.assertFalse(res)
 
+    def testCalcChecksumLarge(self):  # with and without numpy
+        content = bytes(i * 7 & 0xFF for i in range(3000))
+        check_a = check_b = 0
+        for char in content:
+            check_a = (check_a + char) & 0xFF
+            check_b = (check_b + check_a) & 0xFF
+        for np in {ubxhelpers._numpy(), None}:
+            with patch.object(ubxhelpers, "_NUMPY", [np]):
+                for data in (content, bytearray(content), memoryview(content)):
+                    self.assertEqual(calc_checksum(data), bytes((check_a, check_b)))
+
+    def testisvalid_checksums(self):  # with and without numpy
+        buf = bytearray(b"\x00")
+        offsets = []
+        for i in range(6):
+            offsets.append(len(buf))
+            payload = bytes(j * i & 0xFF for j in range(i * 400))
+            buf += UBXMessage(0x01, 0x07, GET, payload=payload).serialize() + b"\xb5"
+        buf[offsets[2] + 100] ^= 0x01  # bad checksum
+        buf += b"\xb5b\x01\x07\x10\x00\x01"  # incomplete
+        offsets = offsets[::-1] + [len(buf) - 7, len(buf) - 3, -1, 0, len(buf) + 5]
+        expected = [True, True, True, False, True, True, False, False, False, False, False]
+        for np in {ubxhelpers._numpy(), None}:
+            for span in (1, 500, 1 << 20):
+                with patch.object(ubxhelpers, "_NUMPY", [np]), patch.object(
+                    ubxhelpers, "CKSUM_SPAN", span
+                ):
+                    self.assertEqual(isvalid_checksums(buf, offsets), expected)
+                    self.assertEqual(isvalid_checksums(bytes(buf), []), [])
+        with patch.object(ubxhelpers, "_NUMPY", []), patch.dict(sys.modules, {"numpy": None}):
+            self.assertIsNone(ubxhelpers._numpy())  # numpy not installed
+
     def testitow2utc(self):
         res = str(itow2utc(387092000))
         self.assertEqual(res, "11:31:14")
@@ -254,6 +331,80 @@ class StaticTest(unittest.TestCase):
         res = protocol(b"aPiLeOfGarBage")
         self.assertEqual(res, 0)
 
+    def testsplit_frames(self):  # test split_frames() method
+        ubx = b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x16"
+        ubxbad = b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x17"
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        nmeabad = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*69\r\n"
+        nmeanock = b"$PGRMM,WGS84\r\n"
+        rtcm = b"\xd3\x00\x04L\xe0\x00\x80\xed\xed\xd6"
+        rtcmbad = b"\xd3\x00\x04L\xe0\x00\x80\xed\xed\xd7"
+        frames = (ubx, b"\xb5\xb5\xd3\xff$X", nmea, rtcm, ubxbad, b"garbage", nmeabad, rtcmbad, nmeanock)
+        buf = b"".join(frames)
+        expected = []
+        for frm, prot, valid in (
+            (ubx, ubt.UBX_PROTOCOL, True),
+            (nmea, ubt.NMEA_PROTOCOL, True),
+            (rtcm, ubt.RTCM3_PROTOCOL, True),
+            (ubxbad, ubt.UBX_PROTOCOL, False),
+            (nmeabad, ubt.NMEA_PROTOCOL, False),
+            (rtcmbad, ubt.RTCM3_PROTOCOL, False),
+            (nmeanock, ubt.NMEA_PROTOCOL, False),
+        ):
+            expected.append((prot, buf.index(frm), len(frm), valid))
+        for data in (buf, bytearray(buf), memoryview(buf)):
+            self.assertEqual(list(split_frames(data)), expected)
+        self.assertEqual(
+            list(split_frames(buf, validate=ubt.VALNONE)),
+            [(prot, offset, length, None) for prot, offset, length, _ in expected],
+        )
+        buf = ubx + nmea + rtcm
+        frames = [(2, 0, 10, True), (1, 10, 52, True), (4, 62, 10, True)]
+        self.assertEqual(list(split_frames(buf)), frames)
+        for i in range(len(buf)):  # incomplete frames
+            res = list(split_frames(buf[0:i]))
+            self.assertEqual(res, [frm for frm in frames if frm[1] + frm[2] <= i])
+        self.assertEqual(list(split_frames(b"")), [])
+        self.assertEqual(list(split_frames(b"garbage\xd3")), [])
+        nmea = b"$GNRMC,,V,,,,,,,,,,N*4d\r\n"  # lower case checksum
+        self.assertEqual(list(split_frames(nmea)), [(1, 0, len(nmea), True)])
+        buf = b"$GNRMC" + b"," * ubt.NMEA_MAXLEN + nmea  # unterminated NMEA header
+        res = list(split_frames(buf))
+        self.assertEqual(res, [(1, buf.index(nmea), len(nmea), True)])
+
+    def testlocate_frame(self):  # test locate_frame() method
+        ubx = b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x16"
+        nmea = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        rtcm = b"\xd3\x00\x04L\xe0\x00\x80\xed\xed\xd6"
+        buf = b"\xb5" + ubx + nmea + rtcm
+        for data in (buf, bytearray(buf), memoryview(buf)):
+            self.assertEqual(locate_frame(data, 0), (0, 2))
+            self.assertEqual(locate_frame(data, 1), (ubt.UBX_PROTOCOL, 11))
+            self.assertEqual(locate_frame(data, 11), (ubt.NMEA_PROTOCOL, 63))
+            self.assertEqual(locate_frame(data, 63), (ubt.RTCM3_PROTOCOL, 73))
+            self.assertEqual(locate_frame(data, 72), None)
+        for frm in (ubx, nmea, rtcm):
+            for i in range(len(frm)):
+                self.assertEqual(locate_frame(frm[0:i], 0), None)
+        buf = b"$GNRMC" + b"," * ubt.NMEA_MAXLEN + b"\r\n"
+        self.assertEqual(locate_frame(buf[0 : ubt.NMEA_MAXLEN - 1], 0), None)
+        self.assertEqual(locate_frame(buf, 0), (0, 2))
+
+    def testisvalid_frame(self):  # test isvalid_frame() method
+        for frm, prot, valid in (
+            (b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x16", ubt.UBX_PROTOCOL, True),
+            (b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x17", ubt.UBX_PROTOCOL, False),
+            (b"$GNRMC,,V,,,,,,,,,,N*4D\r\n", ubt.NMEA_PROTOCOL, True),
+            (b"$GNRMC,,V,,,,,,,,,,N*4d\r\n", ubt.NMEA_PROTOCOL, True),
+            (b"$GNRMC,,V,,,,,,,,,,N*4E\r\n", ubt.NMEA_PROTOCOL, False),
+            (b"$PGRMM,WGS84\r\n", ubt.NMEA_PROTOCOL, False),
+            (b"\xd3\x00\x04L\xe0\x00\x80\xed\xed\xd6", ubt.RTCM3_PROTOCOL, True),
+            (b"\xd3\x00\x04L\xe0\x00\x80\xed\xed\xd7", ubt.RTCM3_PROTOCOL, False),
+        ):
+            buf = b"garbage" + frm
+            for data in (buf, bytearray(buf), memoryview(buf)):
+                self.assertEqual(isvalid_frame(data, 7, len(buf), prot), valid)
+
     def testhextable(self):  # test hextable*( method)
         EXPECTED_RESULT = "000: 2447 4e47 4c4c 2c35 3332 372e 3034 3331  | b'$GNGLL,5327.0431' |\n016: 392c 532c 3030 3231 342e 3431 3339 362c  | b'9,S,00214.41396,' |\n032: 452c 3232 3332 3332 2e30 302c 412c 412a  | b'E,223232.00,A,A*' |\n048: 3638 0d0a                                | b'68\\r\\n' |\n"
         res = hextable(b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n", 8)
@@ -326,6 +477,10 @@ class StaticTest(unittest.TestCase):
             ).serialize()
         )
         self.assertEqual(res, SET)
+        cfgprt = b"\xb5\x62\x06\x00\x01\x00\x01\x08\x22"  # CFG-PRT portID=1
+        self.assertEqual(getinputmode(cfgprt), SET)
+        res = UBXReader.parse(cfgprt, msgmode=ubt.SETPOLL)
+        self.assertEqual(res.msgmode, SET)
 
     def testprocess_monver(self):
         MONVER = b"\xb5\x62\x0a\x04\xdc\x00\x45\x58\x54\x20\x43\x4f\x52\x45\x20\x31\x2e\x30\x30\x20\x28\x66\x31\x37\x30\x36\x37\x29\x00\x00\x00\x00\x00\x00\x00\x00\x30\x30\x31\x39\x30\x30\x30\x30\x00\x00\x52\x4f\x4d\x20\x42\x41\x53\x45\x20\x30\x78\x31\x31\x38\x42\x32\x30\x36\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x46\x57\x56\x45\x52\x3d\x48\x50\x47\x20\x31\x2e\x35\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50\x52\x4f\x54\x56\x45\x52\x3d\x32\x37\x2e\x35\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x4d\x4f\x44\x3d\x5a\x45\x44\x2d\x46\x39\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x47\x50\x53\x3b\x47\x4c\x4f\x3b\x47\x41\x4c\x3b\x42\x44\x53\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x53\x42\x41\x53\x3b\x51\x5a\x53\x53\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xce\x8b"
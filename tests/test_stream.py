@@ -10,10 +10,12 @@ Created on 3 Oct 2020
 
 # pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
 
+import mmap
 import sys
 import os
+import tempfile
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 from logging import ERROR
 
 from pyubx2 import (
@@ -24,9 +26,12 @@ from pyubx2 import (
     ERR_RAISE,
     ERR_LOG,
     ERR_IGNORE,
+    FILTER_EXCLUDE,
+    FILTER_INCLUDE,
+    FILTER_RAW,
 )
 from pyrtcm.exceptions import RTCMParseError
-from pyubx2.exceptions import UBXParseError
+from pyubx2.exceptions import UBXParseError, UBXStreamError
 import pyubx2.ubxtypes_core as ubt
 
 DIRNAME = os.path.dirname(__file__)
@@ -685,6 +690,186 @@ class StreamTest(unittest.TestCase):
                     self.assertEqual(res, EXPECTED_RESULTS[1])
             self.assertEqual(i, 188)
 
+    def testREADAHEAD(self):  # test read-ahead with different stream types
+        class PlainStream:  # no read-ahead
+            def __init__(self, data):
+                self._stream = BytesIO(data)
+
+            def read(self, n):
+                return self._stream.read(n)
+
+            def readline(self):
+                return self._stream.readline()
+
+        class WaitingStream(PlainStream):  # read-ahead up to in_waiting
+            @property
+            def in_waiting(self):
+                return 5
+
+        for log in ("pygpsdata-MIXED-RTCM3.log", "pygpsdata-BADHDR.log"):
+            with open(os.path.join(DIRNAME, log), "rb") as stream:
+                data = stream.read()
+                stream.seek(0)
+                expected = [(raw, str(parsed)) for raw, parsed in UBXReader(stream)]
+            self.assertTrue(len(expected) > 0)
+            for stream in (PlainStream(data), WaitingStream(data)):
+                ubr = UBXReader(stream)
+                self.assertEqual([(raw, str(parsed)) for raw, parsed in ubr], expected)
+
+    def testMSGFILTER(self):  # test message filter on UBX message types
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            data = stream.read()
+        expected = [(raw, str(parsed)) for raw, parsed in UBXReader(BytesIO(data))]
+        wanted = ("NAV-PVT", "NAV-SAT")
+        for msgfilter in (wanted, {b"\x01\x07", b"\x01\x35"}, ["NAV-PVT", b"\x01\x35"]):
+            ubr = UBXReader(BytesIO(data), msgfilter=msgfilter)
+            res = [(raw, str(parsed)) for raw, parsed in ubr]
+            self.assertEqual(
+                res,
+                [
+                    (raw, parsed)
+                    for raw, parsed in expected
+                    if raw[0:1] != b"\xb5" or parsed[5:12] in wanted
+                ],
+            )
+        ubr = UBXReader(BytesIO(data), msgfilter=wanted, msgfiltermode=FILTER_EXCLUDE)
+        res = [(raw, str(parsed)) for raw, parsed in ubr]
+        self.assertEqual(
+            res,
+            [(raw, parsed) for raw, parsed in expected if parsed[5:12] not in wanted],
+        )
+        ubr = UBXReader(
+            BytesIO(data),
+            msgfilter=wanted,
+            msgfiltermode=FILTER_INCLUDE | FILTER_RAW,
+        )
+        res = [(raw, str(parsed)) for raw, parsed in ubr]
+        self.assertEqual([raw for raw, _ in res], [raw for raw, _ in expected])
+        self.assertEqual(
+            [parsed for _, parsed in res],
+            [
+                "None" if raw[0:1] == b"\xb5" and parsed[5:12] not in wanted else parsed
+                for raw, parsed in expected
+            ],
+        )
+
+    def testMSGFILTERMGA(self):  # test message filter on MGA message types
+        with open(os.path.join(DIRNAME, "assistnow.log"), "rb") as stream:
+            data = stream.read()
+        ubr = UBXReader(
+            BytesIO(data),
+            msgmode=ubt.SET,
+            msgfilter=["MGA-INI-TIME-UTC"],
+            msgfiltermode=FILTER_RAW,
+        )
+        res = [parsed.identity for _, parsed in ubr if parsed is not None]
+        self.assertEqual(res, ["MGA-INI-TIME-UTC"])
+
+    def testMSGFILTERBAD(self):  # test invalid message filter
+        with self.assertRaisesRegex(
+            UBXStreamError, "Unknown message identity NAV-XXX in message filter"
+        ):
+            UBXReader(BytesIO(b""), msgfilter=["NAV-XXX"])
+        with self.assertRaisesRegex(
+            UBXStreamError, "Invalid message type 263 in message filter"
+        ):
+            UBXReader(BytesIO(b""), msgfilter=[263])
+
+    def testFIELDS(self):  # test field projection
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            data = stream.read()
+        expected = [parsed for _, parsed in UBXReader(BytesIO(data))]
+        fields = {
+            "NAV-PVT": ["iTOW", "lat", "lon", "hMSL", "fixType"],
+            b"\x01\x35": ["numSvs"],
+        }
+        ubr = UBXReader(BytesIO(data), fields=fields)
+        res = [parsed for _, parsed in ubr]
+        self.assertEqual(len(res), len(expected))
+        i = 0
+        for msg, exp in zip(res, expected):
+            if exp.identity in ("NAV-PVT", "NAV-SAT"):
+                names = fields.get(exp.identity, fields[b"\x01\x35"])
+                self.assertEqual(
+                    [(att, val) for att, val in msg.__dict__.items() if att[0] != "_"],
+                    [(att, getattr(exp, att)) for att in names],
+                )
+                i += 1
+            else:
+                self.assertEqual(str(msg), str(exp))
+        self.assertTrue(i > 0)
+        with self.assertRaisesRegex(
+            UBXStreamError, "Unknown message identity NAV-XXX in field projection"
+        ):
+            UBXReader(BytesIO(b""), fields={"NAV-XXX": ["iTOW"]})
+
+    def testFIELDSMGA(self):  # test field projection of MGA message type
+        with open(os.path.join(DIRNAME, "assistnow.log"), "rb") as stream:
+            data = stream.read()
+        ubr = UBXReader(
+            BytesIO(data), msgmode=ubt.SET, fields={"MGA-INI-TIME-UTC": ["year"]}
+        )
+        res = [
+            str(parsed) for _, parsed in ubr if parsed.identity == "MGA-INI-TIME-UTC"
+        ]
+        self.assertEqual(res, ["<UBX(MGA-INI-TIME-UTC, year=2021)>"])
+
+    def testMEMORYMAP(self):  # test memory mapped file stream
+        for log in (
+            "pygpsdata-MIXED-RTCM3.log",
+            "pygpsdata-BADEOF1.log",
+            "pygpsdata-NMEABADEND.log",
+        ):
+            filename = os.path.join(DIRNAME, log)
+            with open(filename, "rb") as stream:
+                expected = [
+                    (raw, str(parsed))
+                    for raw, parsed in UBXReader(stream, quitonerror=ERR_IGNORE)
+                ]
+            with open(filename, "rb") as stream:
+                ubr = UBXReader(stream, quitonerror=ERR_IGNORE, memorymap=True)
+                buf = ubr._buffer
+                self.assertIsInstance(buf, mmap.mmap)
+                self.assertEqual(stream.read(), b"")
+                res = [(raw, str(parsed)) for raw, parsed in ubr]
+                self.assertEqual(res, expected)
+                self.assertEqual(ubr._buffer, b"")
+                self.assertTrue(buf.closed)
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            raws = [raw for raw, _ in UBXReader(stream)]
+            stream.seek(len(raws[0]))  # start part way through file
+            ubr = UBXReader(stream, memorymap=True)
+            self.assertEqual([raw for raw, _ in ubr], raws[1:])
+
+    def testMEMORYMAPCLOSE(self):  # test memory map released when reading stops early
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            with UBXReader(stream, memorymap=True) as ubr:
+                buf = ubr._buffer
+                for _ in ubr:
+                    break
+                self.assertFalse(buf.closed)
+            self.assertTrue(buf.closed)
+            self.assertEqual(ubr.read(), (None, None))
+            ubr.close()  # nothing to release
+        with open(os.path.join(DIRNAME, "pygpsdata-BADHDR.log"), "rb") as stream:
+            with self.assertRaises(UBXParseError):
+                with UBXReader(stream, quitonerror=ERR_RAISE, memorymap=True) as ubr:
+                    buf = ubr._buffer
+                    for _ in ubr:
+                        pass
+            self.assertTrue(buf.closed)
+
+    def testMEMORYMAPFALLBACK(self):  # test streams which cannot be memory mapped
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            data = stream.read()
+        ubr = UBXReader(BytesIO(data), memorymap=True)
+        self.assertEqual(ubr._buffer, b"")
+        self.assertEqual(len(list(ubr)), len(list(UBXReader(BytesIO(data)))))
+        with tempfile.TemporaryFile() as stream:  # empty file
+            ubr = UBXReader(stream, memorymap=True)
+            self.assertEqual(ubr._buffer, b"")
+            self.assertEqual(ubr.read(), (None, None))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
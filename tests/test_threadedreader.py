@@ -0,0 +1,147 @@
+"""
+Thread pool parsing tests for pyubx2.ThreadedUBXReader.
+
+Compares messages parsed by the decoding threads with those read
+sequentially by UBXReader.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from io import BytesIO
+
+from pyubx2 import (
+    ERR_LOG,
+    ERR_RAISE,
+    FILTER_EXCLUDE,
+    FILTER_RAW,
+    ThreadedUBXReader,
+)
+from pyubx2.exceptions import UBXParseError, UBXStreamError
+from tests.helpers import SlowStream, expected, readlog
+
+
+class ThreadedReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testTHREADED(self):  # output must match sequential reads
+        for log in (
+            "pygpsdata-MIXED-RTCM3.log",
+            "pygpsdata-NMEA.log",
+            "pygpsdata-MIXED.log",
+        ):
+            data = readlog(log)
+            with ThreadedUBXReader(BytesIO(data), workers=4, queuesize=2) as ubr:
+                res = [(raw, str(parsed)) for raw, parsed in ubr]
+                self.assertEqual(ubr.read(), (None, None))
+            self.assertEqual(res, expected(data), log)
+
+    def testTHREADEDSLOW(self):  # blocking stream
+        data = readlog("pygpsdata-NAV.log")
+        ubr = ThreadedUBXReader(SlowStream(data), workers=2)
+        res = [(raw, str(parsed)) for raw, parsed in ubr]
+        ubr.close()
+        self.assertEqual(res, expected(data))
+
+    def testTHREADEDFILTER(self):  # framer message filter
+        data = readlog("pygpsdata-MIXED3.log")
+        kwargs = {
+            "msgfilter": ("NAV-PVT", "NAV-SVINFO"),
+            "msgfiltermode": FILTER_EXCLUDE,
+        }
+        with ThreadedUBXReader(BytesIO(data), **kwargs) as ubr:
+            res = [(raw, str(parsed)) for raw, parsed in ubr]
+        self.assertEqual(res, expected(data, **kwargs))
+
+    def testTHREADEDERRORS(self):  # parsing errors returned from decoding threads
+        data = readlog("pygpsdata-MIXED3BADCK.log")
+        errs = []
+        with ThreadedUBXReader(
+            BytesIO(data), quitonerror=ERR_LOG, errorhandler=errs.append
+        ) as ubr:
+            res = [(raw, str(parsed)) for raw, parsed in ubr]
+        experrs = []
+        self.assertEqual(
+            res,
+            expected(data, quitonerror=ERR_LOG, errorhandler=experrs.append),
+        )
+        self.assertEqual([str(err) for err in errs], [str(err) for err in experrs])
+        self.assertEqual(len(errs), 1)
+        with self.assertLogs("pyubx2.ubxthreadedreader", "ERROR") as logs:
+            with ThreadedUBXReader(BytesIO(data)) as ubr:
+                self.assertEqual(len(list(ubr)), len(res))
+        self.assertEqual(len(logs.output), 1)
+        with ThreadedUBXReader(BytesIO(data), quitonerror=ERR_RAISE) as ubr:
+            with self.assertRaisesRegex(UBXParseError, "Message checksum"):
+                for _ in ubr:
+                    pass
+
+    def testTHREADEDFRAMEERROR(self):  # framing errors raised after preceding messages
+        data = readlog("pygpsdata-BADHDR.log")
+        with ThreadedUBXReader(BytesIO(data), quitonerror=ERR_RAISE) as ubr:
+            count = 0
+            with self.assertRaisesRegex(UBXParseError, "Unknown protocol header"):
+                for _ in ubr:
+                    count += 1
+            self.assertEqual(ubr.read(), (None, None))
+        self.assertGreater(count, 0)
+
+    def testTHREADEDBAD(self):
+        with self.assertRaisesRegex(UBXStreamError, "FILTER_RAW"):
+            ThreadedUBXReader(BytesIO(b""), msgfiltermode=FILTER_RAW)
+        with self.assertRaisesRegex(UBXStreamError, "Invalid stream mode"):
+            ThreadedUBXReader(BytesIO(b""), msgmode=4)
+        ubr = ThreadedUBXReader(BytesIO(b""))
+        ubr.close()
+        with self.assertRaisesRegex(UBXStreamError, "Reader is closed"):
+            ubr.read()
+
+    def testTHREADEDCLOSE(self):  # close while framer is waiting for queue space
+        stream = BytesIO(readlog("pygpsdata-MIXED.log"))
+        ubr = ThreadedUBXReader(stream, workers=1, queuesize=1)
+        self.assertIs(ubr.datastream, stream)
+        self.assertIsNotNone(ubr.read()[1])
+        time.sleep(0.1)  # framer is now waiting
+        ubr.close()
+        self.assertFalse(ubr._framer.is_alive())
+        self.assertIsNone(ubr._error)
+        ubr.close()  # already closed
+
+    def testTHREADEDCLOSEREAD(self):  # close while consumer is waiting for message
+        ubr = ThreadedUBXReader(SlowStream(readlog("pygpsdata-NAV.log")))
+        ubr.start()
+        res = []
+        consumer = threading.Thread(target=lambda: res.append(ubr.read()))
+        consumer.start()
+        time.sleep(0.05)  # consumer and framer are now waiting
+        ubr.close()
+        consumer.join(5)
+        self.assertEqual(res, [(None, None)])
+        self.assertIsNone(ubr._error)
+
+    def testTHREADEDCANCELLED(self):  # message cancelled by close
+        ubr = ThreadedUBXReader(SlowStream(readlog("pygpsdata-NAV.log")))
+        ubr.start()
+        future = Future()
+        future.cancel()
+        ubr._pending.put((b"", future))
+        self.assertEqual(list(ubr), [])
+        ubr.close()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Thread safety tests for pyubx2.
+
+Hammers the shared payload definition tables, configuration database
+and compiled codec caches from many threads simultaneously, and compares
+the results with those produced by a single thread. A short thread
+switch interval is used to maximise interleaving.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: agent
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import sys
+import threading
+import unittest
+from io import BytesIO
+
+from pyubx2 import (
+    SET,
+    SET_LAYER_RAM,
+    TXN_NONE,
+    UBX_PROTOCOL,
+    ThreadedUBXReader,
+    UBXMessage,
+    UBXReader,
+    cfgkey2name,
+    cfgname2key,
+)
+from pyubx2 import ubxcodec
+from pyubx2.ubxtypes_configdb import UBX_CONFIG_DATABASE
+
+DIRNAME = os.path.dirname(__file__)
+
+THREADS = 8
+ROUNDS = 2
+
+LOGS = (
+    "pygpsdata-MIXED3.log",
+    "pygpsdata-NAVHPPOS.log",
+    "pygpsdata-RXMRAWX.log",
+    "pygpsdata-ESF.log",
+    "ucenter-ZEDF9P-configdebug.log",
+)
+
+
+def read_raw() -> list:
+    raws = []
+    for log in LOGS:
+        with open(os.path.join(DIRNAME, log), "rb") as stream:
+            raws += [
+                raw
+                for raw, _ in UBXReader(stream, protfilter=UBX_PROTOCOL, parsing=False)
+            ]
+    return raws
+
+
+def clear_caches():
+    for cache in (ubxcodec._decoders, ubxcodec._encoders, ubxcodec._accessors):
+        cache.clear()
+
+
+def hammer(func, threads: int = THREADS) -> list:
+    """
+    Run func(thread number) in many threads released simultaneously,
+    returning any exceptions raised.
+    """
+
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run(i):
+        try:
+            barrier.wait()
+            func(i)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            errors.append(err)
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return errors
+
+
+class ThreadSafetyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.raws = read_raw()
+        cls.expected = [str(UBXReader.parse(raw)) for raw in cls.raws]
+
+    def setUp(self):
+        self.maxDiff = None
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.interval)
+
+    def testPARSE(self):  # decoders compiled concurrently on first use
+        def parse(i):
+            raws = self.raws[i:] + self.raws[:i]  # start at different messages
+            expected = self.expected[i:] + self.expected[:i]
+            res = [str(UBXReader.parse(raw)) for raw in raws]
+            if res != expected:
+                raise AssertionError(f"thread {i} parsed output differs")
+
+        for _ in range(ROUNDS):
+            clear_caches()
+            self.assertEqual(hammer(parse), [])
+
+    def testLAZY(self):  # accessors compiled concurrently on first use
+        names = []
+        for raw in self.raws:
+            msg = UBXReader.parse(raw)
+            atts = [att for att in msg.__dict__ if att[0] != "_"]
+            names.append([(att, getattr(msg, att)) for att in atts[0:2] + atts[-2:]])
+
+        def access(i):
+            for raw, atts in zip(self.raws[i:], names[i:]):
+                msg = UBXReader.parse(raw, lazy=True)
+                for name, val in atts:
+                    if getattr(msg, name) != val:
+                        raise AssertionError(f"thread {i} {msg.identity} {name}")
+
+        for _ in range(ROUNDS):
+            clear_caches()
+            self.assertEqual(hammer(access), [])
+
+    def testENCODE(self):  # encoders compiled concurrently on first use
+        kwargs = [
+            ("CFG", "CFG-MSG", {"msgClass": 0xF0, "msgID": 0x05, "rateUART1": 1}),
+            ("CFG", "CFG-RATE", {"measRate": 200, "navRate": 1, "timeRef": 1}),
+            ("CFG", "CFG-PRT", {"portID": 1, "baudRate": 115200, "inUBX": 1}),
+            ("CFG", "CFG-NAV5", {"dynModel": 4, "fixMode": 3}),
+            ("CFG", "CFG-TMODE3", {"rcvrMode": 1, "svinMinDur": 60}),
+        ]
+        expected = [
+            UBXMessage(cls, msg, SET, **kws).serialize() for cls, msg, kws in kwargs
+        ]
+
+        def encode(i):
+            for _ in range(20):
+                res = [
+                    UBXMessage(cls, msg, SET, **kws).serialize()
+                    for cls, msg, kws in kwargs
+                ]
+                if res != expected:
+                    raise AssertionError(f"thread {i} encoded output differs")
+
+        for _ in range(ROUNDS):
+            clear_caches()
+            self.assertEqual(hammer(encode), [])
+
+    def testCONFIGDB(self):  # shared configuration database lookups
+        names = list(UBX_CONFIG_DATABASE)
+        cfgdata = [(name, 1) for name in names[0:64]]
+        expected = UBXMessage.config_set(SET_LAYER_RAM, TXN_NONE, cfgdata).serialize()
+        keys = {name: cfgkey2name(cfgname2key(name)[0]) for name in names}
+
+        def lookup(i):
+            for name in names[i::THREADS]:
+                if cfgkey2name(cfgname2key(name)[0]) != keys[name]:
+                    raise AssertionError(f"thread {i} {name}")
+            msg = UBXMessage.config_set(SET_LAYER_RAM, TXN_NONE, cfgdata)
+            if msg.serialize() != expected:
+                raise AssertionError(f"thread {i} CFG-VALSET differs")
+            if str(UBXReader.parse(expected, msgmode=SET)) != str(msg):
+                raise AssertionError(f"thread {i} CFG-VALSET parse differs")
+
+        self.assertEqual(hammer(lookup), [])
+
+    def testSHARED(self):  # immutable messages shared between threads
+        msgs = [UBXReader.parse(raw) for raw in self.raws]
+
+        def share(i):
+            for msg, raw, expected in zip(msgs, self.raws, self.expected):
+                if str(msg) != expected or msg.serialize() != raw:
+                    raise AssertionError(f"thread {i} {msg.identity}")
+                _ = msg.identity, msg.length, msg.payload
+
+        self.assertEqual(hammer(share), [])
+
+    def testREADERS(self):  # many readers on separate streams
+        data = b"".join(self.raws)
+
+        def read(i):
+            res = [str(parsed) for _, parsed in UBXReader(BytesIO(data))]
+            if res != self.expected:
+                raise AssertionError(f"thread {i} reader output differs")
+
+        clear_caches()
+        self.assertEqual(hammer(read, 4), [])
+
+    def testTHREADEDREADER(self):  # many decoding threads, ordered output
+        data = b"".join(self.raws)
+        for _ in range(ROUNDS):
+            clear_caches()
+            with ThreadedUBXReader(BytesIO(data), workers=THREADS) as ubr:
+                res = [str(parsed) for _, parsed in ubr]
+            self.assertEqual(res, self.expected)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()